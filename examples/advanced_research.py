@@ -2,7 +2,7 @@
 
 from dotenv import load_dotenv
 
-from src.ai_research_assistant import ResearchAssistant
+from src.ai_research_assistant import ResearchAssistant, ResearchStore
 
 # Load environment variables
 load_dotenv()
@@ -10,10 +10,12 @@ load_dotenv()
 
 def demonstrate_research_workflow():
     """Demonstrate the complete research workflow with detailed output."""
-    assistant = ResearchAssistant()
+    # Past runs persist across invocations; related questions reuse their findings
+    assistant = ResearchAssistant(research_store=ResearchStore("research_store.db"))
 
     research_questions = [
         "What are the environmental impacts of electric vehicle adoption?",
+        "What are the environmental impacts of electric vehicle batteries?",
         "How does machine learning improve cybersecurity?",
         "What are the latest developments in quantum computing?",
     ]
@@ -33,6 +35,12 @@ def demonstrate_research_workflow():
             print("\n📅 RESEARCH PROCESS COMPLETE")
             print(f"Current Step: {result['current_step']}")
 
+            if result["covered_areas"]:
+                print(
+                    f"\n♻️ Reused {len(result['prior_findings'])} findings from earlier research "
+                    f"covering {len(result['covered_areas'])} areas"
+                )
+
             print("\n📋 RESEARCH PLAN:")
             print("-" * 60)
             print(result["research_plan"])
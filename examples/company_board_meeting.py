@@ -2,7 +2,12 @@
 
 from dotenv import load_dotenv
 
-from src.ai_research_assistant import VirtualCompanySimulator, Decision, CompanyMetrics
+from src.ai_research_assistant import (
+    CompanyMetrics,
+    Decision,
+    VirtualCompanySimulator,
+    render_minute,
+)
 
 # Load environment variables
 load_dotenv()
@@ -64,7 +69,7 @@ def simulate_tech_startup_meeting():
     print("\n📝 MEETING MINUTES:")
     print("=" * 80)
     for minute in result["meeting_minutes"]:
-        print(minute)
+        print(render_minute(minute))
         print("-" * 60)
 
     print(f"\n🎯 FINAL DECISION: {result['final_decision']}")
@@ -128,7 +133,7 @@ def simulate_enterprise_meeting():
     print("\n📝 MEETING MINUTES:")
     print("=" * 80)
     for minute in result["meeting_minutes"]:
-        print(minute)
+        print(render_minute(minute))
         print("-" * 60)
 
     print(f"\n🎯 FINAL DECISION: {result['final_decision']}")
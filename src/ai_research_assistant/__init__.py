@@ -1,20 +1,92 @@
-"""AI Research Assistant and Virtual Company Simulator built with LangGraph."""
-
-from .research_assistant import ResearchAssistant
-from .state import ResearchState
-from .company_simulator import VirtualCompanySimulator
-from .company_state import CompanyState, CompanyMetrics, Decision
-from .executives import CEOExecutive, CTOExecutive, CMOExecutive, CFOExecutive
-
-__all__ = [
-    "ResearchAssistant",
-    "ResearchState",
-    "VirtualCompanySimulator",
-    "CompanyState",
-    "CompanyMetrics",
-    "Decision",
-    "CEOExecutive",
-    "CTOExecutive",
-    "CMOExecutive",
-    "CFOExecutive",
-]
+"""AI Research Assistant and Virtual Company Simulator built with LangGraph.
+
+Submodules are imported on first attribute access, so e.g. importing
+``ResearchAssistant`` does not load the company simulator.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    # Static view of the lazy exports below, for type checkers and IDEs
+    from .batch import BoardMeetingRequest, BoardMeetingResult, RateLimit  # noqa: F401
+    from .company_simulator import VirtualCompanySimulator, render_minute  # noqa: F401
+    from .company_state import CompanyMetrics, CompanyState, Decision, MeetingMinute  # noqa: F401
+    from .evolution import CompanyEvolution, CompanyHistory, EvolutionModel, ScheduledDecision  # noqa: F401
+    from .executives import CEOExecutive, CFOExecutive, CMOExecutive, CTOExecutive  # noqa: F401
+    from .fact_index import FactIndex  # noqa: F401
+    from .fake_llm import FakeChatModel, FakeLLMBackend  # noqa: F401
+    from .instrumentation import Instrumentation, NodeSpan  # noqa: F401
+    from .llm_cache import InMemoryLRUBackend, LLMResponseCache, SQLiteBackend  # noqa: F401
+    from .llm_clients import LLMClientRegistry  # noqa: F401
+    from .portfolio import PortfolioSelection, select_portfolio  # noqa: F401
+    from .research_assistant import ResearchAssistant  # noqa: F401
+    from .research_store import ResearchMemo, ResearchStore  # noqa: F401
+    from .resilience import RetryPolicy  # noqa: F401
+    from .roster import BoardSeat, register_seat  # noqa: F401
+    from .routing import ModelRoute, ModelRouter  # noqa: F401
+    from .state import ResearchState  # noqa: F401
+    from .streaming import StreamEvent  # noqa: F401
+    from .sweep import SweepMemo, SweepPoint, sweep_grid  # noqa: F401
+
+# Public name -> submodule defining it
+_EXPORTS = {
+    "ResearchAssistant": ".research_assistant",
+    "ResearchState": ".state",
+    "VirtualCompanySimulator": ".company_simulator",
+    "render_minute": ".company_simulator",
+    "CompanyState": ".company_state",
+    "CompanyMetrics": ".company_state",
+    "Decision": ".company_state",
+    "MeetingMinute": ".company_state",
+    "CEOExecutive": ".executives",
+    "CTOExecutive": ".executives",
+    "CMOExecutive": ".executives",
+    "CFOExecutive": ".executives",
+    "BoardMeetingRequest": ".batch",
+    "BoardMeetingResult": ".batch",
+    "RateLimit": ".batch",
+    "LLMClientRegistry": ".llm_clients",
+    "FakeChatModel": ".fake_llm",
+    "FakeLLMBackend": ".fake_llm",
+    "InMemoryLRUBackend": ".llm_cache",
+    "LLMResponseCache": ".llm_cache",
+    "SQLiteBackend": ".llm_cache",
+    "StreamEvent": ".streaming",
+    "Instrumentation": ".instrumentation",
+    "NodeSpan": ".instrumentation",
+    "FactIndex": ".fact_index",
+    "ResearchMemo": ".research_store",
+    "ResearchStore": ".research_store",
+    "RetryPolicy": ".resilience",
+    "ModelRoute": ".routing",
+    "ModelRouter": ".routing",
+    "BoardSeat": ".roster",
+    "register_seat": ".roster",
+    "SweepMemo": ".sweep",
+    "SweepPoint": ".sweep",
+    "sweep_grid": ".sweep",
+    "CompanyEvolution": ".evolution",
+    "CompanyHistory": ".evolution",
+    "EvolutionModel": ".evolution",
+    "ScheduledDecision": ".evolution",
+    "PortfolioSelection": ".portfolio",
+    "select_portfolio": ".portfolio",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule defining ``name`` on first access."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the lazily imported public names alongside the module's globals."""
+    return sorted({*globals(), *__all__})
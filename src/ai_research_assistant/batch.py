@@ -0,0 +1,198 @@
+"""Batch scheduling helpers for running many workflows concurrently."""
+
+import asyncio
+import threading
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Generic, TypedDict, TypeVar
+
+from typing_extensions import NotRequired
+
+from .company_state import CompanyMetrics, CompanyState, Decision
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class BoardMeetingRequest(TypedDict):
+    """Arguments for a single board meeting in a batch."""
+
+    company_name: str
+    industry: str
+    company_size: str
+    decision_topic: str
+    decision_details: Decision
+    company_metrics: NotRequired[CompanyMetrics | None]
+    current_quarter: NotRequired[str]
+
+
+class BoardMeetingResult(TypedDict):
+    """Outcome of a single board meeting in a batch."""
+
+    index: int  # Position of the request in the submitted batch
+    request: BoardMeetingRequest
+    state: CompanyState | None
+    error: str | None
+    elapsed_seconds: float
+
+
+@dataclass
+class RateLimit:
+    """Global request and token budget shared by every item of a batch."""
+
+    requests_per_minute: float | None = None
+    tokens_per_minute: float | None = None
+
+
+class RateLimiter:
+    """Token-bucket limiter enforcing a RateLimit across threads and tasks.
+
+    Both buckets start full and refill continuously. Callers reserve an
+    estimate up front and may later settle the difference with the actual
+    usage through ``record_usage``, which can push a bucket into debt.
+    """
+
+    def __init__(self, rate_limit: RateLimit, clock: Callable[[], float] = time.monotonic):
+        """Initialize the limiter with full buckets."""
+        self.rate_limit = rate_limit
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._updated = clock()
+        self._requests = rate_limit.requests_per_minute or 0.0
+        self._tokens = rate_limit.tokens_per_minute or 0.0
+
+    def acquire(self, requests: int = 1, tokens: int = 0) -> None:
+        """Block until the requested budget is available, then consume it."""
+        while (delay := self._try_acquire(requests, tokens)) > 0:
+            time.sleep(delay)
+
+    async def aacquire(self, requests: int = 1, tokens: int = 0) -> None:
+        """Wait without blocking the event loop until the budget is available."""
+        while (delay := self._try_acquire(requests, tokens)) > 0:
+            await asyncio.sleep(delay)
+
+    def record_usage(self, tokens: int = 0, requests: int = 0) -> None:
+        """Debit usage beyond (or credit usage below) the reservation."""
+        with self._lock:
+            self._refill()
+            if self.rate_limit.requests_per_minute is not None:
+                self._requests -= requests
+            if self.rate_limit.tokens_per_minute is not None:
+                self._tokens -= tokens
+
+    def _try_acquire(self, requests: int, tokens: int) -> float:
+        """Consume the budget and return 0, or return seconds to wait."""
+        rpm = self.rate_limit.requests_per_minute
+        tpm = self.rate_limit.tokens_per_minute
+        with self._lock:
+            self._refill()
+            delay = 0.0
+            if rpm is not None:
+                # Never ask for more than a full bucket, or we would wait forever
+                needed = min(requests, rpm)
+                delay = max(delay, (needed - self._requests) * 60.0 / rpm)
+            if tpm is not None:
+                needed = min(tokens, tpm)
+                delay = max(delay, (needed - self._tokens) * 60.0 / tpm)
+            if delay > 0:
+                return delay
+
+            self._requests -= requests
+            self._tokens -= tokens
+            return 0.0
+
+    def _refill(self) -> None:
+        """Top up both buckets for the time elapsed since the last update."""
+        now = self._clock()
+        elapsed_minutes = (now - self._updated) / 60.0
+        self._updated = now
+        if self.rate_limit.requests_per_minute is not None:
+            rpm = self.rate_limit.requests_per_minute
+            self._requests = min(rpm, self._requests + elapsed_minutes * rpm)
+        if self.rate_limit.tokens_per_minute is not None:
+            tpm = self.rate_limit.tokens_per_minute
+            self._tokens = min(tpm, self._tokens + elapsed_minutes * tpm)
+
+
+@dataclass
+class BatchOutcome(Generic[T, R]):
+    """Result of one batch item, keeping failures alongside successes."""
+
+    index: int
+    item: T
+    value: R | None
+    error: BaseException | None
+    elapsed_seconds: float
+
+
+def run_batch(
+    func: Callable[[T], R], items: Iterable[T], max_concurrency: int
+) -> Iterator[BatchOutcome[T, R]]:
+    """Run ``func`` over ``items`` on a thread pool, yielding outcomes as they complete.
+
+    Items are pulled lazily so that at most ``max_concurrency`` are in flight,
+    keeping memory flat for arbitrarily large batches.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+
+    def timed(index: int, item: T) -> BatchOutcome[T, R]:
+        start = time.perf_counter()
+        try:
+            value, error = func(item), None
+        except Exception as e:
+            value, error = None, e
+        return BatchOutcome(index, item, value, error, time.perf_counter() - start)
+
+    pending_items = enumerate(items)
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        in_flight: set[Future[BatchOutcome[T, R]]] = set()
+        for index, item in pending_items:
+            in_flight.add(executor.submit(timed, index, item))
+            if len(in_flight) >= max_concurrency:
+                break
+
+        while in_flight:
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+                next_item = next(pending_items, None)
+                if next_item is not None:
+                    in_flight.add(executor.submit(timed, *next_item))
+
+
+async def arun_batch(
+    func: Callable[[T], Awaitable[R]], items: Iterable[T], max_concurrency: int
+) -> AsyncIterator[BatchOutcome[T, R]]:
+    """Run ``func`` over ``items`` as asyncio tasks, yielding outcomes as they complete."""
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+
+    async def timed(index: int, item: T) -> BatchOutcome[T, R]:
+        start = time.perf_counter()
+        try:
+            value, error = await func(item), None
+        except Exception as e:
+            value, error = None, e
+        return BatchOutcome(index, item, value, error, time.perf_counter() - start)
+
+    pending_items = enumerate(items)
+    in_flight: set[asyncio.Task[BatchOutcome[T, R]]] = set()
+    for index, item in pending_items:
+        in_flight.add(asyncio.create_task(timed(index, item)))
+        if len(in_flight) >= max_concurrency:
+            break
+
+    try:
+        while in_flight:
+            done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+                next_item = next(pending_items, None)
+                if next_item is not None:
+                    in_flight.add(asyncio.create_task(timed(*next_item)))
+    finally:
+        for task in in_flight:
+            task.cancel()
@@ -0,0 +1,298 @@
+"""Offline end-to-end benchmarks for the board meeting and research workflows.
+
+Run with ``python -m src.ai_research_assistant.benchmark``; every LLM call is
+served by ``FakeChatModel`` so no network access or API key is needed.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .batch import BoardMeetingRequest
+from .company_simulator import VirtualCompanySimulator
+from .company_state import CompanyMetrics, Decision
+from .fake_llm import FakeLLMBackend
+from .instrumentation import Instrumentation
+from .llm_clients import LLMClientRegistry
+from .research_assistant import ResearchAssistant
+
+MODES = ("sequential", "concurrent", "batched")
+
+# Measured in a fresh interpreter: importing the workload's class from the
+# package, constructing it, then its first run against the fake backend.
+_COLD_START_SCRIPT = """
+import json, sys, time
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+from {package} import {cls}
+imported = time.perf_counter()
+from {package}.benchmark import sample_meeting_request
+from {package}.fake_llm import FakeLLMBackend
+from {package}.llm_clients import LLMClientRegistry
+registry = LLMClientRegistry(backend=FakeLLMBackend())
+setup = time.perf_counter()
+instance = {cls}(llm_registry=registry)
+constructed = time.perf_counter()
+{run}
+finished = time.perf_counter()
+print(json.dumps([imported - start, constructed - setup, finished - constructed]))
+"""
+_COLD_START_WORKLOADS = {
+    "board_meeting": (
+        "VirtualCompanySimulator",
+        "instance.simulate_board_meeting(**sample_meeting_request())",
+    ),
+    "research": ("ResearchAssistant", "instance.research('Benchmark question')"),
+}
+
+
+@dataclass
+class BenchmarkReport:
+    """Throughput, latency percentiles and per-node timings for one benchmark run."""
+
+    workload: str
+    mode: str
+    runs: int
+    concurrency: int
+    total_seconds: float
+    latencies: list[float] = field(repr=False)
+    node_means: dict[str, float] = field(repr=False)  # Mean wall time per node
+
+    @property
+    def runs_per_second(self) -> float:
+        """Completed workflow runs per second of wall time."""
+        return self.runs / self.total_seconds if self.total_seconds else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Return the q-th percentile (0-100) of per-run latency in seconds."""
+        return percentile(self.latencies, q)
+
+    def format(self) -> str:
+        """Render the report as human-readable text."""
+        lines = [
+            f"{self.workload} / {self.mode} (runs={self.runs}, concurrency={self.concurrency})",
+            f"  throughput: {self.runs_per_second:.2f} runs/s",
+            f"  latency p50={self.percentile(50) * 1000:.1f}ms "
+            f"p95={self.percentile(95) * 1000:.1f}ms p99={self.percentile(99) * 1000:.1f}ms",
+        ]
+        for node, seconds in sorted(self.node_means.items()):
+            lines.append(f"  {node:<28} {seconds * 1000:8.2f}ms")
+        return "\n".join(lines)
+
+
+@dataclass
+class ColdStartReport:
+    """Startup cost of a workflow in a fresh process."""
+
+    workload: str
+    import_seconds: float  # Importing the workflow class from the package
+    construct_seconds: float
+    first_run_seconds: float  # Includes compiling the workflow and creating clients
+
+    @property
+    def total_seconds(self) -> float:
+        """Time from the first import to the end of the first run."""
+        return self.import_seconds + self.construct_seconds + self.first_run_seconds
+
+    def format(self) -> str:
+        """Render the report as human-readable text."""
+        return (
+            f"{self.workload} / cold start: import={self.import_seconds * 1000:.1f}ms "
+            f"construct={self.construct_seconds * 1000:.1f}ms "
+            f"first run={self.first_run_seconds * 1000:.1f}ms "
+            f"total={self.total_seconds * 1000:.1f}ms"
+        )
+
+
+def measure_cold_start(workload: str) -> ColdStartReport:
+    """Measure import, construction and first-run time of a workload in a new interpreter."""
+    if workload not in _COLD_START_WORKLOADS:
+        raise ValueError(f"Unknown cold start workload: {workload}")
+    cls, run = _COLD_START_WORKLOADS[workload]
+    package = __package__ or "src.ai_research_assistant"
+    root = Path(__file__).resolve().parents[len(package.split("."))]
+    script = _COLD_START_SCRIPT.format(root=str(root), package=package, cls=cls, run=run)
+    output = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    ).stdout
+    import_seconds, construct_seconds, first_run_seconds = json.loads(output.splitlines()[-1])
+    return ColdStartReport(workload, import_seconds, construct_seconds, first_run_seconds)
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Nearest-rank percentile of a list of values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, min(len(ordered), math.ceil(q / 100 * len(ordered))))
+    return ordered[rank - 1]
+
+
+def sample_meeting_request(index: int = 0) -> BoardMeetingRequest:
+    """Build a representative board meeting request."""
+    return BoardMeetingRequest(
+        company_name=f"Benchmark Co {index}",
+        industry="SaaS Technology",
+        company_size="startup",
+        decision_topic="AI Customer Support Implementation",
+        decision_details=Decision(
+            title="Implement AI-Powered Customer Support System",
+            description="Deploy an AI chatbot to handle 70% of customer support inquiries.",
+            category="technical",
+            impact_areas=["customer_experience", "operations", "costs"],
+            estimated_cost=150000 + index,
+            expected_roi=0.25,
+            timeline="6 months implementation",
+            risk_level="medium",
+        ),
+        company_metrics=CompanyMetrics(
+            revenue=2500000,
+            expenses=2200000,
+            profit=300000,
+            cash_flow=200000,
+            employee_count=25,
+            customer_satisfaction=8.2,
+            market_share=0.08,
+            tech_debt=6.5,
+            brand_value=7.1,
+        ),
+    )
+
+
+def benchmark_board_meetings(
+    mode: str,
+    runs: int = 20,
+    concurrency: int = 8,
+    registry: LLMClientRegistry | None = None,
+) -> BenchmarkReport:
+    """Benchmark board meetings in sequential, concurrent (asyncio) or batched mode."""
+    registry = registry or LLMClientRegistry(backend=FakeLLMBackend())
+    instrumentation = Instrumentation()
+    simulator = VirtualCompanySimulator(llm_registry=registry, instrumentation=instrumentation)
+    requests = [sample_meeting_request(i) for i in range(runs)]
+    latencies: list[float] = []
+
+    start = time.perf_counter()
+    if mode == "sequential":
+        for request in requests:
+            run_start = time.perf_counter()
+            simulator.simulate_board_meeting(**request)
+            latencies.append(time.perf_counter() - run_start)
+    elif mode == "concurrent":
+        latencies = asyncio.run(_run_concurrent_meetings(simulator, requests, concurrency))
+    elif mode == "batched":
+        for result in simulator.simulate_board_meetings_batch(requests, concurrency):
+            latencies.append(result["elapsed_seconds"])
+    else:
+        raise ValueError(f"Unknown benchmark mode: {mode}")
+    total = time.perf_counter() - start
+
+    return BenchmarkReport(
+        "board_meeting",
+        mode,
+        runs,
+        concurrency,
+        total,
+        latencies,
+        instrumentation.node_means("board_meeting"),
+    )
+
+
+def benchmark_research(
+    mode: str,
+    runs: int = 20,
+    concurrency: int = 8,
+    registry: LLMClientRegistry | None = None,
+) -> BenchmarkReport:
+    """Benchmark research runs sequentially or concurrently (asyncio)."""
+    registry = registry or LLMClientRegistry(backend=FakeLLMBackend())
+    instrumentation = Instrumentation()
+    assistant = ResearchAssistant(llm_registry=registry, instrumentation=instrumentation)
+    questions = [f"Benchmark question {i}" for i in range(runs)]
+    latencies: list[float] = []
+
+    start = time.perf_counter()
+    if mode == "sequential":
+        for question in questions:
+            run_start = time.perf_counter()
+            assistant.research(question)
+            latencies.append(time.perf_counter() - run_start)
+    elif mode == "concurrent":
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(question: str) -> float:
+            async with semaphore:
+                run_start = time.perf_counter()
+                await assistant.aresearch(question)
+                return time.perf_counter() - run_start
+
+        async def run_all() -> list[float]:
+            return list(await asyncio.gather(*(run(q) for q in questions)))
+
+        latencies = asyncio.run(run_all())
+    else:
+        raise ValueError(f"Unknown benchmark mode for research: {mode}")
+    total = time.perf_counter() - start
+
+    return BenchmarkReport(
+        "research",
+        mode,
+        runs,
+        concurrency,
+        total,
+        latencies,
+        instrumentation.node_means("research"),
+    )
+
+
+async def _run_concurrent_meetings(
+    simulator: VirtualCompanySimulator,
+    requests: list[BoardMeetingRequest],
+    concurrency: int,
+) -> list[float]:
+    """Run meetings as asyncio tasks bounded by a semaphore, returning latencies."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(request: BoardMeetingRequest) -> float:
+        async with semaphore:
+            run_start = time.perf_counter()
+            await simulator.asimulate_board_meeting(**request)
+            return time.perf_counter() - run_start
+
+    return list(await asyncio.gather(*(run(request) for request in requests)))
+
+
+def main() -> None:
+    """Run the benchmark suite from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.05, help="Median LLM latency (s)")
+    parser.add_argument("--latency-sigma", type=float, default=0.3)
+    parser.add_argument("--modes", nargs="+", default=list(MODES), choices=MODES)
+    parser.add_argument(
+        "--cold-start", action="store_true", help="Also measure startup in fresh processes"
+    )
+    args = parser.parse_args()
+
+    if args.cold_start:
+        for workload in _COLD_START_WORKLOADS:
+            print(measure_cold_start(workload).format())
+
+    backend = FakeLLMBackend(latency_seconds=args.latency, latency_sigma=args.latency_sigma)
+    for mode in args.modes:
+        registry = LLMClientRegistry(backend=backend)
+        print(benchmark_board_meetings(mode, args.runs, args.concurrency, registry).format())
+    for mode in [m for m in args.modes if m != "batched"]:
+        registry = LLMClientRegistry(backend=backend)
+        print(benchmark_research(mode, args.runs, args.concurrency, registry).format())
+
+
+if __name__ == "__main__":
+    main()
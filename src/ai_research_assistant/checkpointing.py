@@ -0,0 +1,151 @@
+"""Checkpointing support for resumable research and board-meeting runs."""
+
+import asyncio
+import sqlite3
+import uuid
+from collections.abc import AsyncIterator, Iterator
+from pathlib import Path
+from typing import Any
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.types import StateSnapshot
+
+# A ready-made saver, "memory" for an in-process saver, or a SQLite file path
+CheckpointerSpec = BaseCheckpointSaver | str | Path | None
+
+
+def create_checkpointer(spec: CheckpointerSpec) -> BaseCheckpointSaver | None:
+    """Create a checkpoint saver from a user-facing specification.
+
+    Args:
+        spec: ``None`` disables checkpointing, ``"memory"`` keeps checkpoints in
+            process, any other string or path is used as a SQLite database file
+            (requires the ``langgraph-checkpoint-sqlite`` package), and a saver
+            instance is used as is.
+    """
+    if spec is None or isinstance(spec, BaseCheckpointSaver):
+        return spec
+    if spec == "memory":
+        return InMemorySaver()
+    return _sqlite_saver(Path(spec))
+
+
+def _sqlite_saver(path: Path) -> BaseCheckpointSaver:
+    """Create a SQLite saver usable from both sync and async workflow runs."""
+    try:
+        from langgraph.checkpoint.sqlite import SqliteSaver
+    except ImportError as e:
+        raise ImportError(
+            "SQLite checkpoints require the 'langgraph-checkpoint-sqlite' package. "
+            "Install it with: uv sync --extra sqlite"
+        ) from e
+
+    class ThreadedSqliteSaver(SqliteSaver):
+        """SqliteSaver serving the async API by running sync calls in a worker thread."""
+
+        async def aget_tuple(self, config: RunnableConfig) -> Any:
+            return await asyncio.to_thread(self.get_tuple, config)
+
+        async def alist(self, config: RunnableConfig | None, **kwargs: Any) -> AsyncIterator[Any]:
+            for item in await asyncio.to_thread(lambda: list(self.list(config, **kwargs))):
+                yield item
+
+        async def aput(self, config: RunnableConfig, *args: Any, **kwargs: Any) -> RunnableConfig:
+            return await asyncio.to_thread(self.put, config, *args, **kwargs)
+
+        async def aput_writes(self, config: RunnableConfig, *args: Any, **kwargs: Any) -> None:
+            await asyncio.to_thread(self.put_writes, config, *args, **kwargs)
+
+        async def adelete_thread(self, thread_id: str) -> None:
+            await asyncio.to_thread(self.delete_thread, thread_id)
+
+    # The saver serializes access with its own lock, so sharing across threads is safe
+    return ThreadedSqliteSaver(sqlite3.connect(str(path), check_same_thread=False))
+
+
+def run_config(
+    checkpointer: BaseCheckpointSaver | None,
+    thread_id: str | None,
+    config: RunnableConfig | None = None,
+) -> RunnableConfig:
+    """Build the run configuration, adding a thread id when checkpointing is enabled."""
+    merged = RunnableConfig(**(config or {}))
+    if checkpointer is not None:
+        configurable = dict(merged.get("configurable", {}))
+        configurable.setdefault("thread_id", thread_id or uuid.uuid4().hex)
+        merged["configurable"] = configurable
+    return merged
+
+
+def invoke_resumable(workflow: Any, initial_state: Any, config: RunnableConfig) -> Any:
+    """Run a workflow, resuming the thread in ``config`` from its last good checkpoint.
+
+    A thread that already completed successfully returns its stored result.
+    A thread that crashed mid-run or finished with ``error_message`` is
+    resumed from the most recent checkpoint that still had pending nodes and
+    no error, i.e. from the start of the step that failed. Earlier steps are
+    not repeated, but the whole failed step is: nodes record their errors in
+    state rather than raising, so parallel branches that succeeded alongside
+    the failed one (e.g. the other executives' opinions) run again.
+    """
+    if workflow.checkpointer is None:
+        return workflow.invoke(initial_state, config)
+
+    snapshot = workflow.get_state(config)
+    if not snapshot.values:
+        return workflow.invoke(initial_state, config)
+    if _is_complete(snapshot):
+        return snapshot.values
+
+    resumable = _first_resumable(workflow.get_state_history(config))
+    if resumable is None:
+        return workflow.invoke(initial_state, config)
+    return workflow.invoke(None, _with_checkpoint(config, resumable))
+
+
+async def ainvoke_resumable(workflow: Any, initial_state: Any, config: RunnableConfig) -> Any:
+    """Async counterpart of ``invoke_resumable``."""
+    if workflow.checkpointer is None:
+        return await workflow.ainvoke(initial_state, config)
+
+    snapshot = await workflow.aget_state(config)
+    if not snapshot.values:
+        return await workflow.ainvoke(initial_state, config)
+    if _is_complete(snapshot):
+        return snapshot.values
+
+    resumable = None
+    async for candidate in workflow.aget_state_history(config):
+        if _is_resumable(candidate):
+            resumable = candidate
+            break
+    if resumable is None:
+        return await workflow.ainvoke(initial_state, config)
+    return await workflow.ainvoke(None, _with_checkpoint(config, resumable))
+
+
+def _is_complete(snapshot: StateSnapshot) -> bool:
+    """Check whether a thread reached the end without an error."""
+    return not snapshot.next and not snapshot.values.get("error_message")
+
+
+def _is_resumable(snapshot: StateSnapshot) -> bool:
+    """Check whether a checkpoint still had work to do and no error recorded."""
+    return bool(snapshot.next) and not snapshot.values.get("error_message")
+
+
+def _first_resumable(history: Iterator[StateSnapshot]) -> StateSnapshot | None:
+    """Return the newest resumable checkpoint from a history iterator."""
+    return next((snapshot for snapshot in history if _is_resumable(snapshot)), None)
+
+
+def _with_checkpoint(config: RunnableConfig, snapshot: StateSnapshot) -> RunnableConfig:
+    """Point a run configuration at a specific checkpoint."""
+    return RunnableConfig(
+        **{
+            **config,
+            "configurable": {**config.get("configurable", {}), **snapshot.config["configurable"]},
+        }
+    )
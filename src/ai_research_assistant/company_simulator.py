@@ -1,64 +1,246 @@
 """Virtual Company Simulator with AI Executive Board Meetings."""
 
 import os
-from typing import Any, cast
+from collections import defaultdict
+from collections.abc import AsyncIterator, Iterable, Iterator, Sequence
+from functools import cached_property, partial
+from typing import TYPE_CHECKING, Any, ClassVar, cast
 
-from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_openai import ChatOpenAI
+from langchain_core.callbacks import UsageMetadataCallbackHandler
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import BaseMessage
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph import END, StateGraph
-from pydantic import SecretStr
 
-from .company_state import CompanyState, CompanyMetrics, Decision
-from .executives import CEOExecutive, CTOExecutive, CMOExecutive, CFOExecutive
+from .batch import (
+    BatchOutcome,
+    BoardMeetingRequest,
+    BoardMeetingResult,
+    RateLimit,
+    RateLimiter,
+    arun_batch,
+    run_batch,
+)
+from .checkpointing import (
+    CheckpointerSpec,
+    ainvoke_resumable,
+    create_checkpointer,
+    invoke_resumable,
+    run_config,
+)
+from .company_state import (
+    CompanyMetrics,
+    CompanyState,
+    Decision,
+    ExecutiveOpinion,
+    MeetingMinute,
+)
+from .executives import AIExecutive, executive_class
+from .instrumentation import Instrumentation, with_callback
+from .llm_clients import LLMClientRegistry, get_default_registry
+from .portfolio import PortfolioSelection, select_portfolio
+from .prompts import PromptTokens, board_context_inputs, facilitator_messages, prompt_tokens
+from .resilience import RetryPolicy, acall_with_retry, call_with_retry, route_on_error
+from .roster import BoardSeat, get_seat, resolve_roster
+from .routing import ESCALATED_TIER, FAST_TIER, STANDARD_TIER, ModelRouter
+from .streaming import StreamEvent, astream_workflow, stream_workflow
+from .sweep import SweepMemo, SweepPoint, sweep_memo, sweep_requests, with_sweep_memo
+from .workflow_cache import WorkflowCache, bind_workflow, owner_node, owner_route
+
+if TYPE_CHECKING:
+    from .evolution import CompanyHistory, EvolutionModel, ScheduledDecision
+
+# Icon and heading used when rendering each kind of meeting minute
+MINUTE_HEADINGS = {
+    "presentation": ("📊", "DECISION PRESENTATION"),
+    "opinion": ("🗣️", "OPINION"),
+    "discussion": ("💬", "EXECUTIVE SUMMARY"),
+    "vote": ("🗳️", "VOTING RESULTS"),
+    "plan": ("📋", "IMPLEMENTATION PLAN"),
+    "outcome": ("📋", "DECISION OUTCOME"),
+}
+
+# Quarter of meetings that do not say when they take place
+DEFAULT_QUARTER = "Q1 2024"
+
+# Metrics of meetings that do not provide any
+DEFAULT_COMPANY_METRICS = CompanyMetrics(
+    revenue=1000000,
+    expenses=800000,
+    profit=200000,
+    cash_flow=150000,
+    employee_count=50,
+    customer_satisfaction=7.5,
+    market_share=0.15,
+    tech_debt=4.0,
+    brand_value=6.5,
+)
 
 
 class VirtualCompanySimulator:
     """Virtual company simulator with AI executive board meetings."""
 
-    def __init__(self, openai_api_key: str | None = None):
-        """Initialize the company simulator."""
+    _workflows: ClassVar[WorkflowCache] = WorkflowCache()
+
+    def __init__(
+        self,
+        openai_api_key: str | None = None,
+        llm_registry: LLMClientRegistry | None = None,
+        checkpointer: CheckpointerSpec = None,
+        instrumentation: Instrumentation | None = None,
+        max_deliberation_rounds: int = 0,
+        retry_policy: RetryPolicy | None = None,
+        node_retry_policies: dict[str, RetryPolicy] | None = None,
+        model_router: ModelRouter | None = None,
+        roster: Iterable[BoardSeat | str] | None = None,
+        opinion_samples: int = 1,
+    ):
+        """Initialize the company simulator.
+
+        Args:
+            openai_api_key: OpenAI API key. If not provided, will use OPENAI_API_KEY env var.
+            llm_registry: Registry providing shared chat models. Defaults to the
+                process-wide registry.
+            checkpointer: Optional checkpoint storage ("memory", a SQLite file path or
+                a saver instance) making meetings resumable by thread id.
+            instrumentation: Optional aggregator; when set, every run records a
+                per-node trace returned on the final state under ``trace``.
+            max_deliberation_rounds: Extra discussion rounds in which executives see
+                each other's positions and may revise their vote. Rounds stop early
+                once the vote is unanimous or no executive changed their vote.
+            retry_policy: Retries, backoff, timeout and hedging applied to LLM calls.
+            node_retry_policies: Policies overriding ``retry_policy`` per node name,
+                e.g. hedged requests for ``collect_cfo_opinion``.
+            model_router: Model, temperature and max_tokens per executive role and
+                for ``create_implementation_plan``; with fast routes, easy
+                decisions are first put to faster models.
+            roster: Board members as seats or registered role names, in speaking
+                order. Defaults to the CEO, CTO, CMO and CFO. Every member is
+                consulted concurrently, and is also available as an attribute
+                named after their seat, e.g. ``simulator.cfo``.
+            opinion_samples: Completions sampled per executive opinion. Above 1,
+                each executive's samples are requested in a single call and the
+                vote is tallied from their vote distributions, weighting every
+                member equally.
+
+        Chat models and the workflow are created on first use; call
+        ``warm_up`` to create them up front.
+        """
+        self.llm_registry = llm_registry or get_default_registry()
         self.api_key = openai_api_key or os.getenv("OPENAI_API_KEY")
-        if not self.api_key:
+        if not self.api_key and self.llm_registry.backend.requires_api_key:
             raise ValueError("OpenAI API key is required")
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.node_retry_policies = node_retry_policies or {}
+        self.model_router = model_router or ModelRouter()
+        self.opinion_samples = opinion_samples
+
+        self.roster = resolve_roster(roster)
+        self.executives = {seat.role: self._create_executive(seat) for seat in self.roster}
+
+        self.checkpointer = create_checkpointer(checkpointer)
+        self.instrumentation = instrumentation
+        self.max_deliberation_rounds = max_deliberation_rounds
+
+    def __getattr__(self, name: str) -> AIExecutive:
+        """Return the executive of the seat ``name``, e.g. ``simulator.cfo``."""
+        executives = self.__dict__.get("executives", {})
+        if name.upper() in executives and name.islower():
+            return cast(AIExecutive, executives[name.upper()])
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    @property
+    def llm_calls_per_meeting(self) -> int:
+        """Most LLM requests a meeting can make.
+
+        Every board member is asked once per round, including the deliberation
+        rounds and the round repeated when a fast-tier meeting escalates, and
+        a sampled opinion takes one request per sample on models without
+        ``n``. The implementation plan adds one more.
+        """
+        rounds = 1 + self.max_deliberation_rounds + (1 if self.model_router.fast_routes else 0)
+        opinions = sum(executive.requests_per_opinion for executive in self.executives.values())
+        return rounds * opinions + 1
 
-        # Initialize executives
-        self.ceo = CEOExecutive(self.api_key)
-        self.cto = CTOExecutive(self.api_key)
-        self.cmo = CMOExecutive(self.api_key)
-        self.cfo = CFOExecutive(self.api_key)
-
-        # Initialize facilitator LLM for meeting management
-        self.facilitator = ChatOpenAI(
-            model="gpt-4o-mini",
-            api_key=SecretStr(self.api_key) if self.api_key else None,
-            temperature=0.3,
+    @cached_property
+    def facilitator(self) -> BaseChatModel:
+        """Facilitator LLM for meeting management, created on first use."""
+        return self.model_router.route("create_implementation_plan").chat_model(
+            self.llm_registry, self.api_key, 0.3
         )
 
-        self.workflow = self._build_workflow()
+    @cached_property
+    def workflow(self) -> Any:
+        """Compiled meeting workflow, shared with other simulators and bound to this one."""
+        roles = tuple(seat.role for seat in self.roster)
+        graph = self._workflows.get((type(self), roles), partial(type(self)._build_workflow, roles))
+        return bind_workflow(graph, self, self.checkpointer)
 
-    def _build_workflow(self) -> Any:
-        """Build the LangGraph workflow for board meetings."""
+    def warm_up(self) -> None:
+        """Compile the workflow and create every LLM client ahead of the first meeting.
+
+        Long-lived workers can call this at startup so that the first meeting
+        does not pay for graph compilation or client construction.
+        """
+        _ = self.workflow, self.facilitator
+        for executive in self.executives.values():
+            executive.warm_up()
+
+    def _create_executive(self, seat: BoardSeat) -> AIExecutive:
+        """Create the executive of a seat with its retry policy and models."""
+        return executive_class(seat)(
+            self.api_key,
+            self.llm_registry,
+            retry_policy=self._node_policy(_opinion_node(seat.role)),
+            model_route=self.model_router.route(seat.role),
+            fast_route=self.model_router.fast_route(seat.role),
+            seat=seat,
+            samples=self.opinion_samples,
+        )
+
+    @classmethod
+    def _build_workflow(cls, roles: tuple[str, ...]) -> Any:
+        """Build the LangGraph workflow for a board with the given member roles.
+
+        Nodes call the simulator found in the run configuration, so the
+        compiled graph holds no per-instance state and is compiled once per
+        roster and process; see ``workflow_cache``.
+        """
         workflow = StateGraph(CompanyState)
 
-        # Add meeting workflow nodes
-        workflow.add_node("present_decision", self._present_decision)
-        workflow.add_node("collect_ceo_opinion", self._collect_ceo_opinion)
-        workflow.add_node("collect_cto_opinion", self._collect_cto_opinion)
-        workflow.add_node("collect_cmo_opinion", self._collect_cmo_opinion)
-        workflow.add_node("collect_cfo_opinion", self._collect_cfo_opinion)
-        workflow.add_node("facilitate_discussion", self._facilitate_discussion)
-        workflow.add_node("vote_and_decide", self._vote_and_decide)
-        workflow.add_node("create_implementation_plan", self._create_implementation_plan)
-
-        # Define the meeting flow
+        # Add meeting workflow nodes, one opinion node per board member
+        workflow.add_node("present_decision", owner_node("_present_decision"))
+        for role in roles:
+            workflow.add_node(
+                _opinion_node(role), owner_node("_collect_opinion", "_acollect_opinion", role)
+            )
+        workflow.add_node("facilitate_discussion", owner_node("_facilitate_discussion"))
+        workflow.add_node("vote_and_decide", owner_node("_vote_and_decide"))
+        workflow.add_node(
+            "create_implementation_plan",
+            owner_node("_create_implementation_plan", "_acreate_implementation_plan"),
+        )
+
+        # Define the meeting flow: executives are consulted in parallel and
+        # joined at the discussion once every opinion has been collected. The
+        # discussion either sends everyone back for another round or moves on.
+        # Any error ends the meeting instead of running the remaining steps.
+        opinion_nodes = [_opinion_node(role) for role in roles]
         workflow.set_entry_point("present_decision")
-        workflow.add_edge("present_decision", "collect_ceo_opinion")
-        workflow.add_edge("collect_ceo_opinion", "collect_cto_opinion")
-        workflow.add_edge("collect_cto_opinion", "collect_cmo_opinion")
-        workflow.add_edge("collect_cmo_opinion", "collect_cfo_opinion")
-        workflow.add_edge("collect_cfo_opinion", "facilitate_discussion")
-        workflow.add_edge("facilitate_discussion", "vote_and_decide")
-        workflow.add_edge("vote_and_decide", "create_implementation_plan")
+        workflow.add_conditional_edges(
+            "present_decision", owner_route("_route_presentation"), [*opinion_nodes, END]
+        )
+        workflow.add_edge(opinion_nodes, "facilitate_discussion")
+        workflow.add_conditional_edges(
+            "facilitate_discussion",
+            owner_route("_route_discussion"),
+            [*opinion_nodes, "vote_and_decide", END],
+        )
+        workflow.add_conditional_edges(
+            "vote_and_decide",
+            route_on_error("create_implementation_plan"),
+            ["create_implementation_plan", END],
+        )
         workflow.add_edge("create_implementation_plan", END)
 
         return workflow.compile()
@@ -70,158 +252,186 @@ class VirtualCompanySimulator:
             if not decision:
                 return {"error_message": "No decision provided for discussion"}
 
-            presentation = f"""
-            📋 BOARD MEETING - {state["company_name"]}
-            Quarter: {state["current_quarter"]}
-            
-            📊 DECISION PRESENTATION:
-            Title: {decision["title"]}
-            Category: {decision["category"]}
-            Description: {decision["description"]}
-            
-            💰 Financial Impact:
-            - Estimated Cost: ${decision["estimated_cost"]:,}
-            - Expected ROI: {decision["expected_roi"]:.1%}
-            - Risk Level: {decision["risk_level"]}
-            - Timeline: {decision["timeline"]}
-            
-            🎯 Impact Areas: {", ".join(decision["impact_areas"])}
-            """
+            presentation = MeetingMinute(
+                kind="presentation",
+                speaker="Board Facilitator",
+                text=f"{decision['title']}: {decision['description']}",
+                data={
+                    "company": state["company_name"],
+                    "quarter": state["current_quarter"],
+                    "category": decision["category"],
+                    "estimated_cost": f"${decision['estimated_cost']:,}",
+                    "expected_roi": f"{decision['expected_roi']:.1%}",
+                    "risk_level": decision["risk_level"],
+                    "timeline": decision["timeline"],
+                    "impact_areas": ", ".join(decision["impact_areas"]),
+                },
+            )
 
             return {
                 "discussion_phase": "executive_opinions",
                 "current_speaker": "Board Facilitator",
-                "meeting_minutes": [presentation],
+                "meeting_minutes": presentation,
+                "model_tier": self.model_router.tier(decision),
             }
         except Exception as e:
             return {"error_message": f"Error presenting decision: {str(e)}"}
 
-    def _collect_ceo_opinion(self, state: CompanyState) -> dict[str, Any]:
-        """Collect CEO's opinion."""
-        try:
-            opinion = self.ceo.get_opinion(state)
-
-            minute = f"""
-            🔑 CEO OPINION:
-            Opinion: {opinion["opinion"]}
-            Reasoning: {opinion["reasoning"]}
-            Vote: {opinion["vote"].upper()}
-            Priority Score: {opinion["priority_score"]}/10
-            """
-
-            minutes = state.get("meeting_minutes", [])
-            minutes.append(minute)
+    def _route_presentation(self, state: CompanyState) -> str | list[str]:
+        """Consult every executive once the decision has been presented."""
+        if state.get("error_message"):
+            return END
+        return self._opinion_nodes()
 
-            return {"ceo_opinion": opinion, "current_speaker": "CEO", "meeting_minutes": minutes}
-        except Exception as e:
-            return {"error_message": f"Error collecting CEO opinion: {str(e)}"}
+    def _opinion_nodes(self) -> list[str]:
+        """Names of the opinion nodes of every board member."""
+        return [_opinion_node(seat.role) for seat in self.roster]
 
-    def _collect_cto_opinion(self, state: CompanyState) -> dict[str, Any]:
-        """Collect CTO's opinion."""
+    def _collect_opinion(
+        self, role: str, state: CompanyState, config: RunnableConfig
+    ) -> dict[str, Any]:
+        """Collect an executive's opinion, reusing it in sweeps when its inputs are unchanged."""
         try:
-            opinion = self.cto.get_opinion(state)
-
-            minute = f"""
-            💻 CTO OPINION:
-            Opinion: {opinion["opinion"]}
-            Reasoning: {opinion["reasoning"]}
-            Vote: {opinion["vote"].upper()}
-            Priority Score: {opinion["priority_score"]}/10
-            """
-
-            minutes = state.get("meeting_minutes", [])
-            minutes.append(minute)
-
-            return {"cto_opinion": opinion, "current_speaker": "CTO", "meeting_minutes": minutes}
+            executive = self._executive(role)
+            memo = sweep_memo(config)
+            if memo is None:
+                opinion = executive.get_opinion(state)
+            else:
+                opinion = memo.get_or_compute(
+                    _opinion_node(role),
+                    executive.dependencies(state),
+                    lambda: executive.get_opinion(state),
+                )
+            return self._opinion_update(role, opinion)
         except Exception as e:
-            return {"error_message": f"Error collecting CTO opinion: {str(e)}"}
+            return {"error_message": f"Error collecting {role} opinion: {str(e)}"}
 
-    def _collect_cmo_opinion(self, state: CompanyState) -> dict[str, Any]:
-        """Collect CMO's opinion."""
+    async def _acollect_opinion(
+        self, role: str, state: CompanyState, config: RunnableConfig
+    ) -> dict[str, Any]:
+        """Asynchronously collect an executive's opinion."""
         try:
-            opinion = self.cmo.get_opinion(state)
-
-            minute = f"""
-            📈 CMO OPINION:
-            Opinion: {opinion["opinion"]}
-            Reasoning: {opinion["reasoning"]}
-            Vote: {opinion["vote"].upper()}
-            Priority Score: {opinion["priority_score"]}/10
-            """
-
-            minutes = state.get("meeting_minutes", [])
-            minutes.append(minute)
-
-            return {"cmo_opinion": opinion, "current_speaker": "CMO", "meeting_minutes": minutes}
+            executive = self._executive(role)
+            memo = sweep_memo(config)
+            if memo is None:
+                opinion = await executive.aget_opinion(state, config)
+            else:
+                opinion = await memo.aget_or_compute(
+                    _opinion_node(role),
+                    executive.dependencies(state),
+                    lambda: executive.aget_opinion(state, config),
+                )
+            return self._opinion_update(role, opinion)
         except Exception as e:
-            return {"error_message": f"Error collecting CMO opinion: {str(e)}"}
+            return {"error_message": f"Error collecting {role} opinion: {str(e)}"}
 
-    def _collect_cfo_opinion(self, state: CompanyState) -> dict[str, Any]:
-        """Collect CFO's opinion."""
-        try:
-            opinion = self.cfo.get_opinion(state)
-
-            minute = f"""
-            💰 CFO OPINION:
-            Opinion: {opinion["opinion"]}
-            Reasoning: {opinion["reasoning"]}
-            Vote: {opinion["vote"].upper()}
-            Priority Score: {opinion["priority_score"]}/10
-            """
+    def _node_policy(self, node: str) -> RetryPolicy:
+        """Return the retry policy for LLM calls made by a node."""
+        return self.node_retry_policies.get(node, self.retry_policy)
 
-            minutes = state.get("meeting_minutes", [])
-            minutes.append(minute)
+    def _executive(self, role: str) -> AIExecutive:
+        """Return the executive sitting in the given board seat, e.g. "CFO" or "cfo"."""
+        return self.executives[role.upper()]
 
-            return {"cfo_opinion": opinion, "current_speaker": "CFO", "meeting_minutes": minutes}
-        except Exception as e:
-            return {"error_message": f"Error collecting CFO opinion: {str(e)}"}
+    def _opinion_update(self, role: str, opinion: ExecutiveOpinion) -> dict[str, Any]:
+        """Build the state update recording an executive's opinion."""
+        minute = MeetingMinute(
+            kind="opinion",
+            speaker=role,
+            text=opinion["opinion"],
+            data={
+                "vote": opinion["vote"].upper(),
+                "priority_score": f"{opinion['priority_score']}/10",
+            },
+        )
+        if "vote_distribution" in opinion:
+            minute["data"]["vote_distribution"] = ", ".join(
+                f"{vote} {share:.0%}" for vote, share in opinion["vote_distribution"].items()
+            )
+
+        return {"opinions": {role: opinion}, "meeting_minutes": minute}
 
     def _facilitate_discussion(self, state: CompanyState) -> dict[str, Any]:
         """Facilitate discussion between executives."""
         try:
-            ceo_op = state.get("ceo_opinion")
-            cto_op = state.get("cto_opinion")
-            cmo_op = state.get("cmo_opinion")
-            cfo_op = state.get("cfo_opinion")
-
             # Summarize the different perspectives
-            discussion_summary = f"""
-            EXECUTIVE SUMMARY:
-            
-            CEO ({ceo_op["vote"] if ceo_op else "N/A"}): Strategic perspective focusing on overall business impact
-            CTO ({cto_op["vote"] if cto_op else "N/A"}): Technical feasibility and innovation considerations  
-            CMO ({cmo_op["vote"] if cmo_op else "N/A"}): Marketing and customer impact analysis
-            CFO ({cfo_op["vote"] if cfo_op else "N/A"}): Financial risk and ROI evaluation
-            
-            Key areas of alignment and disagreement will be considered in the final decision.
-            """
+            opinions = state["opinions"]
+            votes = {
+                seat.role: opinions[seat.role]["vote"] if seat.role in opinions else "N/A"
+                for seat in self.roster
+            }
+
+            if state.get("model_tier") == FAST_TIER and len(set(votes.values())) > 1:
+                # Disagreement on an easy decision: ask again on the full models
+                escalation = MeetingMinute(
+                    kind="discussion",
+                    speaker="Board Facilitator",
+                    text="The fast-tier opinions disagree; the executives are asked again.",
+                    data={"tier": FAST_TIER, **votes},
+                )
+                return {"model_tier": ESCALATED_TIER, "meeting_minutes": escalation}
 
-            minutes = state.get("meeting_minutes", [])
-            minutes.append(discussion_summary)
+            discussion_summary = MeetingMinute(
+                kind="discussion",
+                speaker="Board",
+                text="Key areas of alignment and disagreement will be considered in the "
+                "final decision.",
+                data={"round": len(state.get("vote_rounds", [])) + 1, **votes},
+            )
 
             return {
                 "discussion_phase": "voting",
                 "current_speaker": "Board",
-                "meeting_minutes": minutes,
+                "meeting_minutes": discussion_summary,
+                "vote_rounds": [votes],
             }
         except Exception as e:
             return {"error_message": f"Error facilitating discussion: {str(e)}"}
 
+    def _route_discussion(self, state: CompanyState) -> str | list[str]:
+        """Decide whether executives deliberate for another round.
+
+        Another round is only paid for while it could still change something:
+        it is skipped once the vote is unanimous, once a round changed no vote
+        (everyone would see the same positions again), or when the round limit
+        is reached. An error ends the meeting, and a fast-tier meeting whose
+        executives disagreed asks everyone again on the regular models.
+        """
+        rounds = state.get("vote_rounds", [])
+        if state.get("error_message"):
+            return END
+        if not rounds:  # Escalated from the fast tier; collect the first round again
+            return self._opinion_nodes()
+        if (
+            len(rounds) > self.max_deliberation_rounds
+            or len(set(rounds[-1].values())) <= 1
+            or (len(rounds) > 1 and rounds[-1] == rounds[-2])
+        ):
+            return "vote_and_decide"
+        return self._opinion_nodes()
+
     def _vote_and_decide(self, state: CompanyState) -> dict[str, Any]:
         """Tabulate votes and make final decision."""
         try:
-            votes = []
-            priority_scores = []
-
-            for role in ["ceo_opinion", "cto_opinion", "cmo_opinion", "cfo_opinion"]:
-                opinion = state.get(role)
+            # Tally the board's opinions in a single pass. A sampled opinion
+            # contributes its vote distribution, so each member still weighs 1.
+            votes: defaultdict[str, float] = defaultdict(float)
+            priority_total = 0.0
+            voters = 0
+            opinions = state["opinions"]
+            for seat in self.roster:
+                opinion = opinions.get(seat.role)
                 if opinion:
-                    votes.append(opinion["vote"])
-                    priority_scores.append(opinion["priority_score"])
+                    for vote, share in (
+                        opinion.get("vote_distribution") or {opinion["vote"]: 1}
+                    ).items():
+                        votes[vote] += share
+                    priority_total += opinion.get("mean_priority", opinion["priority_score"])
+                    voters += 1
 
-            approve_count = votes.count("approve")
-            reject_count = votes.count("reject")
-            abstain_count = votes.count("abstain")
+            approve_count = votes["approve"]
+            reject_count = votes["reject"]
+            abstain_count = votes["abstain"]
 
             # Decision logic: majority wins, but consider priority scores for ties
             if approve_count > reject_count:
@@ -230,90 +440,156 @@ class VirtualCompanySimulator:
                 decision = "REJECTED"
             else:
                 # Tie - use average priority score
-                avg_priority = sum(priority_scores) / len(priority_scores) if priority_scores else 5
+                avg_priority = priority_total / voters if voters else 5
                 decision = "APPROVED" if avg_priority >= 6 else "REJECTED"
 
-            vote_summary = f"""
-            🗳️ VOTING RESULTS:
-            Approve: {approve_count}
-            Reject: {reject_count}
-            Abstain: {abstain_count}
-            
-            FINAL DECISION: {decision}
-            """
-
-            minutes = state.get("meeting_minutes", [])
-            minutes.append(vote_summary)
+            vote_summary = MeetingMinute(
+                kind="vote",
+                speaker="Board",
+                text=f"FINAL DECISION: {decision}",
+                data={
+                    "approve": _tally(approve_count),
+                    "reject": _tally(reject_count),
+                    "abstain": _tally(abstain_count),
+                },
+            )
 
             return {
                 "final_decision": decision,
                 "discussion_phase": "decision_made",
-                "meeting_minutes": minutes,
+                "meeting_minutes": vote_summary,
             }
         except Exception as e:
             return {"error_message": f"Error in voting: {str(e)}"}
 
-    def _create_implementation_plan(self, state: CompanyState) -> dict[str, Any]:
+    def _create_implementation_plan(
+        self, state: CompanyState, config: RunnableConfig
+    ) -> dict[str, Any]:
         """Create implementation plan based on decision."""
         try:
-            decision = state.get("final_decision")
-            decision_details = state.get("decision_details")
-
-            if decision == "APPROVED" and decision_details:
-                # Create implementation plan using facilitator LLM
-                prompt = f"""
-                The board has APPROVED the following decision:
-                Title: {decision_details["title"]}
-                Description: {decision_details["description"]}
-                Timeline: {decision_details["timeline"]}
-                Cost: ${decision_details["estimated_cost"]:,}
-                
-                Create a practical implementation plan with:
-                1. Key milestones and timeline
-                2. Resource allocation
-                3. Success metrics
-                4. Risk mitigation strategies
-                5. Responsible parties
-                
-                Keep it concise but actionable.
-                """
-
-                messages = [
-                    SystemMessage(
-                        content="You are a business strategy consultant creating implementation plans."
-                    ),
-                    HumanMessage(content=prompt),
-                ]
-
-                response = self.facilitator.invoke(messages)
-                implementation_plan = str(response.content or "")
-
-                plan_summary = f"""
-                📋 IMPLEMENTATION PLAN:
-                {implementation_plan}
-                """
+            messages = self._implementation_plan_messages(state)
+            implementation_plan = None
+            if messages:
 
-            else:
-                plan_summary = f"""
-                📋 DECISION OUTCOME:
-                The proposal was {decision}. No implementation plan required.
-                
-                Next steps: Review feedback and consider alternative approaches.
-                """
-                implementation_plan = f"Decision {decision} - No implementation required"
+                def plan() -> str:
+                    response = call_with_retry(
+                        lambda: self.facilitator.invoke(messages),
+                        self._node_policy("create_implementation_plan"),
+                    )
+                    return str(response.content or "")
 
-            minutes = state.get("meeting_minutes", [])
-            minutes.append(plan_summary)
+                memo = sweep_memo(config)
+                implementation_plan = (
+                    memo.get_or_compute(
+                        "create_implementation_plan", board_context_inputs(state), plan
+                    )
+                    if memo is not None
+                    else plan()
+                )
 
-            return {
-                "implementation_plan": implementation_plan,
-                "discussion_phase": "completed",
-                "current_speaker": "Meeting Concluded",
-                "meeting_minutes": minutes,
-            }
+            return self._implementation_plan_update(state, implementation_plan)
+        except Exception as e:
+            return {"error_message": f"Error creating implementation plan: {str(e)}"}
+
+    async def _acreate_implementation_plan(
+        self, state: CompanyState, config: RunnableConfig
+    ) -> dict[str, Any]:
+        """Asynchronously create implementation plan based on decision."""
+        try:
+            messages = self._implementation_plan_messages(state)
+            implementation_plan = None
+            if messages:
+
+                async def plan() -> str:
+                    response = await acall_with_retry(
+                        lambda: self.facilitator.ainvoke(messages, config),
+                        self._node_policy("create_implementation_plan"),
+                        config,
+                    )
+                    return str(response.content or "")
+
+                memo = sweep_memo(config)
+                implementation_plan = (
+                    await memo.aget_or_compute(
+                        "create_implementation_plan", board_context_inputs(state), plan
+                    )
+                    if memo is not None
+                    else await plan()
+                )
+
+            return self._implementation_plan_update(state, implementation_plan)
         except Exception as e:
             return {"error_message": f"Error creating implementation plan: {str(e)}"}
 
+    def _implementation_plan_messages(self, state: CompanyState) -> list[BaseMessage] | None:
+        """Build the facilitator prompt for an approved decision, if any.
+
+        The prompt reads only the board context (see ``board_context_inputs``),
+        which sweeps rely on to reuse plans across metric variations.
+        """
+        decision_details = state.get("decision_details")
+        if state.get("final_decision") != "APPROVED" or not decision_details:
+            return None
+
+        return facilitator_messages(
+            state,
+            """
+            The board has APPROVED the decision above. As a business strategy consultant,
+            create a practical implementation plan with:
+            1. Key milestones and timeline
+            2. Resource allocation
+            3. Success metrics
+            4. Risk mitigation strategies
+            5. Responsible parties
+
+            Keep it concise but actionable.
+            """,
+        )
+
+    def prompt_token_report(self, state: CompanyState) -> dict[str, PromptTokens]:
+        """Estimate the prompt tokens each executive and the facilitator would send.
+
+        Args:
+            state: Meeting state, e.g. the result of a previous meeting.
+
+        Returns:
+            Token estimates keyed by seat (e.g. "cfo"), plus "facilitator" for the
+            plan prompt.
+        """
+        report = {
+            seat.seat: self._executive(seat.role).prompt_tokens(state) for seat in self.roster
+        }
+        approved = cast(CompanyState, {**state, "final_decision": "APPROVED"})
+        plan_messages = self._implementation_plan_messages(approved)
+        if plan_messages:
+            report["facilitator"] = prompt_tokens(plan_messages)
+        return report
+
+    def _implementation_plan_update(
+        self, state: CompanyState, implementation_plan: str | None
+    ) -> dict[str, Any]:
+        """Build the closing state update from the generated plan."""
+        if implementation_plan is not None:
+            plan_summary = MeetingMinute(
+                kind="plan", speaker="Board Facilitator", text=implementation_plan, data={}
+            )
+        else:
+            decision = state.get("final_decision")
+            plan_summary = MeetingMinute(
+                kind="outcome",
+                speaker="Board Facilitator",
+                text=f"The proposal was {decision}. No implementation plan required.",
+                data={"next_steps": "Review feedback and consider alternative approaches."},
+            )
+            implementation_plan = f"Decision {decision} - No implementation required"
+
+        return {
+            "implementation_plan": implementation_plan,
+            "discussion_phase": "completed",
+            "current_speaker": "Meeting Concluded",
+            "meeting_minutes": plan_summary,
+        }
+
     def simulate_board_meeting(
         self,
         company_name: str,
@@ -322,43 +598,508 @@ class VirtualCompanySimulator:
         decision_topic: str,
         decision_details: Decision,
         company_metrics: CompanyMetrics | None = None,
+        config: RunnableConfig | None = None,
+        thread_id: str | None = None,
+        current_quarter: str = DEFAULT_QUARTER,
+    ) -> CompanyState:
+        """Simulate a complete board meeting.
+
+        ``config`` is passed through to the workflow, e.g. to attach callbacks.
+        With a checkpointer, calling again with the same ``thread_id`` resumes a
+        failed meeting from the step that failed, re-running every parallel
+        branch of that step (see ``invoke_resumable``). ``current_quarter`` labels
+        the quarter the meeting takes place in, e.g. "Q3 2025".
+        """
+        initial_state = self._initial_state(
+            company_name,
+            industry,
+            company_size,
+            decision_topic,
+            decision_details,
+            company_metrics,
+            current_quarter,
+        )
+
+        tracer = self.instrumentation.tracer("board_meeting") if self.instrumentation else None
+        config = self._run_config(thread_id, with_callback(config, tracer))
+        result = invoke_resumable(self.workflow, initial_state, config)
+        if tracer is not None:
+            result = tracer.finish(result)
+        return cast(CompanyState, result)
+
+    async def asimulate_board_meeting(
+        self,
+        company_name: str,
+        industry: str,
+        company_size: str,
+        decision_topic: str,
+        decision_details: Decision,
+        company_metrics: CompanyMetrics | None = None,
+        config: RunnableConfig | None = None,
+        thread_id: str | None = None,
+        current_quarter: str = DEFAULT_QUARTER,
+    ) -> CompanyState:
+        """Simulate a complete board meeting without blocking the event loop."""
+        initial_state = self._initial_state(
+            company_name,
+            industry,
+            company_size,
+            decision_topic,
+            decision_details,
+            company_metrics,
+            current_quarter,
+        )
+
+        tracer = self.instrumentation.tracer("board_meeting") if self.instrumentation else None
+        config = self._run_config(thread_id, with_callback(config, tracer))
+        result = await ainvoke_resumable(self.workflow, initial_state, config)
+        if tracer is not None:
+            result = tracer.finish(result)
+        return cast(CompanyState, result)
+
+    def stream_board_meeting(
+        self,
+        company_name: str,
+        industry: str,
+        company_size: str,
+        decision_topic: str,
+        decision_details: Decision,
+        company_metrics: CompanyMetrics | None = None,
+        thread_id: str | None = None,
+        current_quarter: str = DEFAULT_QUARTER,
+    ) -> Iterator[StreamEvent]:
+        """Simulate a board meeting, streaming progress as it happens.
+
+        Yields ``token`` events with LLM output chunks as they arrive (e.g. the
+        implementation plan while it is being written), a ``node`` event with
+        each step's state update, and a closing ``final`` event with the full state.
+        """
+        initial_state = self._initial_state(
+            company_name,
+            industry,
+            company_size,
+            decision_topic,
+            decision_details,
+            company_metrics,
+            current_quarter,
+        )
+        config = self._run_config(thread_id)
+        yield from stream_workflow(self.workflow, initial_state, config)
+
+    async def astream_board_meeting(
+        self,
+        company_name: str,
+        industry: str,
+        company_size: str,
+        decision_topic: str,
+        decision_details: Decision,
+        company_metrics: CompanyMetrics | None = None,
+        thread_id: str | None = None,
+        current_quarter: str = DEFAULT_QUARTER,
+    ) -> AsyncIterator[StreamEvent]:
+        """Async counterpart of ``stream_board_meeting``."""
+        initial_state = self._initial_state(
+            company_name,
+            industry,
+            company_size,
+            decision_topic,
+            decision_details,
+            company_metrics,
+            current_quarter,
+        )
+        config = self._run_config(thread_id)
+        async for event in astream_workflow(self.workflow, initial_state, config):
+            yield event
+
+    def simulate_board_meetings_batch(
+        self,
+        requests: Iterable[BoardMeetingRequest],
+        max_concurrency: int = 8,
+        rate_limit: RateLimit | None = None,
+        tokens_per_meeting: int = 6000,
+        config: RunnableConfig | None = None,
+    ) -> Iterator[BoardMeetingResult]:
+        """Simulate many board meetings concurrently, yielding results as they complete.
+
+        Args:
+            requests: Meetings to simulate; consumed lazily.
+            max_concurrency: Maximum number of meetings in flight at once.
+            rate_limit: Optional global requests/tokens per minute budget. Each
+                meeting reserves ``llm_calls_per_meeting`` requests and is
+                credited with those it did not make.
+            tokens_per_meeting: Token estimate reserved against the budget before
+                each meeting and reconciled with the measured usage afterwards.
+            config: Optional workflow configuration applied to every meeting.
+
+        Failed meetings are reported through ``error`` without aborting the batch.
+        """
+        limiter = RateLimiter(rate_limit) if rate_limit else None
+        requests_per_meeting = self.llm_calls_per_meeting
+
+        def run(request: BoardMeetingRequest) -> CompanyState:
+            usage = _MeetingUsage()
+            if limiter:
+                limiter.acquire(requests_per_meeting, tokens_per_meeting)
+            state = self.simulate_board_meeting(**request, config=with_callback(config, usage))
+            if limiter:
+                limiter.record_usage(
+                    _total_tokens(usage) - tokens_per_meeting,
+                    usage.requests - requests_per_meeting,
+                )
+            return state
+
+        for outcome in run_batch(run, requests, max_concurrency):
+            yield _batch_result(outcome)
+
+    async def asimulate_board_meetings_batch(
+        self,
+        requests: Iterable[BoardMeetingRequest],
+        max_concurrency: int = 8,
+        rate_limit: RateLimit | None = None,
+        tokens_per_meeting: int = 6000,
+        config: RunnableConfig | None = None,
+    ) -> AsyncIterator[BoardMeetingResult]:
+        """Async counterpart of ``simulate_board_meetings_batch``."""
+        limiter = RateLimiter(rate_limit) if rate_limit else None
+        requests_per_meeting = self.llm_calls_per_meeting
+
+        async def run(request: BoardMeetingRequest) -> CompanyState:
+            usage = _MeetingUsage()
+            if limiter:
+                await limiter.aacquire(requests_per_meeting, tokens_per_meeting)
+            state = await self.asimulate_board_meeting(
+                **request, config=with_callback(config, usage)
+            )
+            if limiter:
+                limiter.record_usage(
+                    _total_tokens(usage) - tokens_per_meeting,
+                    usage.requests - requests_per_meeting,
+                )
+            return state
+
+        async for outcome in arun_batch(run, requests, max_concurrency):
+            yield _batch_result(outcome)
+
+    def sweep_board_meetings(
+        self,
+        base: BoardMeetingRequest,
+        points: Iterable[SweepPoint],
+        max_concurrency: int = 8,
+        memo: SweepMemo | None = None,
+        config: RunnableConfig | None = None,
+        **batch_options: Any,
+    ) -> Iterator[BoardMeetingResult]:
+        """Simulate what-if variations of a meeting, re-running only what they affect.
+
+        Every point's metric and decision overrides are applied to ``base`` and
+        the meetings run as a batch sharing ``memo``. An executive whose seat's
+        metrics and the decision are unchanged reuses its earlier opinion, and
+        an approved decision reuses its implementation plan, so e.g. a revenue
+        sweep asks the CTO and CMO once.
+
+        Args:
+            base: Meeting the variations are applied to.
+            points: Overrides per variation, e.g. from ``sweep_grid``.
+            max_concurrency: Maximum number of meetings in flight at once.
+            memo: Memo to share, e.g. across sweeps; its ``computed`` and
+                ``reused`` counters show the LLM calls saved per node.
+            config: Optional workflow configuration applied to every meeting.
+            **batch_options: Further ``simulate_board_meetings_batch`` options.
+
+        Results are yielded as they complete; ``index`` is the point's position.
+        """
+        requests = sweep_requests(base, points, DEFAULT_COMPANY_METRICS)
+        config = with_sweep_memo(config, SweepMemo() if memo is None else memo)
+        yield from self.simulate_board_meetings_batch(
+            requests, max_concurrency, config=config, **batch_options
+        )
+
+    async def asweep_board_meetings(
+        self,
+        base: BoardMeetingRequest,
+        points: Iterable[SweepPoint],
+        max_concurrency: int = 8,
+        memo: SweepMemo | None = None,
+        config: RunnableConfig | None = None,
+        **batch_options: Any,
+    ) -> AsyncIterator[BoardMeetingResult]:
+        """Async counterpart of ``sweep_board_meetings``."""
+        requests = sweep_requests(base, points, DEFAULT_COMPANY_METRICS)
+        config = with_sweep_memo(config, SweepMemo() if memo is None else memo)
+        async for result in self.asimulate_board_meetings_batch(
+            requests, max_concurrency, config=config, **batch_options
+        ):
+            yield result
+
+    def screen_decisions(
+        self, requests: Sequence[BoardMeetingRequest], budget: int | None = None
+    ) -> PortfolioSelection:
+        """Rank candidate meetings of one company by risk-adjusted value within budget.
+
+        The budget defaults to the cash flow of the first request's metrics;
+        see ``select_portfolio``. No LLM is called.
+        """
+        metrics = (
+            requests[0].get("company_metrics") if requests else None
+        ) or DEFAULT_COMPANY_METRICS
+        return select_portfolio(
+            [request["decision_details"] for request in requests], metrics, budget
+        )
+
+    def simulate_portfolio_meetings(
+        self,
+        requests: Sequence[BoardMeetingRequest],
+        budget: int | None = None,
+        include_marginal: bool = False,
+        max_concurrency: int = 8,
+        **batch_options: Any,
+    ) -> Iterator[BoardMeetingResult]:
+        """Put only the decisions worth funding to the board.
+
+        Candidates are screened with ``screen_decisions`` first, so decisions
+        that cannot fit the budget or create no risk-adjusted value never reach
+        an LLM. The selected portfolio is simulated as a batch, together with
+        the marginal candidates left out of it when ``include_marginal`` is set.
+
+        Args:
+            requests: Candidate meetings of one company.
+            budget: Cash available; defaults to the company's cash flow.
+            include_marginal: Also consult the board on affordable, profitable
+                decisions that did not make the portfolio.
+            max_concurrency: Maximum number of meetings in flight at once.
+            **batch_options: Further ``simulate_board_meetings_batch`` options.
+
+        Results are yielded as they complete; ``index`` is the candidate's
+        position in ``requests``.
+        """
+        indices = _portfolio_indices(self.screen_decisions(requests, budget), include_marginal)
+        for result in self.simulate_board_meetings_batch(
+            [requests[index] for index in indices], max_concurrency, **batch_options
+        ):
+            yield {**result, "index": indices[result["index"]]}
+
+    async def asimulate_portfolio_meetings(
+        self,
+        requests: Sequence[BoardMeetingRequest],
+        budget: int | None = None,
+        include_marginal: bool = False,
+        max_concurrency: int = 8,
+        **batch_options: Any,
+    ) -> AsyncIterator[BoardMeetingResult]:
+        """Async counterpart of ``simulate_portfolio_meetings``."""
+        indices = _portfolio_indices(self.screen_decisions(requests, budget), include_marginal)
+        async for result in self.asimulate_board_meetings_batch(
+            [requests[index] for index in indices], max_concurrency, **batch_options
+        ):
+            yield {**result, "index": indices[result["index"]]}
+
+    def simulate_company_history(
+        self,
+        company_name: str,
+        industry: str,
+        company_size: str,
+        agenda: Iterable["ScheduledDecision"],
+        quarters: int,
+        company_metrics: CompanyMetrics | None = None,
+        start_quarter: str = DEFAULT_QUARTER,
+        paths: int = 1000,
+        model: "EvolutionModel | None" = None,
+        seed: int | None = None,
+    ) -> "CompanyHistory":
+        """Simulate quarters of company history, putting scheduled decisions to the board.
+
+        The company evolves as ``paths`` Monte Carlo trajectories advanced
+        together (see ``CompanyEvolution``). At each scheduled decision the
+        board meets on the median metrics of the current quarter, and approved
+        decisions are implemented in every trajectory with their own cost and
+        ROI outcomes, so the board meetings are the only LLM calls.
+
+        Args:
+            company_name: Name of the company.
+            industry: Industry of the company.
+            company_size: Size of the company, e.g. "startup".
+            agenda: Decisions to take and the quarter (from 0) each is taken in.
+            quarters: Number of quarters to simulate.
+            company_metrics: Metrics at the start; defaults to the standard metrics.
+            start_quarter: Label of the first quarter, e.g. "Q1 2024".
+            paths: Number of Monte Carlo trajectories.
+            model: Quarterly dynamics; defaults to ``EvolutionModel()``.
+            seed: Seed for reproducible trajectories.
+
+        Returns:
+            The metric trajectories of every quarter and the board meetings held.
+        """
+        from .evolution import CompanyEvolution  # NumPy is only loaded for histories
+
+        evolution = CompanyEvolution(
+            company_metrics or DEFAULT_COMPANY_METRICS, paths, model, start_quarter, seed
+        )
+        meetings = []
+        for item in _sorted_agenda(agenda, quarters):
+            evolution.step(item["quarter"] - evolution.elapsed_quarters)
+            meeting = self.simulate_board_meeting(
+                company_name,
+                industry,
+                company_size,
+                item["decision_topic"],
+                item["decision_details"],
+                evolution.metrics(),
+                current_quarter=evolution.quarter,
+            )
+            meetings.append(meeting)
+            if meeting.get("final_decision") == "APPROVED":
+                evolution.adopt(item["decision_details"])
+        evolution.step(quarters - evolution.elapsed_quarters)
+        return evolution.history(meetings)
+
+    async def asimulate_company_history(
+        self,
+        company_name: str,
+        industry: str,
+        company_size: str,
+        agenda: Iterable["ScheduledDecision"],
+        quarters: int,
+        company_metrics: CompanyMetrics | None = None,
+        start_quarter: str = DEFAULT_QUARTER,
+        paths: int = 1000,
+        model: "EvolutionModel | None" = None,
+        seed: int | None = None,
+    ) -> "CompanyHistory":
+        """Async counterpart of ``simulate_company_history``."""
+        from .evolution import CompanyEvolution
+
+        evolution = CompanyEvolution(
+            company_metrics or DEFAULT_COMPANY_METRICS, paths, model, start_quarter, seed
+        )
+        meetings = []
+        for item in _sorted_agenda(agenda, quarters):
+            evolution.step(item["quarter"] - evolution.elapsed_quarters)
+            meeting = await self.asimulate_board_meeting(
+                company_name,
+                industry,
+                company_size,
+                item["decision_topic"],
+                item["decision_details"],
+                evolution.metrics(),
+                current_quarter=evolution.quarter,
+            )
+            meetings.append(meeting)
+            if meeting.get("final_decision") == "APPROVED":
+                evolution.adopt(item["decision_details"])
+        evolution.step(quarters - evolution.elapsed_quarters)
+        return evolution.history(meetings)
+
+    def _run_config(
+        self, thread_id: str | None, config: RunnableConfig | None = None
+    ) -> RunnableConfig:
+        """Build the run configuration, letting every board member be consulted at once."""
+        merged = RunnableConfig(**(config or {}))
+        merged.setdefault("max_concurrency", len(self.roster))
+        return run_config(self.checkpointer, thread_id, merged)
+
+    def _initial_state(
+        self,
+        company_name: str,
+        industry: str,
+        company_size: str,
+        decision_topic: str,
+        decision_details: Decision,
+        company_metrics: CompanyMetrics | None,
+        current_quarter: str = DEFAULT_QUARTER,
     ) -> CompanyState:
-        """Simulate a complete board meeting."""
+        """Build the initial meeting state."""
 
         # Default metrics if not provided
         if not company_metrics:
-            company_metrics = CompanyMetrics(
-                revenue=1000000,
-                expenses=800000,
-                profit=200000,
-                cash_flow=150000,
-                employee_count=50,
-                customer_satisfaction=7.5,
-                market_share=0.15,
-                tech_debt=4.0,
-                brand_value=6.5,
-            )
+            company_metrics = CompanyMetrics(**DEFAULT_COMPANY_METRICS)
 
-        initial_state = CompanyState(
+        return CompanyState(
             company_name=company_name,
             industry=industry,
             company_size=company_size,
-            current_quarter="Q1 2024",
+            current_quarter=current_quarter,
             decision_topic=decision_topic,
             decision_details=decision_details,
             metrics=company_metrics,
-            ceo_opinion=None,
-            cto_opinion=None,
-            cmo_opinion=None,
-            cfo_opinion=None,
+            opinions={},
             current_speaker="",
             discussion_phase="presentation",
             meeting_minutes=[],
+            vote_rounds=[],
+            model_tier=STANDARD_TIER,
             final_decision=None,
             decision_rationale=None,
             implementation_plan=None,
             error_message=None,
         )
 
-        result = self.workflow.invoke(initial_state)
-        return cast(CompanyState, result)
+
+def render_minute(minute: MeetingMinute) -> str:
+    """Render a meeting minute as human-readable text."""
+    seat = get_seat(minute["speaker"]) if minute["kind"] == "opinion" else None
+    icon = seat.icon if seat else MINUTE_HEADINGS[minute["kind"]][0]
+    lines = [f"{icon} {MINUTE_HEADINGS[minute['kind']][1]} - {minute['speaker']}", minute["text"]]
+    for key, value in minute["data"].items():
+        lines.append(f"- {key.replace('_', ' ').title()}: {value}")
+    return "\n".join(lines)
+
+
+def _tally(count: float) -> float:
+    """Round a vote count, which is fractional when opinions were sampled."""
+    count = round(float(count), 2)
+    return int(count) if count.is_integer() else count
+
+
+def _portfolio_indices(selection: PortfolioSelection, include_marginal: bool) -> list[int]:
+    """Candidate positions to put to the board, best ranked first."""
+    statuses = ("selected", "marginal") if include_marginal else ("selected",)
+    return [candidate["index"] for candidate in selection.ranked if candidate["status"] in statuses]
+
+
+def _sorted_agenda(
+    agenda: Iterable["ScheduledDecision"], quarters: int
+) -> list["ScheduledDecision"]:
+    """Order an agenda by quarter, rejecting decisions outside the simulated quarters."""
+    items = sorted(agenda, key=lambda item: item["quarter"])
+    for item in items:
+        if not 0 <= item["quarter"] < quarters:
+            raise ValueError(f"Scheduled quarter {item['quarter']} is outside 0..{quarters - 1}")
+    return items
+
+
+def _opinion_node(role: str) -> str:
+    """Name of the graph node collecting a board member's opinion."""
+    return f"collect_{role.lower()}_opinion"
+
+
+class _MeetingUsage(UsageMetadataCallbackHandler):
+    """Usage callback that also counts the LLM requests of a meeting."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.requests = 0
+
+    def on_chat_model_start(self, *args: Any, **kwargs: Any) -> None:
+        """Count a request; batched samples start one run each."""
+        with self._lock:
+            self.requests += 1
+
+
+def _total_tokens(usage: UsageMetadataCallbackHandler) -> int:
+    """Sum the tokens recorded by a usage callback across all models."""
+    return sum(metadata.get("total_tokens", 0) for metadata in usage.usage_metadata.values())
+
+
+def _batch_result(outcome: BatchOutcome[BoardMeetingRequest, CompanyState]) -> BoardMeetingResult:
+    """Convert a batch outcome into a board meeting result."""
+    error = str(outcome.error) if outcome.error else None
+    if outcome.value and outcome.value.get("error_message"):
+        error = outcome.value["error_message"]
+
+    return BoardMeetingResult(
+        index=outcome.index,
+        request=outcome.item,
+        state=outcome.value,
+        error=error,
+        elapsed_seconds=outcome.elapsed_seconds,
+    )
@@ -1,6 +1,42 @@
 """State definitions for the Virtual Company Simulator."""
 
-from typing import TypedDict
+import operator
+from typing import Annotated, Any, TypedDict
+
+from typing_extensions import NotRequired
+
+from .instrumentation import NodeSpan
+
+
+def keep_first_error(current: str | None, new: str | None) -> str | None:
+    """Reducer for error messages written by concurrently running nodes.
+
+    The first reported error wins so that parallel branches failing in the same
+    step do not raise a conflicting-update error in the graph.
+    """
+    return current or new
+
+
+class MeetingMinute(TypedDict):
+    """Compact record of one entry in the meeting minutes."""
+
+    kind: str  # "presentation", "opinion", "discussion", "vote", "plan", "outcome"
+    speaker: str
+    text: str
+    data: dict[str, Any]  # Small structured details, e.g. the vote tally
+
+
+def append_minutes(
+    current: list[MeetingMinute], new: MeetingMinute | list[MeetingMinute]
+) -> list[MeetingMinute]:
+    """Reducer appending a node's minute (or minutes) to the meeting record.
+
+    Nodes return only their own entries, so earlier minutes are never
+    re-sent in updates regardless of how long the meeting runs.
+    """
+    if isinstance(new, dict):
+        return [*current, new]
+    return [*current, *new]
 
 
 class CompanyMetrics(TypedDict):
@@ -25,6 +61,24 @@ class ExecutiveOpinion(TypedDict):
     reasoning: str
     vote: str  # "approve", "reject", "abstain"
     priority_score: int  # 1-10
+    # How the response was parsed: "structured" (schema-conforming JSON),
+    # "labeled" (free text with a vote line) or "unparsed" (defaults used)
+    parse_quality: NotRequired[str]
+    # Set when several completions were sampled: the share of samples per vote,
+    # their mean priority and how many were parsed. "vote" is the majority vote.
+    vote_distribution: NotRequired[dict[str, float]]
+    mean_priority: NotRequired[float]
+    samples: NotRequired[int]
+
+
+def merge_opinions(
+    current: dict[str, ExecutiveOpinion], new: dict[str, ExecutiveOpinion]
+) -> dict[str, ExecutiveOpinion]:
+    """Reducer merging the opinions board members return concurrently, by role.
+
+    A member's opinion from a later deliberation round replaces their earlier one.
+    """
+    return {**current, **new}
 
 
 class Decision(TypedDict):
@@ -55,16 +109,15 @@ class CompanyState(TypedDict):
     # Company metrics
     metrics: CompanyMetrics
 
-    # Executive opinions
-    ceo_opinion: ExecutiveOpinion | None
-    cto_opinion: ExecutiveOpinion | None
-    cmo_opinion: ExecutiveOpinion | None
-    cfo_opinion: ExecutiveOpinion | None
+    # Latest opinion of each board member, keyed by role
+    opinions: Annotated[dict[str, ExecutiveOpinion], merge_opinions]
 
     # Meeting flow
     current_speaker: str
     discussion_phase: str  # "presentation", "discussion", "voting", "decision"
-    meeting_minutes: list[str]
+    meeting_minutes: Annotated[list[MeetingMinute], append_minutes]
+    vote_rounds: Annotated[list[dict[str, str]], operator.add]  # Votes by role per round
+    model_tier: str  # "standard", "fast" or "escalated", see ModelRouter
 
     # Final outcome
     final_decision: str | None
@@ -72,4 +125,7 @@ class CompanyState(TypedDict):
     implementation_plan: str | None
 
     # Error handling
-    error_message: str | None
+    error_message: Annotated[str | None, keep_first_error]
+
+    # Per-node trace, set when the run is instrumented
+    trace: NotRequired[list[NodeSpan]]
@@ -0,0 +1,283 @@
+"""Quarter-by-quarter company evolution over many Monte Carlo trajectories at once."""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, TypedDict, cast
+
+import numpy as np
+
+from .company_state import CompanyMetrics, CompanyState, Decision
+
+# Metrics evolved per trajectory, in CompanyMetrics order
+METRIC_FIELDS = tuple(CompanyMetrics.__annotations__)
+
+_QUARTER_PATTERN = re.compile(r"^Q([1-4])\s+(\d{4})$")
+_DURATION_PATTERN = re.compile(
+    r"(\d+(?:\.\d+)?)(?:\s*-\s*(\d+(?:\.\d+)?))?\s*(year|yr|quarter|month|week)", re.IGNORECASE
+)
+_MONTHS_PER_UNIT = {"year": 12, "yr": 12, "quarter": 3, "month": 1, "week": 12 / 52}
+
+
+class ScheduledDecision(TypedDict):
+    """A decision put to the board at a given quarter of a company history."""
+
+    quarter: int  # Quarters after the start of the history, from 0
+    decision_topic: str
+    decision_details: Decision
+
+
+@dataclass(frozen=True)
+class EvolutionModel:
+    """Quarterly dynamics of a company and of the decisions it implements.
+
+    Financial metrics are treated as quarterly figures. Every trajectory draws
+    its own market noise and its own outcome of each adopted decision.
+    """
+
+    revenue_growth: float = 0.02  # Mean organic revenue growth per quarter
+    revenue_volatility: float = 0.04
+    expense_growth: float = 0.015
+    expense_volatility: float = 0.01
+    market_growth: float = 0.02  # Market share moves with growth relative to this
+    cash_conversion: float = 0.75  # Share of profit turned into cash flow
+    tech_debt_drift: float = 0.1  # Tech debt accumulated per quarter without action
+    score_volatility: float = 0.1  # Noise of the 0-10 scores
+    payback_quarters: int = 8  # Quarters over which a decision returns cost * (1 + ROI)
+    # Standard deviation of the realized ROI and of cost overruns by risk level
+    risk_volatility: dict[str, float] = field(
+        default_factory=lambda: {"low": 0.1, "medium": 0.25, "high": 0.5}
+    )
+    # Score changes of a successful decision by impact area keyword
+    impact_effects: dict[str, dict[str, float]] = field(
+        default_factory=lambda: {
+            "tech": {"tech_debt": -1.0},
+            "customer": {"customer_satisfaction": 0.5},
+            "brand": {"brand_value": 0.5},
+            "market": {"brand_value": 0.2, "customer_satisfaction": 0.2},
+        }
+    )
+
+
+@dataclass
+class _Project:
+    """An adopted decision being implemented across trajectories."""
+
+    remaining_quarters: int  # Implementation quarters left
+    payback_quarters: int  # Quarters of returns left once implemented
+    spend: np.ndarray  # Extra expenses per implementation quarter
+    returns: np.ndarray  # Extra revenue per payback quarter
+    effects: dict[str, np.ndarray]  # Score changes applied on completion
+
+
+@dataclass
+class CompanyHistory:
+    """Metric trajectories of a simulated company history and its board meetings."""
+
+    quarters: list[str]  # Label of each recorded quarter, starting with the initial one
+    trajectories: dict[str, np.ndarray]  # Metric -> array of shape (quarters, paths)
+    meetings: list[CompanyState]  # Board meetings in the order they were held
+
+    def percentiles(self, metric: str, q: Any = (5, 50, 95)) -> np.ndarray:
+        """Percentiles of a metric across trajectories, shaped (len(q), quarters)."""
+        return cast(np.ndarray, np.percentile(self.trajectories[metric], q, axis=1))
+
+    def metrics(self, quarter: int = -1) -> CompanyMetrics:
+        """Median metrics across trajectories at a recorded quarter."""
+        return _median_metrics(
+            {name: values[quarter] for name, values in self.trajectories.items()}
+        )
+
+
+class CompanyEvolution:
+    """Vectorized state of many company trajectories advancing quarter by quarter.
+
+    Every metric is held as one array with an entry per trajectory, so
+    stepping thousands of trajectories costs a handful of array operations.
+    """
+
+    def __init__(
+        self,
+        metrics: CompanyMetrics,
+        paths: int = 1000,
+        model: EvolutionModel | None = None,
+        start_quarter: str = "Q1 2024",
+        seed: int | None = None,
+    ):
+        """Start every trajectory from the same metrics.
+
+        Args:
+            metrics: Metrics at the start of the history.
+            paths: Number of Monte Carlo trajectories.
+            model: Quarterly dynamics; defaults to ``EvolutionModel()``.
+            start_quarter: Label of the first quarter, e.g. "Q1 2024".
+            seed: Seed of the random generator, for reproducible histories.
+        """
+        if paths < 1:
+            raise ValueError("paths must be at least 1")
+        self.model = model or EvolutionModel()
+        self.paths = paths
+        self.quarter = start_quarter
+        self._start = parse_quarter(start_quarter)
+        self._rng = np.random.default_rng(seed)
+        values: dict[str, Any] = dict(metrics)
+        self._metrics: dict[str, np.ndarray] = {
+            name: np.full(paths, float(values[name])) for name in METRIC_FIELDS
+        }
+        # Running costs scale with headcount; project spend comes on top
+        self._cost_per_employee = values["expenses"] / max(values["employee_count"], 1)
+        self._base_revenue = self._metrics["revenue"].copy()  # Revenue without project returns
+        self._projects: list[_Project] = []
+        self._history = [self._snapshot()]
+        self._quarters = [start_quarter]
+
+    @property
+    def elapsed_quarters(self) -> int:
+        """Number of quarters simulated so far."""
+        return len(self._quarters) - 1
+
+    def metrics(self) -> CompanyMetrics:
+        """Median metrics across trajectories, as presented to the board."""
+        return _median_metrics(self._metrics)
+
+    def adopt(self, decision: Decision) -> None:
+        """Start implementing an approved decision in every trajectory.
+
+        Its cost is spread over its timeline, with a cost overrun drawn per
+        trajectory. Once implemented it returns ``estimated_cost * (1 + ROI)``
+        as extra revenue spread over ``payback_quarters``, with the ROI
+        drawn around ``expected_roi`` according to the risk level. Decisions
+        with a positive realized ROI also apply the score effects of their
+        impact areas.
+        """
+        model = self.model
+        volatility = model.risk_volatility.get(decision["risk_level"].lower(), 0.25)
+        duration = timeline_quarters(decision["timeline"])
+        overrun = np.maximum(self._rng.normal(1.0, volatility / 2, self.paths), 0.5)
+        roi = self._rng.normal(decision["expected_roi"], volatility, self.paths)
+        cost = decision["estimated_cost"]
+        success = (roi > 0).astype(float)
+        effects: dict[str, np.ndarray] = {}
+        for area in decision["impact_areas"]:
+            for keyword, changes in model.impact_effects.items():
+                if keyword in area.lower():
+                    for name, change in changes.items():
+                        effects[name] = effects.get(name, 0) + change * success
+        self._projects.append(
+            _Project(
+                remaining_quarters=duration,
+                payback_quarters=model.payback_quarters,
+                spend=cost * overrun / duration,
+                returns=np.maximum(cost * (1 + roi), 0) / model.payback_quarters,
+                effects=effects,
+            )
+        )
+
+    def step(self, quarters: int = 1) -> None:
+        """Advance every trajectory by ``quarters`` quarters."""
+        for _ in range(quarters):
+            self._step()
+
+    def history(self, meetings: list[CompanyState] | None = None) -> CompanyHistory:
+        """Return the recorded trajectories, one row per quarter so far."""
+        trajectories = {
+            name: np.stack([snapshot[name] for snapshot in self._history]) for name in METRIC_FIELDS
+        }
+        return CompanyHistory(list(self._quarters), trajectories, meetings or [])
+
+    def _step(self) -> None:
+        """Advance one quarter: market noise, then project spend and returns."""
+        model, rng, metrics, paths = self.model, self._rng, self._metrics, self.paths
+        self._base_revenue *= 1 + rng.normal(model.revenue_growth, model.revenue_volatility, paths)
+        base_expenses = metrics["employee_count"] * self._cost_per_employee
+        base_expenses *= 1 + rng.normal(model.expense_growth, model.expense_volatility, paths)
+        metrics["employee_count"] = base_expenses / self._cost_per_employee
+        metrics["tech_debt"] += model.tech_debt_drift
+        for name in ("customer_satisfaction", "brand_value", "tech_debt"):
+            metrics[name] += rng.normal(0, model.score_volatility, paths)
+
+        spend = np.zeros(paths)
+        returns = np.zeros(paths)
+        for project in self._projects:
+            if project.remaining_quarters:
+                spend += project.spend
+                project.remaining_quarters -= 1
+                if not project.remaining_quarters:
+                    for name, change in project.effects.items():
+                        metrics[name] += change
+            else:
+                returns += project.returns
+                project.payback_quarters -= 1
+        self._projects = [project for project in self._projects if project.payback_quarters]
+
+        revenue = self._base_revenue + returns
+        # Share follows growth relative to the market; it holds while there is no revenue
+        growth = np.divide(
+            revenue,
+            metrics["revenue"],
+            out=np.full(paths, 1.0 + model.market_growth),
+            where=metrics["revenue"] > 0,
+        )
+        metrics["market_share"] *= growth / (1 + model.market_growth)
+        metrics["revenue"] = revenue
+        metrics["expenses"] = base_expenses + spend
+        metrics["profit"] = metrics["revenue"] - metrics["expenses"]
+        metrics["cash_flow"] = metrics["profit"] * model.cash_conversion
+        for name in ("customer_satisfaction", "brand_value", "tech_debt"):
+            np.clip(metrics[name], 0, 10, out=metrics[name])
+        np.clip(metrics["market_share"], 0, 1, out=metrics["market_share"])
+
+        self._quarters.append(format_quarter(self._start, len(self._quarters)))
+        self.quarter = self._quarters[-1]
+        self._history.append(self._snapshot())
+
+    def _snapshot(self) -> dict[str, np.ndarray]:
+        """Copy of the current metrics of every trajectory."""
+        return {name: values.copy() for name, values in self._metrics.items()}
+
+
+def parse_quarter(label: str) -> tuple[int, int]:
+    """Parse a quarter label such as "Q3 2025" into (year, quarter)."""
+    match = _QUARTER_PATTERN.match(label.strip())
+    if not match:
+        raise ValueError(f"Quarter labels look like 'Q1 2024': {label!r}")
+    return int(match.group(2)), int(match.group(1))
+
+
+def format_quarter(start: tuple[int, int], offset: int) -> str:
+    """Label of the quarter ``offset`` quarters after ``start``."""
+    index = start[0] * 4 + start[1] - 1 + offset
+    return f"Q{index % 4 + 1} {index // 4}"
+
+
+def timeline_quarters(timeline: str) -> int:
+    """Implementation time of a decision in whole quarters, at least one.
+
+    Understands e.g. "6 months implementation", "1 year" or "12-18 months"
+    (ranges use their midpoint); unrecognized timelines take one quarter.
+    """
+    match = _DURATION_PATTERN.search(timeline)
+    if not match:
+        return 1
+    low = float(match.group(1))
+    high = float(match.group(2) or low)
+    months = (low + high) / 2 * _MONTHS_PER_UNIT[match.group(3).lower()]
+    return max(1, round(months / 3))
+
+
+def _median_metrics(values: dict[str, np.ndarray]) -> CompanyMetrics:
+    """Median of every metric across trajectories, typed like CompanyMetrics."""
+
+    def median(name: str) -> float:
+        return float(np.median(values[name]))
+
+    return CompanyMetrics(
+        revenue=round(median("revenue")),
+        expenses=round(median("expenses")),
+        profit=round(median("profit")),
+        cash_flow=round(median("cash_flow")),
+        employee_count=round(median("employee_count")),
+        customer_satisfaction=median("customer_satisfaction"),
+        market_share=median("market_share"),
+        tech_debt=median("tech_debt"),
+        brand_value=median("brand_value"),
+    )
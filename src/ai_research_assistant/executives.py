@@ -1,288 +1,425 @@
 """AI Executive roles for the Virtual Company Simulator."""
 
+import json
+import re
+from collections import Counter
+from collections.abc import Mapping
+from functools import cached_property
 from typing import Any
 
-from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_openai import ChatOpenAI
-from pydantic import SecretStr
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+from langchain_core.runnables import RunnableConfig, ensure_config
 
 from .company_state import CompanyState, ExecutiveOpinion
+from .llm_clients import LLMClientRegistry, get_default_registry
+from .prompts import PromptTokens, board_context_inputs, executive_messages, prompt_tokens
+from .resilience import RetryPolicy, acall_with_retry, call_with_retry
+from .roster import CEO_SEAT, CFO_SEAT, CMO_SEAT, CTO_SEAT, BoardSeat
+from .routing import FAST_TIER, ModelRoute
+
+# JSON schema requested from the model so responses map directly onto ExecutiveOpinion
+OPINION_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "opinion": {"type": "string", "description": "Your opinion in 2-3 sentences."},
+        "reasoning": {"type": "string", "description": "Your reasoning in 3-4 sentences."},
+        "vote": {"type": "string", "enum": ["approve", "reject", "abstain"]},
+        "priority_score": {
+            "type": "integer",
+            "description": "Priority from 1 to 10, where 10 is highest priority.",
+        },
+    },
+    "required": ["opinion", "reasoning", "vote", "priority_score"],
+    "additionalProperties": False,
+}
+
+OPINION_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {"name": "executive_opinion", "strict": True, "schema": OPINION_SCHEMA},
+}
+
+VOTES = ("approve", "reject", "abstain")
+
+# "Label: value" lines of free-text answers, e.g. "**Vote:** approve" or "- Priority Score: 8"
+_FIELD_PATTERN = re.compile(
+    r"^[\s>*#-]*(opinion|reasoning|vote|priority(?:[ _]score)?)\W*?:[\s*]*(.*?)\s*$",
+    re.IGNORECASE | re.MULTILINE,
+)
+_VOTE_PATTERN = re.compile(
+    r"\b(?:(not|cannot|can't|won't|don't)\s+)?(approve|reject|abstain)", re.IGNORECASE
+)
+_NUMBER_PATTERN = re.compile(r"\d+")
 
 
 class AIExecutive:
-    """Base class for AI executives."""
-
-    def __init__(self, openai_api_key: str | None = None):
-        """Initialize the AI executive."""
-        self.llm = ChatOpenAI(
-            model="gpt-4o-mini",
-            api_key=SecretStr(openai_api_key) if openai_api_key else None,
-            temperature=0.7,
-        )
-
-    def get_opinion(self, state: CompanyState) -> ExecutiveOpinion:
+    """A board member answering from the brief and defaults of a ``BoardSeat``.
+
+    The seat is passed in, or set as the ``seat`` class attribute by the
+    built-in executive classes.
+    """
+
+    seat: BoardSeat
+
+    def __init__(
+        self,
+        openai_api_key: str | None = None,
+        llm_registry: LLMClientRegistry | None = None,
+        structured_output: bool = True,
+        retry_policy: RetryPolicy | None = None,
+        model_route: ModelRoute | None = None,
+        fast_route: ModelRoute | None = None,
+        seat: BoardSeat | None = None,
+        samples: int = 1,
+    ):
+        """Initialize the AI executive.
+
+        Args:
+            openai_api_key: OpenAI API key.
+            llm_registry: Registry providing the shared chat model. Defaults to the
+                process-wide registry.
+            structured_output: Request JSON matching ``OPINION_SCHEMA`` from the
+                model. Disable for models without structured output support.
+            retry_policy: Retries, backoff, timeout and hedging for opinion requests.
+            model_route: Model, temperature and max_tokens of the executive.
+            fast_route: Faster model used while the meeting is in the fast tier.
+            seat: Role, brief and defaults of the member; defaults to the class's seat.
+            samples: Completions sampled per opinion. Above 1, they are requested
+                in one call with the provider's ``n`` parameter (or as concurrent
+                requests for models without it), and the opinion reports the
+                vote distribution and mean priority across them.
+        """
+        seat = seat or getattr(self, "seat", None)
+        if seat is None:
+            raise ValueError("An executive needs a board seat")
+        if samples < 1:
+            raise ValueError("samples must be at least 1")
+        self.seat = seat
+        self.llm_registry = llm_registry or get_default_registry()
+        self.api_key = openai_api_key
+        self.model_route = model_route or ModelRoute()
+        self.fast_route = fast_route
+        self.structured_output = structured_output
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.samples = samples
+
+    @cached_property
+    def llm(self) -> BaseChatModel:
+        """The executive's chat model, created on first use."""
+        return self.model_route.chat_model(self.llm_registry, self.api_key, 0.7)
+
+    @cached_property
+    def fast_llm(self) -> BaseChatModel | None:
+        """Chat model used in the fast tier, if the executive has a fast route."""
+        if self.fast_route is None:
+            return None
+        return self.fast_route.chat_model(self.llm_registry, self.api_key, 0.7)
+
+    @property
+    def requests_per_opinion(self) -> int:
+        """LLM requests of one opinion: one per sample on models without ``n``."""
+        if self.samples == 1:
+            return 1
+        models = [self.llm] if self.fast_llm is None else [self.llm, self.fast_llm]
+        return 1 if all(_supports_n(llm) for llm in models) else self.samples
+
+    def warm_up(self) -> None:
+        """Create the executive's chat models ahead of the first opinion."""
+        _ = self.llm, self.fast_llm
+
+    def get_opinion(
+        self, state: CompanyState, config: RunnableConfig | None = None
+    ) -> ExecutiveOpinion:
         """Get the executive's opinion on the current decision."""
-        raise NotImplementedError
-
-
-class CEOExecutive(AIExecutive):
-    """Chief Executive Officer - focuses on overall strategy and leadership."""
+        messages = self._opinion_messages(state)
+        llm = self._llm(state)
+        if self.samples > 1:
+            contents = call_with_retry(
+                lambda: self._sample(llm, messages, config), self.retry_policy, config
+            )
+            return self._combine_opinions([self._parse_opinion(text) for text in contents])
+        response = call_with_retry(
+            lambda: llm.invoke(messages, config, **self._llm_kwargs()),
+            self.retry_policy,
+            config,
+        )
+        return self._parse_opinion(str(response.content or ""))
+
+    async def aget_opinion(
+        self, state: CompanyState, config: RunnableConfig | None = None
+    ) -> ExecutiveOpinion:
+        """Asynchronously get the executive's opinion on the current decision."""
+        messages = self._opinion_messages(state)
+        llm = self._llm(state)
+        if self.samples > 1:
+            contents = await acall_with_retry(
+                lambda: self._asample(llm, messages, config), self.retry_policy, config
+            )
+            return self._combine_opinions([self._parse_opinion(text) for text in contents])
+        response = await acall_with_retry(
+            lambda: llm.ainvoke(messages, config, **self._llm_kwargs()),
+            self.retry_policy,
+            config,
+        )
+        return self._parse_opinion(str(response.content or ""))
+
+    def _sample(
+        self, llm: BaseChatModel, messages: list[BaseMessage], config: RunnableConfig | None
+    ) -> list[str]:
+        """Request ``samples`` completions of the prompt, in one call where supported.
+
+        The ``n`` call is never streamed: streaming would merge the samples
+        into one completion, e.g. when the meeting itself is being streamed.
+        """
+        if _supports_n(llm):
+            result = llm.generate(
+                [messages],
+                **_generate_options(config),
+                n=self.samples,
+                stream=False,
+                **self._llm_kwargs(),
+            )
+            return [generation.text for generation in result.generations[0]]
+        responses = llm.batch([messages] * self.samples, config, **self._llm_kwargs())
+        return [str(response.content or "") for response in responses]
+
+    async def _asample(
+        self, llm: BaseChatModel, messages: list[BaseMessage], config: RunnableConfig | None
+    ) -> list[str]:
+        """Async counterpart of ``_sample``."""
+        if _supports_n(llm):
+            result = await llm.agenerate(
+                [messages],
+                **_generate_options(config),
+                n=self.samples,
+                stream=False,
+                **self._llm_kwargs(),
+            )
+            return [generation.text for generation in result.generations[0]]
+        responses = await llm.abatch([messages] * self.samples, config, **self._llm_kwargs())
+        return [str(response.content or "") for response in responses]
+
+    def _combine_opinions(self, opinions: list[ExecutiveOpinion]) -> ExecutiveOpinion:
+        """Summarize sampled opinions as the majority opinion with its vote distribution.
+
+        Ties go to the vote of the earliest sample, i.e. the completion a
+        single-sample request would have returned.
+        """
+        counts = Counter(opinion["vote"] for opinion in opinions)
+        vote = counts.most_common(1)[0][0]
+        majority = next(opinion for opinion in opinions if opinion["vote"] == vote)
+        mean_priority = sum(opinion["priority_score"] for opinion in opinions) / len(opinions)
+        return ExecutiveOpinion(
+            **majority,
+            vote_distribution={choice: counts[choice] / len(opinions) for choice in VOTES},
+            mean_priority=mean_priority,
+            samples=len(opinions),
+        )
 
-    def get_opinion(self, state: CompanyState) -> ExecutiveOpinion:
-        """Get CEO's strategic opinion."""
-        decision = state["decision_details"]
-        metrics = state["metrics"]
-
-        prompt = f"""You are the CEO of {state["company_name"]}, a {state["company_size"]} company in the {state["industry"]} industry.
-        
-        Current Company Metrics:
-        - Revenue: ${metrics["revenue"]:,}
-        - Profit: ${metrics["profit"]:,}
-        - Employee Count: {metrics["employee_count"]}
-        - Market Share: {metrics["market_share"]:.1%}
-        - Customer Satisfaction: {metrics["customer_satisfaction"]:.1f}/10
-        
-        Decision Being Considered:
-        - Title: {decision["title"] if decision else "N/A"}
-        - Description: {decision["description"] if decision else "N/A"}
-        - Estimated Cost: ${decision["estimated_cost"]:,} if decision else 0
-        - Expected ROI: {decision["expected_roi"]:.1%} if decision else 0
-        - Risk Level: {decision["risk_level"] if decision else "N/A"}
-        
-        As CEO, provide your opinion focusing on:
-        1. Strategic alignment with company vision
-        2. Long-term impact on company growth
-        3. Leadership and stakeholder considerations
-        4. Overall business strategy
-        
-        Respond with:
-        - Your opinion (2-3 sentences)
-        - Your reasoning (3-4 sentences)
-        - Your vote: "approve", "reject", or "abstain"
-        - Priority score (1-10, where 10 is highest priority)
-        
-        Be decisive but consider all stakeholders including employees, customers, and shareholders."""
-
-        messages = [
-            SystemMessage(
-                content="You are an experienced CEO making strategic business decisions."
+    @property
+    def role(self) -> str:
+        """Role key of the executive's seat, e.g. "CFO"."""
+        return self.seat.role
+
+    @property
+    def default_reasoning(self) -> str:
+        """Reasoning used when a response leaves it out."""
+        return self.seat.default_reasoning
+
+    @property
+    def default_priority(self) -> int:
+        """Priority used when a response leaves it out."""
+        return self.seat.default_priority
+
+    def _llm(self, state: CompanyState) -> BaseChatModel:
+        """Return the model answering in the meeting's current tier."""
+        if state.get("model_tier") == FAST_TIER and self.fast_llm is not None:
+            return self.fast_llm
+        return self.llm
+
+    def _build_messages(self, state: CompanyState) -> list[BaseMessage]:
+        """Build the prompt messages asking for the executive's opinion."""
+        return executive_messages(state, self.seat.brief(state["metrics"]))
+
+    def _opinion_messages(self, state: CompanyState) -> list[BaseMessage]:
+        """Build the prompt, adding the board's positions in deliberation rounds."""
+        messages = self._build_messages(state)
+        rounds = state.get("vote_rounds") or []
+        opinions = state.get("opinions") or {}
+        previous = opinions.get(self.role)
+        if not rounds or not previous:
+            return messages
+
+        positions = []
+        for role in rounds[-1]:
+            opinion = opinions.get(role)
+            if role != self.role and opinion:
+                positions.append(
+                    f"- {role}: {opinion['vote']} (priority {opinion['priority_score']}/10): "
+                    f"{_truncate(opinion['opinion'], 160)}"
+                )
+        revision = (
+            f"Board discussion, round {len(rounds)}. The other executives' positions:\n"
+            + "\n".join(positions)
+            + "\nReconsider your position in light of these views. Keep or change your "
+            "vote and answer in the same format as before."
+        )
+        return [
+            *messages,
+            AIMessage(
+                content=f"Opinion: {previous['opinion']}\nVote: {previous['vote']}\n"
+                f"Priority: {previous['priority_score']}"
             ),
-            HumanMessage(content=prompt),
+            HumanMessage(content=revision),
         ]
 
-        response = self.llm.invoke(messages)
-        content = str(response.content or "")
-
-        # Parse the response (simplified parsing)
-        lines = content.split("\n")
-        opinion = ""
-        reasoning = ""
-        vote = "abstain"
-        priority_score = 5
-
-        for line in lines:
-            if "opinion:" in line.lower():
-                opinion = line.split(":", 1)[1].strip()
-            elif "reasoning:" in line.lower():
-                reasoning = line.split(":", 1)[1].strip()
-            elif "vote:" in line.lower():
-                vote_text = line.split(":", 1)[1].strip().lower()
-                if "approve" in vote_text:
-                    vote = "approve"
-                elif "reject" in vote_text:
-                    vote = "reject"
-            elif "priority" in line.lower() and any(char.isdigit() for char in line):
-                import re
-
-                numbers = re.findall(r"\d+", line)
-                if numbers:
-                    priority_score = min(10, max(1, int(numbers[0])))
-
-        # Fallback parsing if structured format not found
-        if not opinion:
-            opinion = content[:200] + "..." if len(content) > 200 else content
-        if not reasoning:
-            reasoning = "Strategic considerations based on company position and market dynamics."
+    def dependencies(self, state: CompanyState) -> dict[str, Any]:
+        """The meeting state this executive's opinion is derived from.
+
+        Only the seat's metrics are included, so e.g. a revenue change does not
+        affect the CTO. Deliberation rounds also depend on the board's
+        positions. States with equal dependencies get interchangeable opinions,
+        which what-if sweeps use to reuse them.
+        """
+        metrics: Mapping[str, object] = state["metrics"]
+        dependencies = {
+            **board_context_inputs(state),
+            "metrics": {field: metrics[field] for field in self.seat.metric_fields},
+            "model_tier": state.get("model_tier"),
+        }
+        if state.get("vote_rounds") and self.role in (state.get("opinions") or {}):
+            dependencies["vote_rounds"] = state["vote_rounds"]
+            dependencies["opinions"] = state["opinions"]
+        return dependencies
+
+    def prompt_tokens(self, state: CompanyState) -> PromptTokens:
+        """Estimate the token counts of this executive's first-round opinion prompt."""
+        return prompt_tokens(self._build_messages(state))
+
+    def _llm_kwargs(self) -> dict[str, Any]:
+        """Extra model call arguments requesting structured output."""
+        return {"response_format": OPINION_RESPONSE_FORMAT} if self.structured_output else {}
+
+    def _parse_opinion(self, content: str) -> ExecutiveOpinion:
+        """Parse the model response into an executive opinion.
+
+        JSON responses matching ``OPINION_SCHEMA`` are mapped directly. Other
+        text is parsed in a single pass over "Label: value" lines; fields that
+        cannot be found fall back to the role defaults. The result records how
+        it was obtained in ``parse_quality``.
+        """
+        structured = _parse_json_opinion(content)
+        vote: str | None
+        if structured is not None:
+            opinion, reasoning, vote, priority = structured
+            quality = "structured"
+        else:
+            fields: dict[str, str] = {}
+            for match in _FIELD_PATTERN.finditer(content):
+                label = re.split(r"[ _]", match.group(1).lower())[0]
+                fields.setdefault(label, match.group(2))
+            vote_text = fields.get("vote")
+            vote = _parse_vote(vote_text) if vote_text else None
+            opinion = fields.get("opinion") or _truncate(content)
+            reasoning = fields.get("reasoning") or self.default_reasoning
+            priority = _parse_priority(fields.get("priority"))
+            quality = "labeled" if vote else "unparsed"
 
         return ExecutiveOpinion(
-            role="CEO",
+            role=self.role,
             opinion=opinion,
             reasoning=reasoning,
-            vote=vote,
-            priority_score=priority_score,
+            vote=vote or "abstain",
+            priority_score=self.default_priority if priority is None else priority,
+            parse_quality=quality,
         )
 
 
-class CTOExecutive(AIExecutive):
-    """Chief Technology Officer - focuses on technology and innovation."""
+def _supports_n(llm: BaseChatModel) -> bool:
+    """Return whether a chat model returns several completions per call through ``n``."""
+    return "n" in getattr(type(llm), "model_fields", {})
 
-    def get_opinion(self, state: CompanyState) -> ExecutiveOpinion:
-        """Get CTO's technology-focused opinion."""
-        decision = state["decision_details"]
-        metrics = state["metrics"]
-
-        prompt = f"""You are the CTO of {state["company_name"]}, a {state["company_size"]} company in the {state["industry"]} industry.
-        
-        Current Technical Metrics:
-        - Tech Debt Level: {metrics["tech_debt"]:.1f}/10
-        - Employee Count: {metrics["employee_count"]} (consider tech team size)
-        
-        Decision Being Considered:
-        - Title: {decision["title"] if decision else "N/A"}
-        - Description: {decision["description"] if decision else "N/A"}
-        - Category: {decision["category"] if decision else "N/A"}
-        - Timeline: {decision["timeline"] if decision else "N/A"}
-        
-        As CTO, focus on:
-        1. Technical feasibility and implementation challenges
-        2. Impact on existing systems and infrastructure
-        3. Innovation opportunities and competitive advantage
-        4. Technical team capacity and skill requirements
-        5. Long-term technical debt implications
-        
-        Provide your technical perspective with vote and priority score."""
-
-        messages = [
-            SystemMessage(content="You are an experienced CTO evaluating technical decisions."),
-            HumanMessage(content=prompt),
-        ]
 
-        response = self.llm.invoke(messages)
-        content = str(response.content or "")
+def _generate_options(config: RunnableConfig | None) -> dict[str, Any]:
+    """Callback and tracing options of a run configuration, as ``generate`` arguments."""
+    config = ensure_config(config)
+    return {
+        "callbacks": config.get("callbacks"),
+        "tags": config.get("tags"),
+        "metadata": config.get("metadata"),
+        "run_name": config.get("run_name"),
+    }
 
-        # Similar parsing logic as CEO
-        opinion = content[:200] + "..." if len(content) > 200 else content
-        reasoning = "Technical evaluation based on feasibility, infrastructure impact, and innovation potential."
-        vote = "abstain"
-        priority_score = 6
 
-        # Simple vote extraction
-        if "approve" in content.lower():
-            vote = "approve"
-        elif "reject" in content.lower():
-            vote = "reject"
+def _parse_json_opinion(content: str) -> tuple[str, str, str, int | None] | None:
+    """Parse a JSON opinion, returning None if the text does not conform to the schema."""
+    start, end = content.find("{"), content.rfind("}")
+    if start == -1 or end < start:
+        return None
+    try:
+        data = json.loads(content[start : end + 1])
+    except ValueError:
+        return None
+    if not isinstance(data, dict) or data.get("vote") not in VOTES:
+        return None
+    opinion, reasoning = data.get("opinion"), data.get("reasoning")
+    if not isinstance(opinion, str) or not isinstance(reasoning, str):
+        return None
+    return opinion, reasoning, data["vote"], _parse_priority(str(data.get("priority_score", "")))
 
-        return ExecutiveOpinion(
-            role="CTO",
-            opinion=opinion,
-            reasoning=reasoning,
-            vote=vote,
-            priority_score=priority_score,
-        )
 
+def _parse_vote(text: str) -> str | None:
+    """Extract a vote from text; a negated vote ("cannot approve") counts as the opposite."""
+    match = _VOTE_PATTERN.search(text)
+    if match is None:
+        return None
+    negated, vote = match.group(1), match.group(2).lower()
+    if negated and vote != "abstain":
+        return "reject" if vote == "approve" else "approve"
+    return vote
 
-class CMOExecutive(AIExecutive):
-    """Chief Marketing Officer - focuses on marketing and customer experience."""
 
-    def get_opinion(self, state: CompanyState) -> ExecutiveOpinion:
-        """Get CMO's marketing-focused opinion."""
-        decision = state["decision_details"]
-        metrics = state["metrics"]
-
-        prompt = f"""You are the CMO of {state["company_name"]}, a {state["company_size"]} company in the {state["industry"]} industry.
-        
-        Current Marketing Metrics:
-        - Market Share: {metrics["market_share"]:.1%}
-        - Customer Satisfaction: {metrics["customer_satisfaction"]:.1f}/10
-        - Brand Value: {metrics["brand_value"]:.1f}/10
-        
-        Decision Being Considered:
-        - Title: {decision["title"] if decision else "N/A"}
-        - Description: {decision["description"] if decision else "N/A"}
-        
-        As CMO, evaluate based on:
-        1. Impact on customer experience and satisfaction
-        2. Brand positioning and market perception
-        3. Competitive advantage in the market
-        4. Customer acquisition and retention potential
-        5. Marketing and sales implications
-        
-        Provide your marketing perspective with vote and priority score."""
-
-        messages = [
-            SystemMessage(
-                content="You are an experienced CMO evaluating marketing and customer impact."
-            ),
-            HumanMessage(content=prompt),
-        ]
+def _parse_priority(text: str | None) -> int | None:
+    """Extract a priority score clamped to 1-10."""
+    match = _NUMBER_PATTERN.search(text or "")
+    return min(10, max(1, int(match.group()))) if match else None
 
-        response = self.llm.invoke(messages)
-        content = str(response.content or "")
 
-        opinion = content[:200] + "..." if len(content) > 200 else content
-        reasoning = (
-            "Marketing evaluation focused on customer impact, brand value, and market positioning."
-        )
-        vote = "abstain"
-        priority_score = 5
+def _truncate(content: str, limit: int = 200) -> str:
+    """Shorten free text used as the opinion when no opinion field was found."""
+    return content[:limit] + "..." if len(content) > limit else content
 
-        if "approve" in content.lower():
-            vote = "approve"
-        elif "reject" in content.lower():
-            vote = "reject"
 
-        return ExecutiveOpinion(
-            role="CMO",
-            opinion=opinion,
-            reasoning=reasoning,
-            vote=vote,
-            priority_score=priority_score,
-        )
+class CEOExecutive(AIExecutive):
+    """Chief Executive Officer - focuses on overall strategy and leadership."""
+
+    seat = CEO_SEAT
+
+
+class CTOExecutive(AIExecutive):
+    """Chief Technology Officer - focuses on technology and innovation."""
+
+    seat = CTO_SEAT
+
+
+class CMOExecutive(AIExecutive):
+    """Chief Marketing Officer - focuses on marketing and customer experience."""
+
+    seat = CMO_SEAT
 
 
 class CFOExecutive(AIExecutive):
     """Chief Financial Officer - focuses on financial impact and risk."""
 
-    def get_opinion(self, state: CompanyState) -> ExecutiveOpinion:
-        """Get CFO's financial opinion."""
-        decision = state["decision_details"]
-        metrics = state["metrics"]
-
-        prompt = f"""You are the CFO of {state["company_name"]}, a {state["company_size"]} company in the {state["industry"]} industry.
-        
-        Current Financial Metrics:
-        - Revenue: ${metrics["revenue"]:,}
-        - Expenses: ${metrics["expenses"]:,}
-        - Profit: ${metrics["profit"]:,}
-        - Cash Flow: ${metrics["cash_flow"]:,}
-        
-        Decision Being Considered:
-        - Title: {decision["title"] if decision else "N/A"}
-        - Estimated Cost: ${decision["estimated_cost"]:,} if decision else 0
-        - Expected ROI: {decision["expected_roi"]:.1%} if decision else 0
-        - Risk Level: {decision["risk_level"] if decision else "N/A"}
-        
-        As CFO, analyze:
-        1. Financial impact and ROI projections
-        2. Budget implications and cash flow effects
-        3. Financial risk assessment
-        4. Cost-benefit analysis
-        5. Impact on financial KPIs and investor relations
-        
-        Provide your financial perspective with vote and priority score."""
-
-        messages = [
-            SystemMessage(content="You are an experienced CFO evaluating financial decisions."),
-            HumanMessage(content=prompt),
-        ]
+    seat = CFO_SEAT
 
-        response = self.llm.invoke(messages)
-        content = str(response.content or "")
 
-        opinion = content[:200] + "..." if len(content) > 200 else content
-        reasoning = "Financial analysis considering ROI, cash flow impact, and risk assessment."
-        vote = "abstain"
-        priority_score = 7  # CFO often has high priority on financial decisions
+# Executive class of each default seat, so e.g. the CFO is a CFOExecutive
+_ROLE_CLASSES: dict[str, type[AIExecutive]] = {
+    cls.seat.role: cls for cls in (CEOExecutive, CTOExecutive, CMOExecutive, CFOExecutive)
+}
 
-        if "approve" in content.lower():
-            vote = "approve"
-        elif "reject" in content.lower():
-            vote = "reject"
 
-        return ExecutiveOpinion(
-            role="CFO",
-            opinion=opinion,
-            reasoning=reasoning,
-            vote=vote,
-            priority_score=priority_score,
-        )
+def executive_class(seat: BoardSeat) -> type[AIExecutive]:
+    """Return the class of a seat's executive: its role's subclass, or ``AIExecutive``."""
+    return _ROLE_CLASSES.get(seat.role, AIExecutive)
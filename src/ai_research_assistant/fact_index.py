@@ -0,0 +1,187 @@
+"""Local near-duplicate index over research facts using MinHash signatures."""
+
+import hashlib
+import random
+import re
+import threading
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+_WORD_PATTERN = re.compile(r"\w+")
+_MERSENNE_PRIME = (1 << 61) - 1
+
+
+@dataclass
+class IndexedFact:
+    """A representative fact and the cluster of near-duplicates merged into it."""
+
+    text: str
+    topic: str  # Topic (e.g. the question) the fact was first collected for
+    signature: tuple[int, ...] = field(repr=False)
+    duplicates: int = 0  # Near-duplicate statements merged into this fact
+
+
+@dataclass
+class _Topic:
+    """Facts added under one topic and area, with the signatures they are matched by."""
+
+    signature: tuple[int, ...]
+    area_signature: tuple[int, ...]
+    fact_ids: list[int] = field(default_factory=list)
+    sources: set[str] = field(default_factory=set)  # Writers, e.g. research run ids
+
+
+class FactIndex:
+    """Thread-safe MinHash/LSH index deduplicating facts across research runs.
+
+    Texts are compared by the Jaccard similarity of their character shingles,
+    estimated from MinHash signatures and looked up through locality-sensitive
+    hashing bands, so adding a fact costs the same regardless of index size.
+    Everything runs locally; no embeddings or network calls are involved.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.7,
+        num_perm: int = 64,
+        band_rows: int = 4,
+        shingle_size: int = 4,
+        seed: int = 0,
+    ):
+        """Initialize the index.
+
+        Args:
+            threshold: Estimated Jaccard similarity from which two facts count
+                as duplicates.
+            num_perm: Number of MinHash permutations per signature.
+            band_rows: Signature rows per LSH band; fewer rows find more
+                candidates at lower similarity.
+            shingle_size: Length of the character shingles compared.
+            seed: Seed of the hash permutations.
+        """
+        if num_perm % band_rows:
+            raise ValueError("num_perm must be a multiple of band_rows")
+        self.threshold = threshold
+        self.band_rows = band_rows
+        self.shingle_size = shingle_size
+        rng = random.Random(seed)
+        self._permutations = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(_MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+        self._facts: list[IndexedFact] = []
+        self._buckets: defaultdict[tuple[int, tuple[int, ...]], list[int]] = defaultdict(list)
+        self._topics: dict[tuple[str, str], _Topic] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of distinct facts."""
+        return len(self._facts)
+
+    @property
+    def facts(self) -> list[IndexedFact]:
+        """All distinct facts in insertion order."""
+        return list(self._facts)
+
+    def add(self, text: str, topic: str = "", area: str = "", source: str = "") -> str:
+        """Add a fact and return its representative text.
+
+        If a near-duplicate is already indexed, the fact joins its cluster and
+        the existing text is returned; otherwise ``text`` itself is indexed
+        under ``topic`` and returned. ``area`` narrows the topic (e.g. one
+        investigation area of a question) and ``source`` names the writer,
+        so that ``facts_for`` can leave out its own facts.
+        """
+        signature = self.signature(text)
+        with self._lock:
+            match = self._find(signature)
+            if match is None:
+                match = len(self._facts)
+                self._facts.append(IndexedFact(text, topic, signature))
+                for band in self._bands(signature):
+                    self._buckets[band].append(match)
+            else:
+                self._facts[match].duplicates += 1
+            if topic:
+                entry = self._topics.get((topic, area))
+                if entry is None:
+                    entry = self._topics[topic, area] = _Topic(
+                        self.signature(topic), self.signature(area)
+                    )
+                if match not in entry.fact_ids:
+                    entry.fact_ids.append(match)
+                if source:
+                    entry.sources.add(source)
+            return self._facts[match].text
+
+    def dedupe(
+        self, texts: list[str], topic: str = "", area: str = "", source: str = ""
+    ) -> list[str]:
+        """Add texts to the index and return their distinct representatives in order."""
+        representatives = dict.fromkeys(self.add(text, topic, area, source) for text in texts)
+        return list(representatives)
+
+    def facts_for(
+        self,
+        topic: str,
+        area: str = "",
+        min_similarity: float = 0.6,
+        exclude_source: str = "",
+    ) -> list[str]:
+        """Return facts previously added under a similar topic and a similar area.
+
+        Topic and area are scored separately, so a long shared question does
+        not make different areas match. Topics written by ``exclude_source``
+        are skipped.
+        """
+        signature = self.signature(topic)
+        area_signature = self.signature(area)
+        with self._lock:
+            fact_ids: dict[int, None] = {}
+            for entry in self._topics.values():
+                if exclude_source and exclude_source in entry.sources:
+                    continue
+                if (
+                    self.similarity(signature, entry.signature) >= min_similarity
+                    and self.similarity(area_signature, entry.area_signature) >= min_similarity
+                ):
+                    fact_ids.update(dict.fromkeys(entry.fact_ids))
+            return [self._facts[i].text for i in fact_ids]
+
+    def signature(self, text: str) -> tuple[int, ...]:
+        """Compute the MinHash signature of a text."""
+        hashes = [
+            int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=8).digest(), "big")
+            for shingle in self._shingles(text)
+        ]
+        return tuple(
+            min((a * h + b) % _MERSENNE_PRIME for h in hashes) for a, b in self._permutations
+        )
+
+    @staticmethod
+    def similarity(first: tuple[int, ...], second: tuple[int, ...]) -> float:
+        """Estimate the Jaccard similarity of two signatures."""
+        return sum(a == b for a, b in zip(first, second)) / len(first)
+
+    def _shingles(self, text: str) -> set[str]:
+        """Character shingles of the text, ignoring case, punctuation and spacing."""
+        normalized = " ".join(_WORD_PATTERN.findall(text.lower()))
+        if len(normalized) <= self.shingle_size:
+            return {normalized}
+        size = self.shingle_size
+        return {normalized[i : i + size] for i in range(len(normalized) - size + 1)}
+
+    def _bands(self, signature: tuple[int, ...]) -> list[tuple[int, tuple[int, ...]]]:
+        """Split a signature into LSH band keys."""
+        rows = self.band_rows
+        return [(i, signature[i : i + rows]) for i in range(0, len(signature), rows)]
+
+    def _find(self, signature: tuple[int, ...]) -> int | None:
+        """Return the id of the most similar indexed fact above the threshold."""
+        candidates = {i for band in self._bands(signature) for i in self._buckets.get(band, [])}
+        best, best_similarity = None, self.threshold
+        for i in sorted(candidates):
+            similarity = self.similarity(signature, self._facts[i].signature)
+            if similarity >= best_similarity:
+                best, best_similarity = i, similarity
+        return best
@@ -0,0 +1,281 @@
+"""Deterministic offline chat model for tests and benchmarks."""
+
+import asyncio
+import hashlib
+import json
+import random
+import re
+import time
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
+
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForLLMRun,
+    CallbackManagerForLLMRun,
+)
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.messages.ai import UsageMetadata
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+from .prompts import count_tokens
+
+# Role named in a board member's brief, e.g. "You are the CFO, ..."
+_EXECUTIVE_PATTERN = re.compile(r"\byou are the ([a-z][a-z0-9_]*)\b")
+
+# (marker in the lowercased prompt, canned response kind), checked in order
+_RESPONSE_RULES = [
+    ("implementation plan", "plan"),
+    ("research planning expert", "research_plan"),
+    ("information collection expert", "collection"),
+    ("research summarizer", "summary"),
+    ("research analyst", "analysis"),
+    ("report writer", "report"),
+]
+
+_CANNED_RESPONSES = {
+    "plan": (
+        "1. Milestones: discovery in month one, pilot in month three, rollout by the deadline.\n"
+        "2. Resources: a cross-functional team of five with a dedicated project lead.\n"
+        "3. Success metrics: adoption rate, cost savings and customer satisfaction.\n"
+        "4. Risks: vendor delays and integration issues, mitigated by phased delivery.\n"
+        "5. Owners: CTO for delivery, CFO for budget, CMO for communication."
+    ),
+    "research_plan": (
+        "1. Market adoption: growth rates, leading use cases and barriers.\n"
+        "2. Technical maturity: capabilities, limitations and costs.\n"
+        "3. Regulation: current rules and guidance being drafted.\n"
+        "Approach: literature review, industry reports and expert interviews, aiming for "
+        "a balanced view of opportunities and risks."
+    ),
+    "collection": (
+        "- Adoption has grown steadily over the last three years.\n"
+        "- Leading vendors report double-digit annual revenue growth.\n"
+        "- Regulators are drafting guidance on safety and transparency.\n"
+        "- Experts disagree on how quickly costs will fall.\n"
+        "- Several pilot studies show measurable efficiency gains."
+    ),
+    "summary": (
+        "- Adoption is growing steadily, driven by measurable efficiency gains.\n"
+        "- Cost trends and upcoming regulation remain uncertain."
+    ),
+    "analysis": (
+        "The collected information points to steady adoption driven by efficiency gains. "
+        "Evidence is strongest for operational benefits and weakest for long-term cost "
+        "trends. Regulatory uncertainty is the main open question and deserves more research."
+    ),
+    "report": (
+        "Executive Summary: adoption is growing and benefits are measurable.\n"
+        "Methodology: review of studies, reports and expert opinions.\n"
+        "Key Findings: efficiency gains are consistent across pilots.\n"
+        "Conclusions: the trend is likely to continue as costs fall.\n"
+        "Recommendations: monitor regulation and track long-term cost data."
+    ),
+    "generic": "Acknowledged. Here is a concise response to the request.",
+}
+
+
+class FakeChatModel(BaseChatModel):
+    """Chat model returning canned, role-specific responses without network access.
+
+    Responses, votes and latencies are derived from a hash of the prompt and
+    ``seed``, so identical prompts always produce identical results. Latency
+    is lognormally distributed around ``latency_seconds`` (``latency_sigma``
+    of 0 makes it fixed), followed by ``output_tokens_per_second`` generation
+    time if set. Executive opinions are JSON when a ``response_format`` is
+    requested and "Opinion/Reasoning/Vote/Priority" lines otherwise. Like the
+    OpenAI ``n`` parameter, ``n`` returns several differently sampled
+    completions of one prompt in a single call.
+    """
+
+    model_name: str = "fake-board-model"
+    temperature: float = 0.7
+    seed: int = 0
+    latency_seconds: float = 0.0
+    latency_sigma: float = 0.0
+    output_tokens_per_second: float | None = None
+    approve_probability: float = 0.6
+    votes: dict[str, str] = {}  # Fixed vote per role, e.g. {"CFO": "reject"}
+    max_tokens: int | None = None  # Truncates responses like a provider's output limit
+    n: int = 1  # Completions per request
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-board"
+
+    @property
+    def _identifying_params(self) -> dict[str, Any]:
+        return {
+            "model_name": self.model_name,
+            "temperature": self.temperature,
+            "seed": self.seed,
+            "max_tokens": self.max_tokens,
+            "n": self.n,
+        }
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        generations, delay = self._sample(messages, **kwargs)
+        time.sleep(delay)
+        return ChatResult(generations=generations)
+
+    async def _agenerate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        generations, delay = self._sample(messages, **kwargs)
+        await asyncio.sleep(delay)
+        return ChatResult(generations=generations)
+
+    def _stream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> Iterator[ChatGenerationChunk]:
+        message, _ = self._respond(messages, **kwargs)
+        time.sleep(self._first_token_delay(messages))
+        for chunk in self._chunks(message):
+            if run_manager:
+                run_manager.on_llm_new_token(str(chunk.message.content), chunk=chunk)
+            yield chunk
+            time.sleep(self._token_delay())
+
+    async def _astream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        message, _ = self._respond(messages, **kwargs)
+        await asyncio.sleep(self._first_token_delay(messages))
+        for chunk in self._chunks(message):
+            if run_manager:
+                await run_manager.on_llm_new_token(str(chunk.message.content), chunk=chunk)
+            yield chunk
+            await asyncio.sleep(self._token_delay())
+
+    def _sample(
+        self, messages: list[BaseMessage], n: int | None = None, **kwargs: Any
+    ) -> tuple[list[ChatGeneration], float]:
+        """Build ``n`` completions of one request and the request's latency."""
+        responses = [self._respond(messages, sample=i, **kwargs) for i in range(n or self.n)]
+        return [ChatGeneration(message=message) for message, _ in responses], responses[0][1]
+
+    def _respond(
+        self, messages: list[BaseMessage], sample: int = 0, **kwargs: Any
+    ) -> tuple[AIMessage, float]:
+        """Build the deterministic response and its total latency.
+
+        Later ``sample`` indexes draw the response from a differently seeded
+        generator, so completions of one request differ like sampled outputs.
+        """
+        prompt = _prompt_text(messages)
+        rng = self._rng(prompt if sample == 0 else f"{prompt}#sample{sample}")
+        content = self._content(prompt, rng, structured="response_format" in kwargs)
+        if self.max_tokens is not None:
+            content = content[: self.max_tokens * 4]
+        usage = UsageMetadata(
+            input_tokens=count_tokens(prompt),
+            output_tokens=count_tokens(content),
+            total_tokens=count_tokens(prompt) + count_tokens(content),
+        )
+        message = AIMessage(
+            content=content,
+            usage_metadata=usage,
+            response_metadata={"model_name": self.model_name},
+        )
+        delay = self._first_token_delay(messages) + self._token_delay() * usage["output_tokens"]
+        return message, delay
+
+    def _content(self, prompt: str, rng: random.Random, structured: bool = False) -> str:
+        """Pick the canned response for the prompt."""
+        lowered = prompt.lower()
+        for marker, kind in _RESPONSE_RULES:
+            if marker in lowered:
+                return _CANNED_RESPONSES[kind]
+
+        executive = _EXECUTIVE_PATTERN.search(lowered)
+        if executive:
+            return self._opinion(executive.group(1).upper(), rng, structured)
+        return _CANNED_RESPONSES["generic"]
+
+    def _opinion(self, role: str, rng: random.Random, structured: bool) -> str:
+        """Build a parseable executive opinion, as JSON when structured output is requested."""
+        vote = self.votes.get(role) or (
+            "approve" if rng.random() < self.approve_probability else "reject"
+        )
+        priority = rng.randint(3, 9)
+        stance = "supports" if vote == "approve" else "has concerns about"
+        opinion = f"The {role} {stance} this proposal given the current company position."
+        reasoning = (
+            f"From the {role} perspective the expected return is weighed against "
+            "execution risk, budget impact and strategic fit."
+        )
+        if structured:
+            return json.dumps(
+                {
+                    "opinion": opinion,
+                    "reasoning": reasoning,
+                    "vote": vote,
+                    "priority_score": priority,
+                }
+            )
+        return f"Opinion: {opinion}\nReasoning: {reasoning}\nVote: {vote}\nPriority: {priority}"
+
+    def _rng(self, prompt: str) -> random.Random:
+        """Random generator seeded by the prompt, for deterministic outputs."""
+        digest = hashlib.sha256(f"{self.seed}:{prompt}".encode()).digest()
+        return random.Random(int.from_bytes(digest[:8], "big"))
+
+    def _first_token_delay(self, messages: list[BaseMessage]) -> float:
+        """Sample the time to first token for a prompt."""
+        if self.latency_seconds <= 0:
+            return 0.0
+        rng = self._rng("latency:" + _prompt_text(messages))
+        return self.latency_seconds * rng.lognormvariate(0.0, self.latency_sigma)
+
+    def _token_delay(self) -> float:
+        """Time spent generating each output token."""
+        return 1.0 / self.output_tokens_per_second if self.output_tokens_per_second else 0.0
+
+    def _chunks(self, message: AIMessage) -> Iterator[ChatGenerationChunk]:
+        """Split a response into word-sized streaming chunks."""
+        words = re.findall(r"\S+\s*", str(message.content))
+        for i, word in enumerate(words):
+            usage = message.usage_metadata if i == len(words) - 1 else None
+            yield ChatGenerationChunk(message=AIMessageChunk(content=word, usage_metadata=usage))
+
+
+class FakeLLMBackend:
+    """LLM backend producing ``FakeChatModel`` instances; needs no API key."""
+
+    requires_api_key = False
+
+    def __init__(self, **model_options: Any):
+        """Initialize the backend with options applied to every fake model."""
+        self.model_options = model_options
+
+    def create_chat_model(
+        self, registry: Any, api_key: str | None, model: str, temperature: float, **kwargs: Any
+    ) -> BaseChatModel:
+        """Create a fake chat model for the given configuration."""
+        options = {**self.model_options, **kwargs}
+        return FakeChatModel(
+            model_name=model, temperature=temperature, cache=registry.cache, **options
+        )
+
+
+def _prompt_text(messages: list[BaseMessage]) -> str:
+    """Concatenate message contents into one prompt string."""
+    return "\n".join(str(message.content) for message in messages)
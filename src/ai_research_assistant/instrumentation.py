@@ -0,0 +1,421 @@
+"""Per-node latency and token instrumentation for the LangGraph workflows."""
+
+import os
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Sequence
+from typing import Any, TypedDict, cast
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+from langchain_core.runnables import RunnableConfig
+
+from .resilience import RETRY_EVENT
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+Labels = tuple[tuple[str, str], ...]
+
+
+class NodeSpan(TypedDict):
+    """Timing and usage of a single node execution within a run."""
+
+    node: str
+    start_time: float  # Unix timestamp at which the node started
+    wall_seconds: float
+    queue_seconds: float  # Wait since the run started or the previous node finished
+    llm_seconds: float  # Time spent inside LLM calls
+    llm_calls: int
+    prompt_tokens: int  # Tokens sent to the API; cache hits are not counted
+    completion_tokens: int
+    retries: int
+    cache_hits: int
+    error: str | None
+
+
+class Histogram:
+    """Cumulative histogram with fixed upper bounds, as used by Prometheus."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """Initialize an empty histogram with the given bucket upper bounds."""
+        self.buckets = tuple(sorted(buckets))
+        self.bucket_counts = [0] * len(self.buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        self.count += 1
+        self.sum += value
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.bucket_counts[i] += 1
+
+    @property
+    def mean(self) -> float:
+        """Mean of all observations."""
+        return self.sum / self.count if self.count else 0.0
+
+
+class Instrumentation:
+    """Aggregates per-run node traces into histograms and counters.
+
+    Pass an instance to ``ResearchAssistant`` or ``VirtualCompanySimulator`` to
+    trace every run; the per-run trace is returned on the final state under
+    ``trace`` and the aggregates can be exported with ``to_prometheus``.
+    Without an instance no callbacks are attached, so there is no overhead.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS, namespace: str = "workflow"):
+        """Initialize the aggregator.
+
+        Args:
+            buckets: Upper bounds in seconds for the latency histograms.
+            namespace: Prefix for exported metric names.
+        """
+        self.buckets = tuple(buckets)
+        self.namespace = namespace
+        self._lock = threading.Lock()
+        self._histograms: dict[str, dict[Labels, Histogram]] = defaultdict(dict)
+        self._counters: dict[str, dict[Labels, float]] = defaultdict(lambda: defaultdict(float))
+
+    def tracer(self, workflow: str) -> "RunTracer":
+        """Create a tracer for one run that reports back into this aggregator."""
+        return RunTracer(workflow, self)
+
+    def record(self, workflow: str, spans: list[NodeSpan]) -> None:
+        """Add the spans of one completed run to the aggregates."""
+        with self._lock:
+            self._counters["runs_total"][(("workflow", workflow),)] += 1
+            for span in spans:
+                labels = (("workflow", workflow), ("node", span["node"]))
+                self._observe("node_duration_seconds", labels, span["wall_seconds"])
+                self._observe("node_queue_seconds", labels, span["queue_seconds"])
+                self._observe("node_llm_seconds", labels, span["llm_seconds"])
+                tokens = self._counters["node_tokens_total"]
+                tokens[labels + (("kind", "prompt"),)] += span["prompt_tokens"]
+                tokens[labels + (("kind", "completion"),)] += span["completion_tokens"]
+                self._counters["node_llm_calls_total"][labels] += span["llm_calls"]
+                self._counters["node_retries_total"][labels] += span["retries"]
+                self._counters["node_cache_hits_total"][labels] += span["cache_hits"]
+                self._counters["node_errors_total"][labels] += span["error"] is not None
+
+    def node_means(self, workflow: str) -> dict[str, float]:
+        """Return the mean wall time in seconds of each node of a workflow."""
+        with self._lock:
+            return {
+                dict(labels)["node"]: histogram.mean
+                for labels, histogram in self._histograms["node_duration_seconds"].items()
+                if dict(labels)["workflow"] == workflow
+            }
+
+    def reset(self) -> None:
+        """Discard all aggregated measurements."""
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+
+    def to_prometheus(self) -> str:
+        """Render the aggregates in the Prometheus text exposition format."""
+        lines: list[str] = []
+        with self._lock:
+            for name, series in sorted(self._histograms.items()):
+                metric = f"{self.namespace}_{name}"
+                lines.append(f"# TYPE {metric} histogram")
+                for labels, histogram in sorted(series.items()):
+                    for bound, count in zip(histogram.buckets, histogram.bucket_counts):
+                        le = (*labels, ("le", _format_number(bound)))
+                        lines.append(f"{metric}_bucket{_format_labels(le)} {count}")
+                    inf = (*labels, ("le", "+Inf"))
+                    lines.append(f"{metric}_bucket{_format_labels(inf)} {histogram.count}")
+                    lines.append(f"{metric}_sum{_format_labels(labels)} {histogram.sum}")
+                    lines.append(f"{metric}_count{_format_labels(labels)} {histogram.count}")
+            for name, counter_series in sorted(self._counters.items()):
+                metric = f"{self.namespace}_{name}"
+                lines.append(f"# TYPE {metric} counter")
+                for labels, value in sorted(counter_series.items()):
+                    lines.append(f"{metric}{_format_labels(labels)} {_format_number(value)}")
+        return "\n".join(lines) + "\n"
+
+    def _observe(self, name: str, labels: Labels, value: float) -> None:
+        """Record a histogram observation; the caller holds the lock."""
+        series = self._histograms[name]
+        if labels not in series:
+            series[labels] = Histogram(self.buckets)
+        series[labels].observe(value)
+
+
+class RunTracer(BaseCallbackHandler):
+    """Callback recording a ``NodeSpan`` for every node executed in one run.
+
+    LLM calls, retries and cache hits are attributed to the node whose run
+    they descend from. Cache hits are recognised by the zero ``total_cost``
+    that LangChain adds to the usage of cached responses.
+    """
+
+    run_inline = True  # Keep timings accurate by not deferring to a thread pool
+
+    def __init__(self, workflow: str, instrumentation: Instrumentation | None = None):
+        """Initialize the tracer.
+
+        Args:
+            workflow: Workflow name used in exported metrics and spans.
+            instrumentation: Aggregator to report to when the run finishes.
+        """
+        self.workflow = workflow
+        self.instrumentation = instrumentation
+        self.trace_id = os.urandom(16).hex()
+        self.start_time = time.time()
+        self._start_perf = time.perf_counter()
+        self._last_end = self._start_perf
+        self._lock = threading.Lock()
+        self._spans: dict[UUID, NodeSpan] = {}
+        self._span_starts: dict[UUID, float] = {}
+        self._run_to_span: dict[UUID, UUID] = {}
+        self._llm_starts: dict[UUID, float] = {}
+
+    @property
+    def spans(self) -> list[NodeSpan]:
+        """Spans recorded so far, in start order."""
+        with self._lock:
+            return sorted(self._spans.values(), key=lambda span: span["start_time"])
+
+    def finish(self, state: Any) -> Any:
+        """Report the run to the aggregator and return ``state`` with its trace."""
+        spans = self.spans
+        if self.instrumentation is not None:
+            self.instrumentation.record(self.workflow, spans)
+        return {**state, "trace": spans}
+
+    def otel_spans(self) -> list[dict]:
+        """Return the run trace as OpenTelemetry-compatible span dicts."""
+        return to_otel_spans(self.workflow, self.spans, self.trace_id)
+
+    def on_chain_start(
+        self,
+        serialized: dict[str, Any] | None,
+        inputs: Any,
+        *,
+        run_id: UUID,
+        parent_run_id: UUID | None = None,
+        metadata: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Open a span for node runs and attribute nested runs to their node."""
+        node = (metadata or {}).get("langgraph_node")
+        now = time.perf_counter()
+        with self._lock:
+            if node and kwargs.get("name") == node:
+                self._spans[run_id] = NodeSpan(
+                    node=node,
+                    start_time=self.start_time + (now - self._start_perf),
+                    wall_seconds=0.0,
+                    queue_seconds=now - self._last_end,
+                    llm_seconds=0.0,
+                    llm_calls=0,
+                    prompt_tokens=0,
+                    completion_tokens=0,
+                    retries=0,
+                    cache_hits=0,
+                    error=None,
+                )
+                self._span_starts[run_id] = now
+                self._run_to_span[run_id] = run_id
+            else:
+                self._link(run_id, parent_run_id)
+
+    def on_chain_end(self, outputs: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        """Close the span of a finished node run."""
+        error = outputs.get("error_message") if isinstance(outputs, dict) else None
+        self._close(run_id, error)
+
+    def on_chain_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        """Close the span of a failed node run."""
+        self._close(run_id, str(error))
+
+    def on_chat_model_start(
+        self,
+        serialized: dict[str, Any],
+        messages: list[list[Any]],
+        *,
+        run_id: UUID,
+        parent_run_id: UUID | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Start timing a chat model call."""
+        self._llm_start(run_id, parent_run_id)
+
+    def on_llm_start(
+        self,
+        serialized: dict[str, Any],
+        prompts: list[str],
+        *,
+        run_id: UUID,
+        parent_run_id: UUID | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Start timing a completion model call."""
+        self._llm_start(run_id, parent_run_id)
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        """Add the call's latency, token usage and cache status to its node."""
+        now = time.perf_counter()
+        with self._lock:
+            span = self._span_for(run_id)
+            started = self._llm_starts.pop(run_id, None)
+            if span is None:
+                return
+            if started is not None:
+                span["llm_seconds"] += now - started
+            prompt_tokens, completion_tokens, cached = _usage(response)
+            if cached:
+                span["cache_hits"] += 1
+            else:
+                span["prompt_tokens"] += prompt_tokens
+                span["completion_tokens"] += completion_tokens
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        """Count the time of a failed LLM call."""
+        self.on_llm_end(LLMResult(generations=[]), run_id=run_id)
+
+    def on_retry(self, retry_state: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        """Count a retry against the node it happened in."""
+        with self._lock:
+            span = self._span_for(run_id)
+            if span is not None:
+                span["retries"] += 1
+
+    def on_custom_event(self, name: str, data: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        """Count retries reported by the resilience layer against their node."""
+        if name == RETRY_EVENT:
+            self.on_retry(data, run_id=run_id)
+
+    def _llm_start(self, run_id: UUID, parent_run_id: UUID | None) -> None:
+        """Attribute an LLM call to its node and start timing it."""
+        with self._lock:
+            self._link(run_id, parent_run_id)
+            span = self._span_for(run_id)
+            if span is not None:
+                span["llm_calls"] += 1
+                self._llm_starts[run_id] = time.perf_counter()
+
+    def _close(self, run_id: UUID, error: str | None) -> None:
+        """Finish a node span, or drop the bookkeeping of a nested run."""
+        now = time.perf_counter()
+        with self._lock:
+            started = self._span_starts.pop(run_id, None)
+            if started is None:
+                return
+            span = self._spans[run_id]
+            span["wall_seconds"] = now - started
+            span["error"] = error
+            self._last_end = max(self._last_end, now)
+
+    def _link(self, run_id: UUID, parent_run_id: UUID | None) -> None:
+        """Map a nested run to its node span; the caller holds the lock."""
+        if parent_run_id is not None and parent_run_id in self._run_to_span:
+            self._run_to_span[run_id] = self._run_to_span[parent_run_id]
+
+    def _span_for(self, run_id: UUID) -> NodeSpan | None:
+        """Return the node span a run belongs to; the caller holds the lock."""
+        span_id = self._run_to_span.get(run_id)
+        return self._spans.get(span_id) if span_id is not None else None
+
+
+def to_otel_spans(workflow: str, spans: list[NodeSpan], trace_id: str | None = None) -> list[dict]:
+    """Convert a run trace into OpenTelemetry-compatible span dicts.
+
+    The result contains a root span for the whole run followed by one child
+    span per node, using the OTLP JSON field names and ``gen_ai`` semantic
+    convention attributes for token usage.
+    """
+    trace_id = trace_id or os.urandom(16).hex()
+    root_id = os.urandom(8).hex()
+    start = min((span["start_time"] for span in spans), default=time.time())
+    end = max((span["start_time"] + span["wall_seconds"] for span in spans), default=start)
+    result = [
+        {
+            "traceId": trace_id,
+            "spanId": root_id,
+            "name": workflow,
+            "startTimeUnixNano": _nanos(start),
+            "endTimeUnixNano": _nanos(end),
+            "attributes": {"workflow.name": workflow},
+            "status": {"code": "OK"},
+        }
+    ]
+    for span in spans:
+        result.append(
+            {
+                "traceId": trace_id,
+                "spanId": os.urandom(8).hex(),
+                "parentSpanId": root_id,
+                "name": span["node"],
+                "startTimeUnixNano": _nanos(span["start_time"]),
+                "endTimeUnixNano": _nanos(span["start_time"] + span["wall_seconds"]),
+                "attributes": {
+                    "workflow.name": workflow,
+                    "langgraph.node": span["node"],
+                    "langgraph.queue_seconds": span["queue_seconds"],
+                    "gen_ai.client.operation.duration": span["llm_seconds"],
+                    "gen_ai.usage.input_tokens": span["prompt_tokens"],
+                    "gen_ai.usage.output_tokens": span["completion_tokens"],
+                    "llm.calls": span["llm_calls"],
+                    "llm.retries": span["retries"],
+                    "llm.cache_hits": span["cache_hits"],
+                },
+                "status": (
+                    {"code": "ERROR", "message": span["error"]} if span["error"] else {"code": "OK"}
+                ),
+            }
+        )
+    return result
+
+
+def with_callback(config: RunnableConfig | None, callback: Any) -> RunnableConfig | None:
+    """Return a copy of ``config`` with an extra callback handler attached.
+
+    ``config`` is returned unchanged when ``callback`` is None.
+    """
+    if callback is None:
+        return config
+    merged = RunnableConfig(**(config or {}))
+    merged["callbacks"] = [*cast(list[Any], merged.get("callbacks") or []), callback]
+    return merged
+
+
+def _usage(response: LLMResult) -> tuple[int, int, bool]:
+    """Extract prompt tokens, completion tokens and cache status from an LLM result."""
+    for generations in response.generations:
+        for generation in generations:
+            usage = getattr(getattr(generation, "message", None), "usage_metadata", None)
+            if usage:
+                cached = usage.get("total_cost", None) == 0
+                return usage.get("input_tokens", 0), usage.get("output_tokens", 0), cached
+    token_usage = (response.llm_output or {}).get("token_usage") or {}
+    return token_usage.get("prompt_tokens", 0), token_usage.get("completion_tokens", 0), False
+
+
+def _format_labels(labels: Labels) -> str:
+    """Render Prometheus label pairs."""
+    if not labels:
+        return ""
+    pairs = (f'{key}="{_escape_label(value)}"' for key, value in labels)
+    return "{" + ",".join(pairs) + "}"
+
+
+def _escape_label(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_number(value: float) -> str:
+    """Render a number without a trailing ``.0`` for integral values."""
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def _nanos(seconds: float) -> int:
+    """Convert a Unix timestamp in seconds to nanoseconds."""
+    return int(seconds * 1_000_000_000)
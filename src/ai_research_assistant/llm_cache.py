@@ -0,0 +1,264 @@
+"""Content-addressed cache for LLM responses with pluggable storage backends."""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Protocol
+
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
+from langchain_core.messages import message_to_dict, messages_from_dict
+from langchain_core.outputs import ChatGeneration, Generation
+
+
+class CacheBackend(Protocol):
+    """Storage for serialized cache entries keyed by content hash."""
+
+    def get(self, key: str) -> tuple[str, float] | None:
+        """Return the stored payload and its creation time, if present."""
+        ...
+
+    def set(self, key: str, payload: str, created_at: float) -> None:
+        """Store a payload, evicting old entries if the backend is full."""
+        ...
+
+    def delete(self, key: str) -> None:
+        """Remove an entry if present."""
+        ...
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        ...
+
+    def __len__(self) -> int:
+        """Return the number of stored entries."""
+        ...
+
+
+class InMemoryLRUBackend:
+    """Thread-safe in-memory backend evicting the least recently used entries."""
+
+    def __init__(self, max_entries: int | None = 1024):
+        """Initialize the backend.
+
+        Args:
+            max_entries: Maximum number of entries kept, or None for unbounded.
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> tuple[str, float] | None:
+        """Return the stored payload and its creation time, if present."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, payload: str, created_at: float) -> None:
+        """Store a payload, evicting the least recently used entries if full."""
+        with self._lock:
+            self._entries[key] = (payload, created_at)
+            self._entries.move_to_end(key)
+            if self.max_entries is not None:
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """Remove an entry if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return the number of stored entries."""
+        return len(self._entries)
+
+
+class SQLiteBackend:
+    """On-disk backend persisting entries in a SQLite database file."""
+
+    def __init__(self, path: str | Path, max_entries: int | None = 100_000):
+        """Initialize the backend, creating the database if needed.
+
+        Args:
+            path: Database file path, or ":memory:".
+            max_entries: Maximum number of entries kept, or None for unbounded.
+                The least recently used entries are evicted first.
+        """
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS llm_cache (
+                    key TEXT PRIMARY KEY,
+                    payload TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )"""
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS llm_cache_accessed ON llm_cache (accessed_at)"
+            )
+
+    def get(self, key: str) -> tuple[str, float] | None:
+        """Return the stored payload and its creation time, if present."""
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT payload, created_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                self._conn.execute(
+                    "UPDATE llm_cache SET accessed_at = ? WHERE key = ?", (time.time(), key)
+                )
+            return (row[0], row[1]) if row else None
+
+    def set(self, key: str, payload: str, created_at: float) -> None:
+        """Store a payload, evicting the least recently used entries if full."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache VALUES (?, ?, ?, ?)",
+                (key, payload, created_at, time.time()),
+            )
+            if self.max_entries is not None:
+                self._conn.execute(
+                    """DELETE FROM llm_cache WHERE key IN (
+                        SELECT key FROM llm_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+                    )""",
+                    (self.max_entries,),
+                )
+
+    def delete(self, key: str) -> None:
+        """Remove an entry if present."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM llm_cache")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        """Return the number of stored entries."""
+        with self._lock:
+            return int(self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0])
+
+
+class LLMResponseCache(BaseCache):
+    """LangChain cache keyed on a hash of the model settings and prompt messages.
+
+    ``llm_string`` carries the model name, temperature and other call options,
+    and ``prompt`` the serialized system and human messages, so identical
+    requests map to the same entry regardless of which executive or node sends
+    them. Pass an instance as ``cache`` to ``LLMClientRegistry``.
+    """
+
+    def __init__(self, backend: CacheBackend | None = None, ttl_seconds: float | None = None):
+        """Initialize the cache.
+
+        Args:
+            backend: Storage backend. Defaults to an in-memory LRU backend.
+            ttl_seconds: Entries older than this are treated as misses and evicted.
+        """
+        self.backend: CacheBackend = backend if backend is not None else InMemoryLRUBackend()
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._stats_lock = threading.Lock()
+
+    @staticmethod
+    def make_key(prompt: str, llm_string: str) -> str:
+        """Return the content hash identifying a request."""
+        return hashlib.sha256(f"{llm_string}\x00{prompt}".encode()).hexdigest()
+
+    def lookup(self, prompt: str, llm_string: str) -> RETURN_VAL_TYPE | None:
+        """Return cached generations for the request, if fresh."""
+        key = self.make_key(prompt, llm_string)
+        entry = self.backend.get(key)
+        if entry is not None and self._is_expired(entry[1]):
+            self.backend.delete(key)
+            entry = None
+
+        with self._stats_lock:
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return _loads_generations(entry[0]) if entry else None
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        """Store generations for the request."""
+        key = self.make_key(prompt, llm_string)
+        self.backend.set(key, _dumps_generations(return_val), time.time())
+
+    def clear(self, **kwargs: Any) -> None:
+        """Remove every entry and reset the counters."""
+        self.backend.clear()
+        with self._stats_lock:
+            self.hits = 0
+            self.misses = 0
+
+    async def alookup(self, prompt: str, llm_string: str) -> RETURN_VAL_TYPE | None:
+        """Return cached generations; local backends are fast enough to call inline."""
+        return self.lookup(prompt, llm_string)
+
+    async def aupdate(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        """Store generations; local backends are fast enough to call inline."""
+        self.update(prompt, llm_string, return_val)
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict[str, float]:
+        """Return hit/miss counters and the current number of entries."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "entries": len(self.backend),
+        }
+
+    def _is_expired(self, created_at: float) -> bool:
+        """Check whether an entry has outlived the TTL."""
+        return self.ttl_seconds is not None and time.time() - created_at > self.ttl_seconds
+
+
+def _dumps_generations(generations: RETURN_VAL_TYPE) -> str:
+    """Serialize generations to JSON."""
+    return json.dumps(
+        [
+            {"text": generation.text, "message": message_to_dict(generation.message)}
+            if isinstance(generation, ChatGeneration)
+            else {"text": generation.text}
+            for generation in generations
+        ]
+    )
+
+
+def _loads_generations(payload: str) -> RETURN_VAL_TYPE:
+    """Deserialize generations stored by ``_dumps_generations``."""
+    generations: list[Generation] = []
+    for item in json.loads(payload):
+        if "message" in item:
+            message = messages_from_dict([item["message"]])[0]
+            generations.append(ChatGeneration(message=message))
+        else:
+            generations.append(Generation(text=item["text"]))
+    return generations
@@ -0,0 +1,209 @@
+"""Shared, pooled LLM clients for executives, simulators and the research assistant."""
+
+import asyncio
+import threading
+from collections.abc import Hashable
+from typing import Any, Protocol
+
+import httpx
+from langchain_core.caches import BaseCache
+from langchain_core.language_models import BaseChatModel
+from pydantic import SecretStr
+
+DEFAULT_MODEL = "gpt-4o-mini"
+
+
+class LLMBackend(Protocol):
+    """Creates the chat models handed out by an ``LLMClientRegistry``."""
+
+    requires_api_key: bool
+
+    def create_chat_model(
+        self,
+        registry: "LLMClientRegistry",
+        api_key: str | None,
+        model: str,
+        temperature: float,
+        **kwargs: Any,
+    ) -> BaseChatModel:
+        """Create a chat model using the registry's shared resources."""
+        ...
+
+
+class OpenAIBackend:
+    """Backend creating ``ChatOpenAI`` models on the registry's pooled transport."""
+
+    requires_api_key = True
+
+    def create_chat_model(
+        self,
+        registry: "LLMClientRegistry",
+        api_key: str | None,
+        model: str,
+        temperature: float,
+        **kwargs: Any,
+    ) -> BaseChatModel:
+        """Create a ChatOpenAI model sharing the registry's HTTP clients and cache."""
+        # Imported on first use: loading the OpenAI SDK takes about as long as the
+        # rest of the package, and the fake backend or a warm cache never need it
+        from langchain_openai import ChatOpenAI
+
+        # Retries are handled by the workflows' RetryPolicy, not the OpenAI client
+        kwargs.setdefault("max_retries", 0)
+        return ChatOpenAI(
+            model=model,
+            api_key=SecretStr(api_key) if api_key else None,
+            temperature=temperature,
+            http_client=registry.http_client,
+            http_async_client=registry.http_async_client,
+            cache=registry.cache,
+            **kwargs,
+        )
+
+
+class LoopLocalAsyncTransport(httpx.AsyncBaseTransport):
+    """Async transport keeping a separate connection pool for each event loop.
+
+    Pooled connections belong to the loop that opened them, so one shared
+    ``httpx.AsyncClient`` would fail with "Event loop is closed" once e.g. a
+    second ``asyncio.run`` reused them. Pools of closed loops are discarded.
+    """
+
+    def __init__(self, limits: httpx.Limits):
+        """Initialize the transport; pools are created per loop on first request."""
+        self.limits = limits
+        self._pools: dict[asyncio.AbstractEventLoop, httpx.AsyncHTTPTransport] = {}
+        self._lock = threading.Lock()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send the request over the running loop's connection pool."""
+        return await self._pool(asyncio.get_running_loop()).handle_async_request(request)
+
+    async def aclose(self) -> None:
+        """Close the running loop's connection pool."""
+        with self._lock:
+            pool = self._pools.pop(asyncio.get_running_loop(), None)
+        if pool is not None:
+            await pool.aclose()
+
+    def _pool(self, loop: asyncio.AbstractEventLoop) -> httpx.AsyncHTTPTransport:
+        """Return the loop's pool, creating it and dropping pools of closed loops."""
+        with self._lock:
+            pool = self._pools.get(loop)
+            if pool is None:
+                for closed in [other for other in self._pools if other.is_closed()]:
+                    del self._pools[closed]
+                pool = self._pools[loop] = httpx.AsyncHTTPTransport(limits=self.limits)
+            return pool
+
+
+class LLMClientRegistry:
+    """Factory handing out chat models that share one pooled HTTP transport.
+
+    Models are cached by API key, model name, temperature and any extra model
+    options, so constructing many simulators reuses the same client objects and
+    keep-alive connections instead of paying for new TLS handshakes each time.
+    The async client keeps one connection pool per event loop, so models can
+    be shared across successive ``asyncio.run`` calls.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        timeout: float = 60.0,
+        cache: BaseCache | None = None,
+        backend: LLMBackend | None = None,
+    ):
+        """Initialize the registry.
+
+        Args:
+            max_connections: Upper bound on concurrent connections in the pool.
+            max_keepalive_connections: Idle connections kept open for reuse.
+            keepalive_expiry: Seconds an idle connection is kept alive.
+            timeout: Default HTTP timeout in seconds.
+            cache: Optional response cache (e.g. ``LLMResponseCache``) attached to
+                every model handed out by the registry.
+            backend: Model backend. Defaults to OpenAI; pass ``FakeLLMBackend`` to
+                run fully offline.
+        """
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.timeout = timeout
+        self.cache = cache
+        self.backend: LLMBackend = backend or OpenAIBackend()
+        self._lock = threading.Lock()
+        self._models: dict[Hashable, BaseChatModel] = {}
+        self._http_client: httpx.Client | None = None
+        self._http_async_client: httpx.AsyncClient | None = None
+
+    def get_chat_model(
+        self,
+        api_key: str | None,
+        model: str = DEFAULT_MODEL,
+        temperature: float = 0.7,
+        **kwargs: Any,
+    ) -> BaseChatModel:
+        """Return the shared chat model for the given configuration."""
+        key = (api_key, model, temperature, tuple(sorted(kwargs.items())))
+        with self._lock:
+            chat_model = self._models.get(key)
+            if chat_model is None:
+                chat_model = self.backend.create_chat_model(
+                    self, api_key, model, temperature, **kwargs
+                )
+                self._models[key] = chat_model
+            return chat_model
+
+    def close(self) -> None:
+        """Close the pooled transports and forget all cached models."""
+        with self._lock:
+            if self._http_client is not None:
+                self._http_client.close()
+            self._http_client = None
+            # The async client cannot be closed synchronously; dropping it lets
+            # its connections be reclaimed once no model references it.
+            self._http_async_client = None
+            self._models.clear()
+
+    @property
+    def http_client(self) -> httpx.Client:
+        """Return the pooled sync HTTP client, creating it on first use."""
+        if self._http_client is None:
+            self._http_client = httpx.Client(limits=self.limits, timeout=self.timeout)
+        return self._http_client
+
+    @property
+    def http_async_client(self) -> httpx.AsyncClient:
+        """Return the async HTTP client, pooling connections per event loop."""
+        if self._http_async_client is None:
+            self._http_async_client = httpx.AsyncClient(
+                transport=LoopLocalAsyncTransport(self.limits), timeout=self.timeout
+            )
+        return self._http_async_client
+
+
+_default_registry: LLMClientRegistry | None = None
+_default_registry_lock = threading.Lock()
+
+
+def get_default_registry() -> LLMClientRegistry:
+    """Return the process-wide registry used when none is passed explicitly."""
+    global _default_registry
+    with _default_registry_lock:
+        if _default_registry is None:
+            _default_registry = LLMClientRegistry()
+        return _default_registry
+
+
+def set_default_registry(registry: LLMClientRegistry | None) -> None:
+    """Replace the process-wide registry; ``None`` resets it to a fresh one on next use."""
+    global _default_registry
+    with _default_registry_lock:
+        if _default_registry is not None and _default_registry is not registry:
+            _default_registry.close()
+        _default_registry = registry
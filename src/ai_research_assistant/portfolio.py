@@ -0,0 +1,144 @@
+"""Budget-constrained selection of the decisions worth putting to the board."""
+
+import math
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from typing import TypedDict
+
+from .company_state import CompanyMetrics, Decision
+
+# ROI a decision must clear by risk level before it creates value
+RISK_PREMIUMS = {"low": 0.0, "medium": 0.1, "high": 0.25}
+
+# Ranking of screening outcomes, most actionable first
+_STATUS_ORDER = ("selected", "marginal", "unaffordable", "unprofitable")
+
+
+class RankedDecision(TypedDict):
+    """A candidate decision with its screening outcome."""
+
+    index: int  # Position among the submitted candidates
+    decision: Decision
+    cost: int
+    value: float  # Risk-adjusted return: cost * (expected ROI - risk premium)
+    status: str  # "selected", "marginal", "unaffordable" or "unprofitable"
+
+
+@dataclass
+class PortfolioSelection:
+    """Candidates ranked by status, then by risk-adjusted value per unit of cost."""
+
+    budget: int
+    ranked: list[RankedDecision]
+
+    @property
+    def selected(self) -> list[RankedDecision]:
+        """The most valuable set of decisions fitting the budget together."""
+        return self._with_status("selected")
+
+    @property
+    def marginal(self) -> list[RankedDecision]:
+        """Profitable decisions that fit the budget alone but not next to the selection."""
+        return self._with_status("marginal")
+
+    @property
+    def total_cost(self) -> int:
+        """Cost of the selected decisions."""
+        return sum(candidate["cost"] for candidate in self.selected)
+
+    @property
+    def total_value(self) -> float:
+        """Risk-adjusted value of the selected decisions."""
+        return sum(candidate["value"] for candidate in self.selected)
+
+    def _with_status(self, status: str) -> list[RankedDecision]:
+        """Ranked candidates with the given status."""
+        return [candidate for candidate in self.ranked if candidate["status"] == status]
+
+
+def select_portfolio(
+    decisions: Sequence[Decision],
+    metrics: CompanyMetrics,
+    budget: int | None = None,
+    risk_premiums: Mapping[str, float] | None = None,
+    resolution: int = 1000,
+) -> PortfolioSelection:
+    """Pick the decisions maximizing risk-adjusted value within the cash available.
+
+    Each decision is valued at ``estimated_cost * (expected_roi - premium)``,
+    where the premium grows with its risk level. Decisions costing more than
+    the budget or creating no value are ruled out up front; the rest go
+    through a 0/1 knapsack. Costs are counted in their largest common step
+    (e.g. thousands); when the budget spans more than ``resolution`` steps,
+    costs are rounded up to ``budget / resolution`` instead, so the selection
+    never exceeds the budget.
+
+    Args:
+        decisions: Candidate decisions.
+        metrics: Company metrics; the budget defaults to their cash flow.
+        budget: Cash available for the decisions.
+        risk_premiums: ROI premium per risk level; defaults to ``RISK_PREMIUMS``.
+        resolution: Number of budget steps of the knapsack table.
+
+    Returns:
+        The candidates with their status, selected ones first and each group
+        ranked by value per unit of cost.
+    """
+    premiums = RISK_PREMIUMS if risk_premiums is None else risk_premiums
+    budget = max(int(metrics["cash_flow"] if budget is None else budget), 0)
+    candidates = []
+    for index, decision in enumerate(decisions):
+        cost = decision["estimated_cost"]
+        premium = premiums.get(decision["risk_level"].lower(), max(premiums.values()))
+        value = cost * (decision["expected_roi"] - premium)
+        if value <= 0:
+            status = "unprofitable"
+        elif cost > budget:
+            status = "unaffordable"
+        else:
+            status = "marginal"
+        candidates.append(
+            RankedDecision(index=index, decision=decision, cost=cost, value=value, status=status)
+        )
+
+    feasible = [candidate for candidate in candidates if candidate["status"] == "marginal"]
+    for position in _knapsack(feasible, budget, resolution):
+        feasible[position]["status"] = "selected"
+    candidates.sort(
+        key=lambda candidate: (
+            _STATUS_ORDER.index(candidate["status"]),
+            -candidate["value"] / max(candidate["cost"], 1),
+        )
+    )
+    return PortfolioSelection(budget, candidates)
+
+
+def _knapsack(candidates: list[RankedDecision], budget: int, resolution: int) -> list[int]:
+    """Positions of the candidates maximizing total value within the budget."""
+    costs = [candidate["cost"] for candidate in candidates]
+    step = math.gcd(budget, *costs) or 1
+    if budget // step <= resolution:
+        capacity = budget // step
+        weights = [cost // step for cost in costs]
+    else:
+        # Too fine-grained: round costs up to budget / resolution
+        capacity = resolution
+        weights = [-(-cost * resolution // budget) for cost in costs]
+    # best[c]: best value using capacity c; taken[i][c]: whether candidate i is in it
+    best = [0.0] * (capacity + 1)
+    taken = []
+    for weight, candidate in zip(weights, candidates):
+        row = [False] * (capacity + 1)
+        for c in range(capacity, weight - 1, -1):
+            if best[c - weight] + candidate["value"] > best[c]:
+                best[c] = best[c - weight] + candidate["value"]
+                row[c] = True
+        taken.append(row)
+
+    chosen = []
+    c = capacity
+    for position in range(len(candidates) - 1, -1, -1):
+        if taken[position][c]:
+            chosen.append(position)
+            c -= weights[position]
+    return chosen
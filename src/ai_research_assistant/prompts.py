@@ -0,0 +1,103 @@
+"""Prompt building for board meetings with a shared, cache-friendly context prefix."""
+
+import re
+import textwrap
+from typing import Any, TypedDict
+
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+
+from .company_state import CompanyState
+
+RESPONSE_INSTRUCTIONS = (
+    "Respond with your opinion (2-3 sentences), your reasoning (3-4 sentences), "
+    'your vote ("approve", "reject" or "abstain") and a priority score '
+    "(1-10, where 10 is highest priority)."
+)
+
+_BLANK_LINES = re.compile(r"\n{3,}")
+
+# Meeting state fields rendered into the shared board context
+_BOARD_CONTEXT_FIELDS = ("company_name", "company_size", "industry", "decision_details")
+
+
+class PromptTokens(TypedDict):
+    """Estimated token counts of a prompt."""
+
+    prefix_tokens: int  # Shared context, identical for every board prompt
+    suffix_tokens: int  # Role- or task-specific part
+    total_tokens: int
+
+
+def compact(text: str) -> str:
+    """Strip indentation and trailing whitespace left over from triple-quoted literals."""
+    lines = [line.rstrip() for line in textwrap.dedent(text).strip().splitlines()]
+    return _BLANK_LINES.sub("\n\n", "\n".join(lines))
+
+
+def board_context(state: CompanyState) -> str:
+    """Build the company and decision context shared by every board prompt.
+
+    The text only depends on the company profile and the decision, never on
+    the role asking, so all executives and the facilitator send a
+    byte-identical prefix that provider-side prompt caching can reuse.
+    """
+    lines = [
+        f"You are advising the board of {state['company_name']}, a {state['company_size']} "
+        f"company in the {state['industry']} industry.",
+        "",
+        "Decision being considered:",
+    ]
+    decision = state.get("decision_details")
+    if decision:
+        lines += [
+            f"- Title: {decision['title']}",
+            f"- Description: {decision['description']}",
+            f"- Category: {decision['category']}",
+            f"- Impact Areas: {', '.join(decision['impact_areas'])}",
+            f"- Estimated Cost: ${decision['estimated_cost']:,}",
+            f"- Expected ROI: {decision['expected_roi']:.1%}",
+            f"- Timeline: {decision['timeline']}",
+            f"- Risk Level: {decision['risk_level']}",
+        ]
+    else:
+        lines.append("- N/A")
+    return "\n".join(lines)
+
+
+def board_context_inputs(state: CompanyState) -> dict[str, Any]:
+    """The meeting state fields ``board_context`` reads."""
+    return {field: state.get(field) for field in _BOARD_CONTEXT_FIELDS}
+
+
+def executive_messages(state: CompanyState, role_prompt: str) -> list[BaseMessage]:
+    """Build an executive's prompt: the shared context followed by the role's brief."""
+    return [
+        SystemMessage(content=board_context(state)),
+        HumanMessage(content=f"{compact(role_prompt)}\n\n{RESPONSE_INSTRUCTIONS}"),
+    ]
+
+
+def facilitator_messages(state: CompanyState, instructions: str) -> list[BaseMessage]:
+    """Build a facilitator prompt on top of the shared context."""
+    return [
+        SystemMessage(content=board_context(state)),
+        HumanMessage(content=compact(instructions)),
+    ]
+
+
+def prompt_tokens(messages: list[BaseMessage]) -> PromptTokens:
+    """Estimate the tokens of a prompt, split into shared prefix and suffix.
+
+    The first message is counted as the prefix, matching the layout produced
+    by ``executive_messages`` and ``facilitator_messages``.
+    """
+    counts = [count_tokens(str(message.content)) for message in messages]
+    prefix = counts[0] if counts else 0
+    return PromptTokens(
+        prefix_tokens=prefix, suffix_tokens=sum(counts) - prefix, total_tokens=sum(counts)
+    )
+
+
+def count_tokens(text: str) -> int:
+    """Approximate token count (about four characters per token)."""
+    return max(1, len(text) // 4)
@@ -1,129 +1,445 @@
 """Main ResearchAssistant class implementing the LangGraph workflow."""
 
 import os
-from typing import Any, cast
-
-from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_openai import ChatOpenAI
+import re
+import uuid
+from collections.abc import AsyncIterator, Iterator
+from functools import cached_property
+from typing import Any, ClassVar, cast
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+from langchain_core.runnables import RunnableConfig, RunnableLambda, ensure_config
 from langgraph.graph import END, StateGraph
-from pydantic import SecretStr
-
-from .state import ResearchState
+from langgraph.types import Send
+
+from .checkpointing import (
+    CheckpointerSpec,
+    ainvoke_resumable,
+    create_checkpointer,
+    invoke_resumable,
+    run_config,
+)
+from .fact_index import FactIndex
+from .instrumentation import Instrumentation, with_callback
+from .llm_clients import LLMClientRegistry, get_default_registry
+from .prompts import count_tokens
+from .research_store import ResearchStore
+from .resilience import RetryPolicy, acall_with_retry, call_with_retry, route_on_error
+from .routing import ModelRouter
+from .state import CollectionTask, ResearchState
+from .streaming import StreamEvent, astream_workflow, stream_workflow
+from .workflow_cache import WorkflowCache, bind_workflow, owner_node, owner_route
+
+# Numbered ("1." / "2)") or bulleted ("-", "*", "•") plan lines
+_PLAN_ITEM_PATTERN = re.compile(r"^\s*(?:\d+[.)]|[-*•])\s+(?P<item>\S.*)$", re.MULTILINE)
+_BULLET_PATTERN = re.compile(r"^\s*(?:\d+[.)]|[-*•])\s+")
+# Lines that structure a response rather than state a fact: headings, labels, bare markers
+_NON_FACT_PATTERN = re.compile(r"^(?:#.*|.*:|[-*•=_\s]*)$")
 
 
 class ResearchAssistant:
     """AI Research Assistant using LangGraph for multi-step research workflow."""
 
-    def __init__(self, openai_api_key: str | None = None):
+    _workflows: ClassVar[WorkflowCache] = WorkflowCache()
+
+    def __init__(
+        self,
+        openai_api_key: str | None = None,
+        llm_registry: LLMClientRegistry | None = None,
+        checkpointer: CheckpointerSpec = None,
+        instrumentation: Instrumentation | None = None,
+        max_research_areas: int = 6,
+        max_collection_concurrency: int = 4,
+        context_token_budget: int = 2000,
+        fact_index: FactIndex | None = None,
+        min_known_facts: int = 3,
+        research_store: ResearchStore | None = None,
+        retry_policy: RetryPolicy | None = None,
+        node_retry_policies: dict[str, RetryPolicy] | None = None,
+        model_router: ModelRouter | None = None,
+    ):
         """Initialize the research assistant.
 
         Args:
             openai_api_key: OpenAI API key. If not provided, will use OPENAI_API_KEY env var.
+            llm_registry: Registry providing shared chat models. Defaults to the
+                process-wide registry.
+            checkpointer: Optional checkpoint storage ("memory", a SQLite file path or
+                a saver instance) making runs resumable by thread id.
+            instrumentation: Optional aggregator; when set, every run records a
+                per-node trace returned on the final state under ``trace``.
+            max_research_areas: Maximum number of plan areas collected in parallel;
+                further areas are dropped.
+            max_collection_concurrency: Maximum number of collection LLM calls in
+                flight at once.
+            context_token_budget: Maximum estimated tokens of collected information
+                sent to the analysis and report prompts. Larger collections are
+                summarized chunk by chunk, in parallel, until they fit.
+            fact_index: Optional index merging near-duplicate facts. Sharing one
+                index between runs lets plan areas of overlapping questions reuse
+                facts collected before instead of calling the LLM again.
+            min_known_facts: Number of facts indexed by earlier runs for a similar
+                question and a similar area from which collecting that area is
+                skipped.
+            research_store: Optional store of past runs. New questions are seeded
+                with the findings of related stored questions, the planner skips
+                the areas those already covered, and successful ``research`` and
+                ``aresearch`` runs are saved.
+            retry_policy: Retries, backoff, timeout and hedging applied to LLM calls.
+            node_retry_policies: Policies overriding ``retry_policy`` per node name,
+                e.g. a tighter timeout with hedging for ``collect_info``.
+            model_router: Model, temperature and max_tokens per node name, e.g. a
+                small model for ``collect_info`` and ``digest_info``. Nodes
+                without a route use ``llm``.
+
+        Chat models and the workflow are created on first use; call
+        ``warm_up`` to create them up front.
         """
+        if max_collection_concurrency < 1:
+            raise ValueError("max_collection_concurrency must be at least 1")
+        if context_token_budget < 1:
+            raise ValueError("context_token_budget must be at least 1")
+        self.llm_registry = llm_registry or get_default_registry()
         self.api_key = openai_api_key or os.getenv("OPENAI_API_KEY")
-        if not self.api_key:
+        if not self.api_key and self.llm_registry.backend.requires_api_key:
             raise ValueError("OpenAI API key is required")
+        self.model_router = model_router or ModelRouter()
+        self.checkpointer = create_checkpointer(checkpointer)
+        self.instrumentation = instrumentation
+        self.max_research_areas = max_research_areas
+        self.max_collection_concurrency = max_collection_concurrency
+        self.context_token_budget = context_token_budget
+        self.fact_index = fact_index
+        self.min_known_facts = min_known_facts
+        self.research_store = research_store
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.node_retry_policies = node_retry_policies or {}
+        # Summarizes chunks in parallel, retrying each chunk's call on its own
+        self._summarizer = RunnableLambda(self._call_llm, afunc=self._acall_llm)
+
+    @cached_property
+    def llm(self) -> BaseChatModel:
+        """Default chat model, created on first use."""
+        return self.llm_registry.get_chat_model(self.api_key, temperature=0.1)
+
+    @cached_property
+    def node_llms(self) -> dict[str, BaseChatModel]:
+        """Chat models of the nodes with their own route, created on first use."""
+        return {
+            node: route.chat_model(self.llm_registry, self.api_key, 0.1)
+            for node, route in self.model_router.routes.items()
+        }
+
+    @cached_property
+    def workflow(self) -> Any:
+        """Compiled research workflow, shared with other assistants and bound to this one."""
+        graph = self._workflows.get(type(self), type(self)._build_workflow)
+        return bind_workflow(graph, self, self.checkpointer)
+
+    def warm_up(self) -> None:
+        """Compile the workflow and create the LLM clients ahead of the first run.
+
+        Long-lived workers can call this at startup so that the first request
+        does not pay for graph compilation or client construction.
+        """
+        _ = self.workflow, self.llm, self.node_llms
 
-        self.llm = ChatOpenAI(
-            model="gpt-4o-mini",
-            api_key=SecretStr(self.api_key) if self.api_key else None,
-            temperature=0.1,
-        )
-
-        self.workflow = self._build_workflow()
+    @classmethod
+    def _build_workflow(cls) -> Any:
+        """Build the LangGraph workflow for research.
 
-    def _build_workflow(self) -> Any:
-        """Build the LangGraph workflow for research."""
+        Nodes call the assistant found in the run configuration, so the
+        compiled graph holds no per-instance state and is compiled once per
+        process; see ``workflow_cache``.
+        """
         workflow = StateGraph(ResearchState)
 
-        # Add nodes
-        workflow.add_node("plan_research", self._plan_research)
-        workflow.add_node("collect_info", self._collect_info)
-        workflow.add_node("analyze_info", self._analyze_info)
-        workflow.add_node("generate_report", self._generate_report)
+        # Add nodes; each has a native async counterpart used by ainvoke
+        workflow.add_node("plan_research", owner_node("_plan_research", "_aplan_research"))
+        workflow.add_node("collect_info", owner_node("_collect_info", "_acollect_info"))
+        workflow.add_node("merge_info", owner_node("_merge_info"))
+        workflow.add_node("digest_info", owner_node("_digest_info", "_adigest_info"))
+        workflow.add_node("analyze_info", owner_node("_analyze_info", "_aanalyze_info"))
+        workflow.add_node("generate_report", owner_node("_generate_report", "_agenerate_report"))
 
         # Define edges
         workflow.set_entry_point("plan_research")
-        workflow.add_edge("plan_research", "collect_info")
-        workflow.add_edge("collect_info", "analyze_info")
-        workflow.add_edge("analyze_info", "generate_report")
+        # Map: one collection task per plan area; reduce: merge before analysis.
+        # A failed step ends the run instead of feeding later steps missing data.
+        workflow.add_conditional_edges(
+            "plan_research",
+            owner_route("_dispatch_collection"),
+            ["collect_info", "merge_info", END],
+        )
+        workflow.add_edge("collect_info", "merge_info")
+        workflow.add_conditional_edges(
+            "merge_info", route_on_error("digest_info"), ["digest_info", END]
+        )
+        workflow.add_conditional_edges(
+            "digest_info", route_on_error("analyze_info"), ["analyze_info", END]
+        )
+        workflow.add_conditional_edges(
+            "analyze_info", route_on_error("generate_report"), ["generate_report", END]
+        )
         workflow.add_edge("generate_report", END)
 
         return workflow.compile()
 
+    def _call_llm(self, messages: list[BaseMessage]) -> str:
+        """Send messages to the node's LLM and return the response text."""
+        config = ensure_config()
+        llm = self._node_llm(config)
+        response = call_with_retry(lambda: llm.invoke(messages), self._retry_policy(config))
+        return str(response.content or "")
+
+    async def _acall_llm(self, messages: list[BaseMessage], config: RunnableConfig) -> str:
+        """Asynchronously send messages to the node's LLM and return the response text."""
+        llm = self._node_llm(config)
+        response = await acall_with_retry(
+            lambda: llm.ainvoke(messages, config), self._retry_policy(config), config
+        )
+        return str(response.content or "")
+
+    def _node_llm(self, config: RunnableConfig) -> BaseChatModel:
+        """Return the model routed to the node a call is made from."""
+        node = _node_name(config)
+        return self.llm if node is None else self.node_llms.get(node, self.llm)
+
+    def _retry_policy(self, config: RunnableConfig) -> RetryPolicy:
+        """Return the retry policy of the node a call is made from."""
+        node = _node_name(config)
+        if node is None:
+            return self.retry_policy
+        return self.node_retry_policies.get(node, self.retry_policy)
+
     def _plan_research(self, state: ResearchState) -> dict[str, Any]:
         """Plan the research approach based on the question."""
         try:
-            messages = [
-                SystemMessage(
-                    content="""You are a research planning expert. Given a research question,
-                create a clear, structured research plan. The plan should include:
-                1. Key areas to investigate
-                2. Types of information to look for
-                3. Potential sources or approaches
-                4. Expected outcomes
-
-                Keep the plan concise but comprehensive."""
-                ),
-                HumanMessage(content=f"Research question: {state['question']}"),
-            ]
-
-            response = self.llm.invoke(messages)
+            plan = self._call_llm(self._planning_messages(state))
+            return {"research_plan": plan, "current_step": "planning_complete"}
+        except Exception as e:
+            return {
+                "error_message": f"Error in research planning: {str(e)}",
+                "current_step": "error",
+            }
 
-            return {"research_plan": response.content or "", "current_step": "planning_complete"}
+    async def _aplan_research(self, state: ResearchState, config: RunnableConfig) -> dict[str, Any]:
+        """Asynchronously plan the research approach based on the question."""
+        try:
+            plan = await self._acall_llm(self._planning_messages(state), config)
+            return {"research_plan": plan, "current_step": "planning_complete"}
         except Exception as e:
             return {
                 "error_message": f"Error in research planning: {str(e)}",
                 "current_step": "error",
             }
 
-    def _collect_info(self, state: ResearchState) -> dict[str, Any]:
-        """Collect information based on the research plan."""
+    def _planning_messages(self, state: ResearchState) -> list[BaseMessage]:
+        """Build the prompt for research planning."""
+        question = f"Research question: {state['question']}"
+        if state["covered_areas"]:
+            covered = "\n".join(f"- {area}" for area in state["covered_areas"])
+            question += (
+                "\n\nEarlier research already covered these areas; do not list them again:\n"
+                f"{covered}"
+            )
+        return [
+            SystemMessage(
+                content="""You are a research planning expert. Given a research question,
+                create a clear, structured research plan. Start with the key areas to investigate as a
+                numbered list, one distinct area per line with the information to look for in it.
+                Then add a short paragraph on potential sources or approaches and expected outcomes.
+
+                Keep the plan concise but comprehensive."""
+            ),
+            HumanMessage(content=question),
+        ]
+
+    def _dispatch_collection(self, state: ResearchState) -> list[Send] | str:
+        """Fan out one collection task per investigation area of the plan.
+
+        Areas already covered by earlier research are not collected again; if
+        none are left, the prior findings go straight to the merge step. A
+        failed plan ends the run.
+        """
+        if state["error_message"]:
+            return END
+        plan = state["research_plan"] or ""
+        covered = {_area_key(area) for area in state["covered_areas"]}
+        areas = [area for area in plan_areas(plan) if _area_key(area) not in covered]
+        if not areas and plan_areas(plan) and state["prior_findings"]:
+            return "merge_info"
+        areas = areas[: self.max_research_areas] or [plan or state["question"]]
+        return [
+            Send(
+                "collect_info",
+                CollectionTask(
+                    question=state["question"],
+                    research_plan=plan,
+                    area=area,
+                    run_id=state.get("run_id", ""),
+                ),
+            )
+            for area in areas
+        ]
+
+    def _collect_info(self, task: CollectionTask) -> dict[str, Any]:
+        """Collect information for one area of the research plan."""
+        try:
+            known = self._known_facts(task)
+            if known is not None:
+                return {"collected_fragments": known}
+            content = self._call_llm(self._collection_messages(task))
+            return {"collected_fragments": self._index_facts(task, self._split_info(content))}
+        except Exception as e:
+            return {"error_message": f"Error in information collection: {str(e)}"}
+
+    async def _acollect_info(self, task: CollectionTask, config: RunnableConfig) -> dict[str, Any]:
+        """Asynchronously collect information for one area of the research plan."""
         try:
-            messages = [
-                SystemMessage(
-                    content="""You are an information collection expert. Based on the research plan,
-                simulate collecting relevant information. Since this is a demo, provide realistic but simulated
-                information that would be found through research. Include:
+            known = self._known_facts(task)
+            if known is not None:
+                return {"collected_fragments": known}
+            content = await self._acall_llm(self._collection_messages(task), config)
+            return {"collected_fragments": self._index_facts(task, self._split_info(content))}
+        except Exception as e:
+            return {"error_message": f"Error in information collection: {str(e)}"}
+
+    def _known_facts(self, task: CollectionTask) -> list[str] | None:
+        """Return indexed facts for the task's area if there are enough to skip collecting.
+
+        Only facts of earlier runs count: areas of the same run never stand
+        in for each other.
+        """
+        if self.fact_index is None:
+            return None
+        known = self.fact_index.facts_for(
+            task["question"], task["area"], exclude_source=task["run_id"]
+        )
+        return known if len(known) >= self.min_known_facts else None
+
+    def _index_facts(self, task: CollectionTask, points: list[str]) -> list[str]:
+        """Replace points by their representatives in the fact index, if any."""
+        if self.fact_index is None:
+            return points
+        return self.fact_index.dedupe(points, task["question"], task["area"], task["run_id"])
+
+    def _collection_messages(self, task: CollectionTask) -> list[BaseMessage]:
+        """Build the prompt for collecting information on one plan area."""
+        return [
+            SystemMessage(
+                content="""You are an information collection expert. Based on the research plan,
+                simulate collecting relevant information for one investigation area. Since this is a
+                demo, provide realistic but simulated information that would be found through research.
+                Include:
                 1. Key facts and data points
                 2. Different perspectives on the topic
                 3. Recent developments or trends
                 4. Expert opinions or studies
 
                 Format as a list of information points."""
-                ),
-                HumanMessage(
-                    content=f"""
-                Research Question: {state["question"]}
-                Research Plan: {state["research_plan"]}
-
-                Please collect relevant information based on this plan.
+            ),
+            HumanMessage(
+                content=f"""
+                Research Question: {task["question"]}
+                Research Plan: {task["research_plan"]}
+                Investigation Area: {task["area"]}
+
+                Please collect relevant information for this area only.
                 """
-                ),
-            ]
-
-            response = self.llm.invoke(messages)
-
-            # Simulate multiple information sources
-            content = str(response.content or "")
-            info_points = content.split("\n")
-            info_points = [point.strip() for point in info_points if point.strip()]
+            ),
+        ]
+
+    def _split_info(self, content: str) -> list[str]:
+        """Split a collection response into individual information points."""
+        # Simulate multiple information sources
+        info_points = (point.strip() for point in content.split("\n"))
+        return [point for point in info_points if not _NON_FACT_PATTERN.match(point)]
+
+    def _merge_info(self, state: ResearchState) -> dict[str, Any]:
+        """Merge the points of all collection tasks, dropping duplicates."""
+        if state["error_message"]:
+            return {"current_step": "error"}
+        return {
+            "collected_info": merge_points(state["prior_findings"] + state["collected_fragments"]),
+            "current_step": "collection_complete",
+        }
+
+    def _digest_info(self, state: ResearchState, config: RunnableConfig) -> dict[str, Any]:
+        """Compress the collected information to fit the context token budget."""
+        try:
+            points = state["collected_info"]
+            chunks = chunk_points(points, self.context_token_budget)
+            while len(chunks) > 1 or _tokens(points) > self.context_token_budget:
+                prompts = [self._summary_messages(state, chunk) for chunk in chunks]
+                summaries = self._summarizer.batch(prompts, config)
+                if _tokens(summaries) >= _tokens(points):
+                    break  # Summaries no longer shrink the text
+                points, chunks = summaries, chunk_points(summaries, self.context_token_budget)
+            return {"info_digest": "\n".join(points), "current_step": "digest_complete"}
+        except Exception as e:
+            return {"error_message": f"Error in summarization: {str(e)}", "current_step": "error"}
 
-            return {"collected_info": info_points, "current_step": "collection_complete"}
+    async def _adigest_info(self, state: ResearchState, config: RunnableConfig) -> dict[str, Any]:
+        """Asynchronously compress the collected information to fit the context token budget."""
+        try:
+            points = state["collected_info"]
+            chunks = chunk_points(points, self.context_token_budget)
+            while len(chunks) > 1 or _tokens(points) > self.context_token_budget:
+                prompts = [self._summary_messages(state, chunk) for chunk in chunks]
+                summaries = await self._summarizer.abatch(prompts, config)
+                if _tokens(summaries) >= _tokens(points):
+                    break  # Summaries no longer shrink the text
+                points, chunks = summaries, chunk_points(summaries, self.context_token_budget)
+            return {"info_digest": "\n".join(points), "current_step": "digest_complete"}
         except Exception as e:
-            return {
-                "error_message": f"Error in information collection: {str(e)}",
-                "current_step": "error",
-            }
+            return {"error_message": f"Error in summarization: {str(e)}", "current_step": "error"}
+
+    def _summary_messages(self, state: ResearchState, chunk: list[str]) -> list[BaseMessage]:
+        """Build the prompt summarizing one chunk of collected information."""
+        info_text = "\n".join(chunk)
+
+        return [
+            SystemMessage(
+                content="""You are a research summarizer. Condense the information points into a
+                short list of dense statements. Keep every distinct fact, figure and perspective
+                that is relevant to the research question and drop repetition."""
+            ),
+            HumanMessage(
+                content=f"""
+                Research Question: {state["question"]}
+                Information:
+                {info_text}
+
+                Please summarize this information.
+                """
+            ),
+        ]
 
     def _analyze_info(self, state: ResearchState) -> dict[str, Any]:
         """Analyze the collected information."""
         try:
-            info_text = "\n".join(state["collected_info"])
+            analysis = self._call_llm(self._analysis_messages(state))
+            return {"analysis": analysis, "current_step": "analysis_complete"}
+        except Exception as e:
+            return {"error_message": f"Error in analysis: {str(e)}", "current_step": "error"}
 
-            messages = [
-                SystemMessage(
-                    content="""You are a research analyst. Analyze the collected information and provide:
+    async def _aanalyze_info(self, state: ResearchState, config: RunnableConfig) -> dict[str, Any]:
+        """Asynchronously analyze the collected information."""
+        try:
+            analysis = await self._acall_llm(self._analysis_messages(state), config)
+            return {"analysis": analysis, "current_step": "analysis_complete"}
+        except Exception as e:
+            return {"error_message": f"Error in analysis: {str(e)}", "current_step": "error"}
+
+    def _analysis_messages(self, state: ResearchState) -> list[BaseMessage]:
+        """Build the prompt for analysis."""
+        info_text = state["info_digest"]
+
+        return [
+            SystemMessage(
+                content="""You are a research analyst. Analyze the collected information and provide:
                 1. Key insights and patterns
                 2. Strengths and limitations of the information
                 3. Connections between different pieces of information
@@ -131,32 +447,49 @@ class ResearchAssistant:
                 5. Areas where more research might be needed
 
                 Be objective and analytical in your assessment."""
-                ),
-                HumanMessage(
-                    content=f"""
+            ),
+            HumanMessage(
+                content=f"""
                 Research Question: {state["question"]}
                 Collected Information:
                 {info_text}
 
                 Please analyze this information thoroughly.
                 """
-                ),
-            ]
-
-            response = self.llm.invoke(messages)
-
-            return {"analysis": response.content or "", "current_step": "analysis_complete"}
-        except Exception as e:
-            return {"error_message": f"Error in analysis: {str(e)}", "current_step": "error"}
+            ),
+        ]
 
     def _generate_report(self, state: ResearchState) -> dict[str, Any]:
         """Generate the final research report."""
         try:
-            info_text = "\n".join(state["collected_info"])
+            report = self._call_llm(self._report_messages(state))
+            return {"final_report": report, "current_step": "complete"}
+        except Exception as e:
+            return {
+                "error_message": f"Error in report generation: {str(e)}",
+                "current_step": "error",
+            }
 
-            messages = [
-                SystemMessage(
-                    content="""You are a research report writer. Create a comprehensive final report that includes:
+    async def _agenerate_report(
+        self, state: ResearchState, config: RunnableConfig
+    ) -> dict[str, Any]:
+        """Asynchronously generate the final research report."""
+        try:
+            report = await self._acall_llm(self._report_messages(state), config)
+            return {"final_report": report, "current_step": "complete"}
+        except Exception as e:
+            return {
+                "error_message": f"Error in report generation: {str(e)}",
+                "current_step": "error",
+            }
+
+    def _report_messages(self, state: ResearchState) -> list[BaseMessage]:
+        """Build the prompt for the final report."""
+        info_text = state["info_digest"]
+
+        return [
+            SystemMessage(
+                content="""You are a research report writer. Create a comprehensive final report that includes:
                 1. Executive Summary
                 2. Research Question and Methodology
                 3. Key Findings
@@ -165,9 +498,9 @@ class ResearchAssistant:
                 6. Recommendations for further research
 
                 Make the report well-structured, professional, and actionable."""
-                ),
-                HumanMessage(
-                    content=f"""
+            ),
+            HumanMessage(
+                content=f"""
                 Research Question: {state["question"]}
                 Research Plan: {state["research_plan"]}
                 Collected Information: {info_text}
@@ -175,36 +508,165 @@ class ResearchAssistant:
 
                 Please generate a comprehensive final report.
                 """
-                ),
-            ]
+            ),
+        ]
 
-            response = self.llm.invoke(messages)
+    def research(
+        self, question: str, thread_id: str | None = None, config: RunnableConfig | None = None
+    ) -> ResearchState:
+        """Conduct research on the given question.
 
-            return {"final_report": response.content or "", "current_step": "complete"}
-        except Exception as e:
-            return {
-                "error_message": f"Error in report generation: {str(e)}",
-                "current_step": "error",
-            }
+        Args:
+            question: The research question to investigate.
+            thread_id: Run identifier used with a checkpointer. Calling again with the
+                same id resumes a failed run from the step that failed, re-running
+                every parallel branch of that step (see ``invoke_resumable``).
+            config: Optional workflow configuration, e.g. to attach callbacks.
 
-    def research(self, question: str) -> ResearchState:
-        """Conduct research on the given question.
+        Returns:
+            Final state containing the research results.
+        """
+        tracer = self.instrumentation.tracer("research") if self.instrumentation else None
+        config = self._run_config(thread_id, with_callback(config, tracer))
+        result = invoke_resumable(self.workflow, self._initial_state(question), config)
+        if tracer is not None:
+            result = tracer.finish(result)
+        self._remember(result)
+        return cast(ResearchState, result)
+
+    async def aresearch(
+        self, question: str, thread_id: str | None = None, config: RunnableConfig | None = None
+    ) -> ResearchState:
+        """Conduct research on the given question without blocking the event loop.
 
         Args:
             question: The research question to investigate.
+            thread_id: Run identifier used with a checkpointer. Calling again with the
+                same id resumes a failed run from the step that failed, re-running
+                every parallel branch of that step (see ``invoke_resumable``).
+            config: Optional workflow configuration, e.g. to attach callbacks.
 
         Returns:
             Final state containing the research results.
         """
-        initial_state = ResearchState(
+        tracer = self.instrumentation.tracer("research") if self.instrumentation else None
+        config = self._run_config(thread_id, with_callback(config, tracer))
+        result = await ainvoke_resumable(self.workflow, self._initial_state(question), config)
+        if tracer is not None:
+            result = tracer.finish(result)
+        self._remember(result)
+        return cast(ResearchState, result)
+
+    def stream_research(self, question: str, thread_id: str | None = None) -> Iterator[StreamEvent]:
+        """Conduct research, streaming progress as it happens.
+
+        Yields ``token`` events with LLM output chunks as they arrive (e.g. the
+        final report while it is being written), a ``node`` event with each
+        step's state update, and a closing ``final`` event with the full state.
+        """
+        config = self._run_config(thread_id)
+        yield from stream_workflow(self.workflow, self._initial_state(question), config)
+
+    async def astream_research(
+        self, question: str, thread_id: str | None = None
+    ) -> AsyncIterator[StreamEvent]:
+        """Async counterpart of ``stream_research``."""
+        config = self._run_config(thread_id)
+        async for event in astream_workflow(self.workflow, self._initial_state(question), config):
+            yield event
+
+    def _run_config(
+        self, thread_id: str | None, config: RunnableConfig | None = None
+    ) -> RunnableConfig:
+        """Build the run configuration, bounding how many collection tasks run at once."""
+        merged = RunnableConfig(**(config or {}))
+        merged.setdefault("max_concurrency", self.max_collection_concurrency)
+        return run_config(self.checkpointer, thread_id, merged)
+
+    def _remember(self, result: ResearchState) -> None:
+        """Save a successful run to the research store, if any."""
+        if self.research_store is None or result["error_message"]:
+            return
+        areas = [*result["covered_areas"], *plan_areas(result["research_plan"] or "")]
+        self.research_store.save(result, list(dict.fromkeys(areas)))
+
+    def _initial_state(self, question: str) -> ResearchState:
+        """Build the initial workflow state, seeded with related stored research."""
+        memos = self.research_store.related(question) if self.research_store else []
+        return ResearchState(
             question=question,
             research_plan=None,
+            prior_findings=merge_points([fact for m in memos for fact in m["collected_info"]]),
+            covered_areas=list(dict.fromkeys(area for m in memos for area in m["areas"])),
             collected_info=[],
+            collected_fragments=[],
+            info_digest=None,
             analysis=None,
             final_report=None,
             current_step="started",
             error_message=None,
+            run_id=uuid.uuid4().hex,
         )
 
-        result = self.workflow.invoke(initial_state)
-        return cast(ResearchState, result)
+
+def plan_areas(plan: str) -> list[str]:
+    """Extract the investigation areas listed in a research plan.
+
+    Areas are the plan's numbered or bulleted lines, in order and without
+    duplicates; a plan written as free text yields no areas.
+    """
+    areas: list[str] = []
+    for match in _PLAN_ITEM_PATTERN.finditer(plan):
+        area = match.group("item").strip()
+        if area not in areas:
+            areas.append(area)
+    return areas
+
+
+def _area_key(area: str) -> str:
+    """Normalized form of an area used to recognize areas already covered."""
+    return " ".join(area.lower().split())
+
+
+def chunk_points(points: list[str], token_budget: int) -> list[list[str]]:
+    """Group consecutive points into chunks of at most ``token_budget`` estimated tokens.
+
+    A point larger than the budget on its own becomes a chunk by itself.
+    """
+    chunks: list[list[str]] = []
+    size = 0
+    for point in points:
+        tokens = count_tokens(point)
+        if not chunks or size + tokens > token_budget:
+            chunks.append([])
+            size = 0
+        chunks[-1].append(point)
+        size += tokens
+    return chunks
+
+
+def _tokens(points: list[str]) -> int:
+    """Estimated tokens of points joined one per line."""
+    return count_tokens("\n".join(points))
+
+
+def merge_points(points: list[str]) -> list[str]:
+    """Deduplicate information points, keeping the first occurrence of each.
+
+    Points are compared ignoring list markers, case and whitespace, so the
+    same fact returned by several collection tasks is kept only once.
+    """
+    seen: set[str] = set()
+    merged: list[str] = []
+    for point in points:
+        key = " ".join(_BULLET_PATTERN.sub("", point).lower().split())
+        if key and key not in seen:
+            seen.add(key)
+            merged.append(point)
+    return merged
+
+
+def _node_name(config: RunnableConfig) -> str | None:
+    """Name of the graph node a call is made from, if it runs inside the workflow."""
+    node = config.get("metadata", {}).get("langgraph_node")
+    return node if isinstance(node, str) else None
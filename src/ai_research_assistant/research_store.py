@@ -0,0 +1,137 @@
+"""Persistent store of past research runs, looked up by question similarity."""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import TypedDict
+
+from .fact_index import FactIndex
+from .state import ResearchState
+
+
+class ResearchMemo(TypedDict):
+    """A stored research run and its similarity to the question looked up."""
+
+    question: str
+    research_plan: str | None
+    areas: list[str]  # Investigation areas the run covered
+    collected_info: list[str]
+    analysis: str | None
+    final_report: str | None
+    created_at: float
+    similarity: float
+
+
+class ResearchStore:
+    """SQLite store of research plans, facts, analyses and reports by question.
+
+    Questions are matched by the MinHash similarity of their character
+    shingles, so rewordings and overlapping questions find each other's
+    findings across processes when the store is backed by a file.
+    """
+
+    def __init__(self, path: str | Path = ":memory:", min_similarity: float = 0.5):
+        """Initialize the store, creating the database if needed.
+
+        Args:
+            path: Database file path, or ":memory:".
+            min_similarity: Estimated similarity from which a stored question
+                counts as related.
+        """
+        self.min_similarity = min_similarity
+        self._hasher = FactIndex()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS research (
+                    id INTEGER PRIMARY KEY,
+                    question TEXT NOT NULL,
+                    signature TEXT NOT NULL,
+                    research_plan TEXT,
+                    areas TEXT NOT NULL,
+                    collected_info TEXT NOT NULL,
+                    analysis TEXT,
+                    final_report TEXT,
+                    created_at REAL NOT NULL
+                )"""
+            )
+
+    def save(self, state: ResearchState, areas: list[str]) -> None:
+        """Store a finished research run together with the areas it covered."""
+        signature = self._hasher.signature(state["question"])
+        with self._lock, self._conn:
+            self._conn.execute(
+                """INSERT INTO research (question, signature, research_plan, areas,
+                    collected_info, analysis, final_report, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                (
+                    state["question"],
+                    json.dumps(signature),
+                    state["research_plan"],
+                    json.dumps(areas),
+                    json.dumps(state["collected_info"]),
+                    state["analysis"],
+                    state["final_report"],
+                    time.time(),
+                ),
+            )
+
+    def related(self, question: str, limit: int = 3) -> list[ResearchMemo]:
+        """Return the stored runs most similar to ``question``, best match first.
+
+        Only questions and signatures are scanned; the stored findings are
+        read for the best matches alone.
+        """
+        signature = self._hasher.signature(question)
+        with self._lock:
+            candidates = self._conn.execute(
+                "SELECT id, signature FROM research ORDER BY created_at DESC"
+            ).fetchall()
+
+        scored = []
+        for row_id, stored in candidates:
+            similarity = FactIndex.similarity(signature, tuple(json.loads(stored)))
+            if similarity >= self.min_similarity:
+                scored.append((similarity, row_id))
+        # Stable sort: equally similar runs stay newest first
+        scored.sort(key=lambda match: match[0], reverse=True)
+        similarities = {row_id: similarity for similarity, row_id in scored[:limit]}
+        if not similarities:
+            return []
+
+        placeholders = ", ".join("?" * len(similarities))
+        with self._lock:
+            rows = self._conn.execute(
+                f"""SELECT id, question, research_plan, areas, collected_info,
+                    analysis, final_report, created_at
+                FROM research WHERE id IN ({placeholders})""",
+                list(similarities),
+            ).fetchall()
+
+        memos = {
+            row[0]: ResearchMemo(
+                question=row[1],
+                research_plan=row[2],
+                areas=json.loads(row[3]),
+                collected_info=json.loads(row[4]),
+                analysis=row[5],
+                final_report=row[6],
+                created_at=row[7],
+                similarity=similarities[row[0]],
+            )
+            for row in rows
+        }
+        return [memos[row_id] for row_id in similarities if row_id in memos]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        """Return the number of stored research runs."""
+        with self._lock:
+            return int(self._conn.execute("SELECT COUNT(*) FROM research").fetchone()[0])
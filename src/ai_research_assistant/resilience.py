@@ -0,0 +1,232 @@
+"""Retries with backoff, timeouts and hedged requests for LLM calls."""
+
+import asyncio
+import contextlib
+import contextvars
+import random
+import re
+import sys
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, TypeVar
+
+from langchain_core.callbacks.manager import adispatch_custom_event, dispatch_custom_event
+from langchain_core.runnables import RunnableConfig
+from langgraph.graph import END
+
+T = TypeVar("T")
+
+RETRY_EVENT = "llm_retry"  # Custom callback event sent before each retry
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 429, 500, 502, 503, 504})
+
+# Reset durations of OpenAI rate-limit headers, e.g. "20ms", "1.5s" or "6m0s"
+_DURATION_PATTERN = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How an LLM call is retried, timed out and hedged.
+
+    Failed attempts are retried after exponential backoff with full jitter,
+    waiting at least as long as the provider's rate-limit headers ask for.
+    Only transient errors (timeouts, connection errors, rate limits and
+    server errors) are retried.
+    """
+
+    max_attempts: int = 4
+    initial_backoff: float = 0.5  # Seconds before the first retry
+    max_backoff: float = 20.0
+    multiplier: float = 2.0
+    jitter: bool = True
+    timeout_seconds: float | None = None  # Per attempt; None relies on the HTTP client timeout
+    hedge_after_seconds: float | None = None  # Send a duplicate request if no answer by then
+
+    def backoff(self, attempt: int, error: BaseException | None = None) -> float:
+        """Return the delay before retrying after the given (1-based) failed attempt."""
+        delay = min(self.max_backoff, self.initial_backoff * self.multiplier ** (attempt - 1))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        requested = retry_after(error) if error is not None else None
+        return max(delay, requested or 0.0)
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Return whether an error is transient and worth retrying."""
+    if isinstance(error, (TimeoutError, asyncio.TimeoutError)):
+        return True
+    openai = sys.modules.get("openai")  # Not imported until an OpenAI model is created
+    if openai is not None and isinstance(error, openai.APIConnectionError):
+        return True
+    return getattr(error, "status_code", None) in RETRYABLE_STATUS_CODES
+
+
+def retry_after(error: BaseException) -> float | None:
+    """Return the wait in seconds requested by an error's rate-limit headers, if any."""
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+    if value := headers.get("retry-after-ms"):
+        with contextlib.suppress(ValueError):
+            return float(value) / 1000
+    if value := headers.get("retry-after"):
+        with contextlib.suppress(ValueError):
+            return float(value)
+        with contextlib.suppress(TypeError, ValueError):
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    resets = [
+        _parse_duration(headers[name])
+        for name in ("x-ratelimit-reset-requests", "x-ratelimit-reset-tokens")
+        if headers.get(name)
+    ]
+    return max(resets) if resets else None
+
+
+def call_with_retry(
+    func: Callable[[], T], policy: RetryPolicy, config: RunnableConfig | None = None
+) -> T:
+    """Call ``func`` under ``policy``, retrying transient errors.
+
+    Each retry is reported as an ``llm_retry`` custom callback event on the
+    current run, which ``RunTracer`` counts as a retry of the node.
+    """
+    attempt = 1
+    while True:
+        try:
+            return _attempt(func, policy)
+        except Exception as error:
+            if attempt >= policy.max_attempts or not is_retryable(error):
+                raise
+            delay = policy.backoff(attempt, error)
+            with contextlib.suppress(RuntimeError):  # Not running inside a traced run
+                dispatch_custom_event(
+                    RETRY_EVENT, _retry_data(attempt, error, delay), config=config
+                )
+            time.sleep(delay)
+            attempt += 1
+
+
+async def acall_with_retry(
+    func: Callable[[], Awaitable[T]], policy: RetryPolicy, config: RunnableConfig | None = None
+) -> T:
+    """Async counterpart of ``call_with_retry``."""
+    attempt = 1
+    while True:
+        try:
+            return await _aattempt(func, policy)
+        except Exception as error:
+            if attempt >= policy.max_attempts or not is_retryable(error):
+                raise
+            delay = policy.backoff(attempt, error)
+            with contextlib.suppress(RuntimeError):
+                await adispatch_custom_event(
+                    RETRY_EVENT, _retry_data(attempt, error, delay), config=config
+                )
+            await asyncio.sleep(delay)
+            attempt += 1
+
+
+def route_on_error(next_node: str) -> Callable[[dict[str, Any]], str]:
+    """Build a router continuing to ``next_node``, or to END once an error is set.
+
+    Used as a conditional edge so that a failed step does not waste LLM calls
+    on downstream nodes that cannot succeed.
+    """
+
+    def route(state: dict[str, Any]) -> str:
+        return END if state.get("error_message") else next_node
+
+    return route
+
+
+def _attempt(func: Callable[[], T], policy: RetryPolicy) -> T:
+    """Run one attempt, in worker threads when it has a timeout or may be hedged."""
+    if policy.timeout_seconds is None and policy.hedge_after_seconds is None:
+        return func()
+
+    deadline = None if policy.timeout_seconds is None else time.monotonic() + policy.timeout_seconds
+    pending: set[Future[T]] = {_submit(func)}
+    hedged = policy.hedge_after_seconds is None
+    error: BaseException | None = None
+    while pending:
+        timeout = _remaining(deadline)
+        if not hedged:
+            hedge_after = policy.hedge_after_seconds or 0.0
+            timeout = hedge_after if timeout is None else min(timeout, hedge_after)
+        done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None:
+                return future.result()  # Slower duplicates finish in the background
+            error = future.exception()
+        if deadline is not None and time.monotonic() >= deadline:
+            raise TimeoutError(f"LLM call timed out after {policy.timeout_seconds}s")
+        if not done and not hedged:
+            pending.add(_submit(func))
+            hedged = True
+    assert error is not None
+    raise error
+
+
+async def _aattempt(func: Callable[[], Awaitable[T]], policy: RetryPolicy) -> T:
+    """Run one async attempt with its timeout and optional hedged duplicate."""
+    if policy.hedge_after_seconds is None:
+        return await asyncio.wait_for(func(), policy.timeout_seconds)
+    return await asyncio.wait_for(
+        _ahedged(func, policy.hedge_after_seconds), policy.timeout_seconds
+    )
+
+
+async def _ahedged(func: Callable[[], Awaitable[T]], hedge_after: float) -> T:
+    """Return the first successful result of a call and a duplicate sent after a delay."""
+    tasks = {asyncio.ensure_future(func())}
+    hedged = False
+    error: BaseException | None = None
+    try:
+        while tasks:
+            done, tasks = await asyncio.wait(
+                tasks, timeout=None if hedged else hedge_after, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                error = task.exception()
+            if not done and not hedged:
+                tasks.add(asyncio.ensure_future(func()))
+                hedged = True
+    finally:
+        for task in tasks:
+            task.cancel()
+    assert error is not None
+    raise error
+
+
+def _submit(func: Callable[[], T]) -> "Future[T]":
+    """Run ``func`` in the shared worker pool, keeping the caller's context variables."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=32, thread_name_prefix="llm-call")
+    context = contextvars.copy_context()
+    return _executor.submit(context.run, func)
+
+
+def _remaining(deadline: float | None) -> float | None:
+    """Seconds until ``deadline``, or None without one."""
+    return None if deadline is None else max(0.0, deadline - time.monotonic())
+
+
+def _retry_data(attempt: int, error: BaseException, delay: float) -> dict[str, Any]:
+    """Payload of the retry callback event."""
+    return {"attempt": attempt, "error": repr(error), "delay_seconds": delay}
+
+
+def _parse_duration(value: str) -> float:
+    """Parse a duration such as "1m30s" or "250ms" into seconds."""
+    return sum(float(n) * _DURATION_UNITS[unit] for n, unit in _DURATION_PATTERN.findall(value))
@@ -0,0 +1,173 @@
+"""Board seats declared as data, and the registry rosters are built from."""
+
+import re
+import threading
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+
+from .company_state import CompanyMetrics
+
+# Prompt label and format of each company metric
+METRIC_FORMATS: dict[str, tuple[str, str]] = {
+    "revenue": ("Revenue", "${:,}"),
+    "expenses": ("Expenses", "${:,}"),
+    "profit": ("Profit", "${:,}"),
+    "cash_flow": ("Cash Flow", "${:,}"),
+    "employee_count": ("Employee Count", "{}"),
+    "customer_satisfaction": ("Customer Satisfaction", "{:.1f}/10"),
+    "market_share": ("Market Share", "{:.1%}"),
+    "tech_debt": ("Tech Debt Level", "{:.1f}/10"),
+    "brand_value": ("Brand Value", "{:.1f}/10"),
+}
+
+_ROLE_PATTERN = re.compile(r"^[A-Z][A-Z0-9_]*$")
+
+
+@dataclass(frozen=True)
+class BoardSeat:
+    """A board member's role: what they focus on and which metrics they see.
+
+    ``role`` keys the member's opinion, vote and graph node
+    (``collect_<role>_opinion``), so it must be an upper-case identifier such
+    as "CFO" or "APAC_HEAD".
+    """
+
+    role: str
+    persona: str  # Completes "You are the <role>, ..."
+    focus: tuple[str, ...]  # Numbered points the member is asked to address
+    metric_fields: tuple[str, ...] = ()  # CompanyMetrics keys shown in the prompt
+    metrics_heading: str = "Current Company Metrics"
+    closing: str = ""  # Optional last line of the brief
+    default_reasoning: str = "Evaluation based on the member's area of responsibility."
+    default_priority: int = 5  # Used when a response leaves the priority out
+    icon: str = "🗣️"
+
+    def __post_init__(self) -> None:
+        """Validate the role key and metric fields."""
+        if not _ROLE_PATTERN.match(self.role):
+            raise ValueError(f"Board role must be an upper-case identifier: {self.role!r}")
+        unknown = set(self.metric_fields) - set(METRIC_FORMATS)
+        if unknown:
+            raise ValueError(f"Unknown metric fields for {self.role}: {sorted(unknown)}")
+
+    @property
+    def seat(self) -> str:
+        """Lower-case seat name used in node names and attributes, e.g. "cfo"."""
+        return self.role.lower()
+
+    def brief(self, metrics: CompanyMetrics) -> str:
+        """Build the member's role-specific prompt from the company metrics."""
+        values: Mapping[str, object] = metrics
+        lines = [f"You are the {self.role}, {self.persona}."]
+        if self.metric_fields:
+            lines += ["", f"{self.metrics_heading}:"]
+            for field in self.metric_fields:
+                label, value_format = METRIC_FORMATS[field]
+                lines.append(f"- {label}: {value_format.format(values[field])}")
+        lines += ["", f"As {self.role}, focus on:"]
+        lines += [f"{number}. {point}" for number, point in enumerate(self.focus, 1)]
+        if self.closing:
+            lines += ["", self.closing]
+        return "\n".join(lines)
+
+
+CEO_SEAT = BoardSeat(
+    role="CEO",
+    persona="an experienced executive making strategic business decisions",
+    focus=(
+        "Strategic alignment with company vision",
+        "Long-term impact on company growth",
+        "Leadership and stakeholder considerations",
+        "Overall business strategy",
+    ),
+    metric_fields=("revenue", "profit", "employee_count", "market_share", "customer_satisfaction"),
+    closing="Be decisive but consider all stakeholders including employees, customers, "
+    "and shareholders.",
+    default_reasoning="Strategic considerations based on company position and market dynamics.",
+    icon="🔑",
+)
+
+CTO_SEAT = BoardSeat(
+    role="CTO",
+    persona="an experienced executive evaluating technical decisions",
+    focus=(
+        "Technical feasibility and implementation challenges",
+        "Impact on existing systems and infrastructure",
+        "Innovation opportunities and competitive advantage",
+        "Technical team capacity and skill requirements",
+        "Long-term technical debt implications",
+    ),
+    metric_fields=("tech_debt", "employee_count"),
+    metrics_heading="Current Technical Metrics",
+    default_reasoning="Technical evaluation based on feasibility, infrastructure impact, "
+    "and innovation potential.",
+    default_priority=6,
+    icon="💻",
+)
+
+CMO_SEAT = BoardSeat(
+    role="CMO",
+    persona="an experienced executive evaluating marketing and customer impact",
+    focus=(
+        "Impact on customer experience and satisfaction",
+        "Brand positioning and market perception",
+        "Competitive advantage in the market",
+        "Customer acquisition and retention potential",
+        "Marketing and sales implications",
+    ),
+    metric_fields=("market_share", "customer_satisfaction", "brand_value"),
+    metrics_heading="Current Marketing Metrics",
+    default_reasoning="Marketing evaluation focused on customer impact, brand value, "
+    "and market positioning.",
+    icon="📈",
+)
+
+CFO_SEAT = BoardSeat(
+    role="CFO",
+    persona="an experienced executive evaluating financial decisions",
+    focus=(
+        "Financial impact and ROI projections",
+        "Budget implications and cash flow effects",
+        "Financial risk assessment",
+        "Cost-benefit analysis",
+        "Impact on financial KPIs and investor relations",
+    ),
+    metric_fields=("revenue", "expenses", "profit", "cash_flow"),
+    metrics_heading="Current Financial Metrics",
+    default_reasoning="Financial analysis considering ROI, cash flow impact, and risk assessment.",
+    default_priority=7,  # CFO often has high priority on financial decisions
+    icon="💰",
+)
+
+# The board used when no roster is given, in speaking order
+DEFAULT_ROSTER = (CEO_SEAT, CTO_SEAT, CMO_SEAT, CFO_SEAT)
+
+_seats: dict[str, BoardSeat] = {seat.role: seat for seat in DEFAULT_ROSTER}
+_seats_lock = threading.Lock()
+
+
+def register_seat(seat: BoardSeat) -> None:
+    """Register a seat so rosters can refer to it by role, replacing any previous one."""
+    with _seats_lock:
+        _seats[seat.role] = seat
+
+
+def get_seat(role: str) -> BoardSeat | None:
+    """Return the registered seat of a role, if any."""
+    return _seats.get(role.upper())
+
+
+def resolve_roster(roster: Iterable[BoardSeat | str] | None) -> tuple[BoardSeat, ...]:
+    """Turn seats and registered role names into a roster, defaulting to the standard board."""
+    if roster is None:
+        return DEFAULT_ROSTER
+    seats = []
+    for member in roster:
+        seat = get_seat(member) if isinstance(member, str) else member
+        if seat is None:
+            raise ValueError(f"Unknown board role: {member!r}")
+        seats.append(seat)
+    roles = [seat.role for seat in seats]
+    if not seats or len(set(roles)) != len(roles):
+        raise ValueError("A roster needs at least one member and unique roles")
+    return tuple(seats)
@@ -0,0 +1,71 @@
+"""Per-node and per-role model routing with a fast tier for easy decisions."""
+
+from dataclasses import dataclass, field
+
+from langchain_core.language_models import BaseChatModel
+
+from .company_state import Decision
+from .llm_clients import DEFAULT_MODEL, LLMClientRegistry
+
+# Model tiers recorded on the board meeting state
+STANDARD_TIER = "standard"
+FAST_TIER = "fast"  # Easy decision, executives answer with the fast models
+ESCALATED_TIER = "escalated"  # Fast-tier executives disagreed and were asked again
+
+
+@dataclass(frozen=True)
+class ModelRoute:
+    """Model settings used by one node or executive role."""
+
+    model: str = DEFAULT_MODEL
+    temperature: float | None = None  # None keeps the caller's default temperature
+    max_tokens: int | None = None
+
+    def chat_model(
+        self, registry: LLMClientRegistry, api_key: str | None, temperature: float
+    ) -> BaseChatModel:
+        """Return the registry's shared chat model for this route."""
+        options = {} if self.max_tokens is None else {"max_tokens": self.max_tokens}
+        return registry.get_chat_model(
+            api_key,
+            model=self.model,
+            temperature=temperature if self.temperature is None else self.temperature,
+            **options,
+        )
+
+
+@dataclass
+class ModelRouter:
+    """Routing of LLM calls to models by node name or executive role.
+
+    ``routes`` is keyed by node name (e.g. "plan_research",
+    "create_implementation_plan") or executive role (e.g. "CFO"); anything
+    not listed uses the default model. When ``fast_routes`` is set, board
+    meetings on easy decisions (a risk level in ``easy_risk_levels`` and a cost
+    of at most ``easy_max_cost``) ask the executives on those faster models
+    first, and only escalate to the regular routes if their votes disagree.
+    """
+
+    routes: dict[str, ModelRoute] = field(default_factory=dict)
+    fast_routes: dict[str, ModelRoute] = field(default_factory=dict)  # Keyed by role or "default"
+    easy_risk_levels: tuple[str, ...] = ("low",)
+    easy_max_cost: int = 100_000
+
+    def route(self, name: str) -> ModelRoute:
+        """Return the route of a node or role."""
+        return self.routes.get(name, ModelRoute())
+
+    def fast_route(self, role: str) -> ModelRoute | None:
+        """Return the fast-tier route of an executive role, if tiering is enabled."""
+        return self.fast_routes.get(role, self.fast_routes.get("default"))
+
+    def tier(self, decision: Decision | None) -> str:
+        """Return the model tier a board meeting on ``decision`` starts with."""
+        if (
+            self.fast_routes
+            and decision is not None
+            and decision["risk_level"] in self.easy_risk_levels
+            and decision["estimated_cost"] <= self.easy_max_cost
+        ):
+            return FAST_TIER
+        return STANDARD_TIER
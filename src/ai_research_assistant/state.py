@@ -1,6 +1,12 @@
 """State definitions for the AI Research Assistant."""
 
-from typing import TypedDict
+import operator
+from typing import Annotated, TypedDict
+
+from typing_extensions import NotRequired
+
+from .company_state import keep_first_error
+from .instrumentation import NodeSpan
 
 
 class ResearchState(TypedDict):
@@ -8,8 +14,24 @@ class ResearchState(TypedDict):
 
     question: str
     research_plan: str | None
+    prior_findings: list[str]  # Facts of related earlier research from the research store
+    covered_areas: list[str]  # Areas that earlier research already investigated
     collected_info: list[str]
+    info_digest: str | None  # collected_info, summarized to fit the context token budget
     analysis: str | None
     final_report: str | None
     current_step: str
-    error_message: str | None
+    error_message: Annotated[str | None, keep_first_error]
+    # Raw points from the parallel per-area collection tasks, merged into collected_info
+    collected_fragments: Annotated[list[str], operator.add]
+    trace: NotRequired[list[NodeSpan]]  # Set when the run is instrumented
+    run_id: NotRequired[str]  # Identifies the run's own facts in a shared fact index
+
+
+class CollectionTask(TypedDict):
+    """Input of one parallel information collection task."""
+
+    question: str
+    research_plan: str
+    area: str  # Investigation area from the plan, or the whole plan if it had none
+    run_id: str
@@ -0,0 +1,54 @@
+"""Streaming of node progress and LLM tokens from LangGraph workflows."""
+
+from collections.abc import AsyncIterator, Iterator
+from typing import Any, TypedDict
+
+from langchain_core.messages import BaseMessage
+from langchain_core.runnables import RunnableConfig
+
+STREAM_MODES = ["updates", "messages", "values"]
+
+
+class StreamEvent(TypedDict):
+    """A single progress event emitted while a workflow runs."""
+
+    type: str  # "token", "node" or "final"
+    node: str | None  # Node that produced the event; None for "final"
+    data: Any  # Token text, the node's state update, or the final state
+
+
+def stream_workflow(workflow: Any, input: Any, config: RunnableConfig) -> Iterator[StreamEvent]:
+    """Run a workflow, yielding token chunks, node updates and the final state."""
+    final_state: Any = None
+    for mode, chunk in workflow.stream(input, config, stream_mode=STREAM_MODES):
+        if mode == "values":
+            final_state = chunk
+        else:
+            yield from _to_events(mode, chunk)
+    yield StreamEvent(type="final", node=None, data=final_state)
+
+
+async def astream_workflow(
+    workflow: Any, input: Any, config: RunnableConfig
+) -> AsyncIterator[StreamEvent]:
+    """Async counterpart of ``stream_workflow``."""
+    final_state: Any = None
+    async for mode, chunk in workflow.astream(input, config, stream_mode=STREAM_MODES):
+        if mode == "values":
+            final_state = chunk
+        else:
+            for event in _to_events(mode, chunk):
+                yield event
+    yield StreamEvent(type="final", node=None, data=final_state)
+
+
+def _to_events(mode: str, chunk: Any) -> list[StreamEvent]:
+    """Convert a raw LangGraph stream chunk into stream events."""
+    if mode == "messages":
+        message, metadata = chunk
+        text = str(message.content or "") if isinstance(message, BaseMessage) else str(message)
+        if not text:
+            return []
+        return [StreamEvent(type="token", node=metadata.get("langgraph_node"), data=text)]
+
+    return [StreamEvent(type="node", node=node, data=update) for node, update in chunk.items()]
@@ -0,0 +1,147 @@
+"""What-if sweeps reusing the opinions and plans whose inputs did not change."""
+
+import asyncio
+import itertools
+import json
+import threading
+from collections import Counter
+from collections.abc import Awaitable, Callable, Iterable, Iterator, Mapping, Sequence
+from typing import Any, TypedDict, TypeVar, cast
+
+from langchain_core.runnables import RunnableConfig
+from langchain_core.runnables.config import merge_configs
+from typing_extensions import NotRequired
+
+from .batch import BoardMeetingRequest
+from .company_state import CompanyMetrics, Decision
+
+T = TypeVar("T")
+
+# Configurable entry holding the memo shared by the meetings of a sweep
+MEMO_KEY = "__sweep_memo"
+
+
+class SweepPoint(TypedDict):
+    """Overrides applied to the base meeting for one point of a sweep."""
+
+    metrics: NotRequired[dict[str, Any]]  # CompanyMetrics fields to replace
+    decision: NotRequired[dict[str, Any]]  # Decision fields to replace
+
+
+class SweepMemo:
+    """Thread-safe store of node results keyed by the inputs they were derived from.
+
+    Each node declares its dependencies, e.g. the metrics of an executive's
+    seat; a node whose dependencies match an earlier run reuses its result
+    instead of calling the LLM again. Concurrent runs needing the same result
+    wait for the first one to compute it.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty memo."""
+        self._values: dict[tuple[str, str], Any] = {}
+        self._locks: dict[tuple[str, str], threading.Lock] = {}
+        self._async_locks: dict[tuple[str, str], asyncio.Lock] = {}
+        self._lock = threading.Lock()
+        self.computed: Counter[str] = Counter()  # Results computed, by node
+        self.reused: Counter[str] = Counter()  # Results reused, by node
+
+    def __len__(self) -> int:
+        """Return the number of stored results."""
+        return len(self._values)
+
+    def get_or_compute(self, node: str, dependencies: Any, compute: Callable[[], T]) -> T:
+        """Return the result of ``node`` for ``dependencies``, computing it on first use."""
+        key = (node, _fingerprint(dependencies))
+        with self._key_lock(key):
+            if key in self._values:
+                return cast(T, self._record(node, self.reused, self._values[key]))
+            value = compute()
+            self._values[key] = value
+            return self._record(node, self.computed, value)
+
+    async def aget_or_compute(
+        self, node: str, dependencies: Any, compute: Callable[[], Awaitable[T]]
+    ) -> T:
+        """Async counterpart of ``get_or_compute``, for runs sharing one event loop."""
+        key = (node, _fingerprint(dependencies))
+        with self._lock:
+            lock = self._async_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            if key in self._values:
+                return cast(T, self._record(node, self.reused, self._values[key]))
+            value = await compute()
+            self._values[key] = value
+            return self._record(node, self.computed, value)
+
+    def _key_lock(self, key: tuple[str, str]) -> threading.Lock:
+        """Return the lock serializing the computation of one result."""
+        with self._lock:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def _record(self, node: str, counter: Counter[str], value: T) -> T:
+        """Count a computed or reused result of ``node``."""
+        with self._lock:
+            counter[node] += 1
+        return value
+
+
+def sweep_memo(config: RunnableConfig | None) -> SweepMemo | None:
+    """Return the memo of the sweep a run belongs to, if any."""
+    return ((config or {}).get("configurable") or {}).get(MEMO_KEY)
+
+
+def with_sweep_memo(config: RunnableConfig | None, memo: SweepMemo) -> RunnableConfig:
+    """Return a copy of ``config`` making its runs share ``memo``."""
+    return merge_configs(config, {"configurable": {MEMO_KEY: memo}})
+
+
+def sweep_grid(
+    metrics: Mapping[str, Sequence[Any]] | None = None,
+    decision: Mapping[str, Sequence[Any]] | None = None,
+) -> list[SweepPoint]:
+    """Build the points of a grid sweep, one per combination of the given values.
+
+    Example: ``sweep_grid(metrics={"revenue": [1e6, 2e6]}, decision={"estimated_cost":
+    [50_000, 100_000]})`` returns four points.
+    """
+    metrics = metrics or {}
+    decision = decision or {}
+    _check_fields("metric", metrics, CompanyMetrics.__annotations__)
+    _check_fields("decision", decision, Decision.__annotations__)
+    axes = [("metrics", field, values) for field, values in metrics.items()]
+    axes += [("decision", field, values) for field, values in decision.items()]
+    points = []
+    for combination in itertools.product(*(values for _, _, values in axes)):
+        point: dict[str, dict[str, Any]] = {}
+        for (part, field, _), value in zip(axes, combination):
+            point.setdefault(part, {})[field] = value
+        points.append(cast(SweepPoint, point))
+    return points
+
+
+def sweep_requests(
+    base: BoardMeetingRequest, points: Iterable[SweepPoint], default_metrics: CompanyMetrics
+) -> Iterator[BoardMeetingRequest]:
+    """Apply each point's overrides to the base meeting request."""
+    metrics = base.get("company_metrics") or default_metrics
+    for point in points:
+        yield {
+            **base,
+            "decision_details": cast(
+                Decision, {**base["decision_details"], **point.get("decision", {})}
+            ),
+            "company_metrics": cast(CompanyMetrics, {**metrics, **point.get("metrics", {})}),
+        }
+
+
+def _check_fields(kind: str, values: Mapping[str, Any], fields: Mapping[str, Any]) -> None:
+    """Reject sweep axes naming unknown fields."""
+    unknown = set(values) - set(fields)
+    if unknown:
+        raise ValueError(f"Unknown {kind} fields: {sorted(unknown)}")
+
+
+def _fingerprint(dependencies: Any) -> str:
+    """Canonical text of a node's dependencies, used as its memo key."""
+    return json.dumps(dependencies, sort_keys=True, default=str)
@@ -0,0 +1,100 @@
+"""Compiled workflows shared between instances, with nodes bound at run time."""
+
+import threading
+from collections.abc import Callable
+from functools import cache
+from typing import Any
+
+from langchain_core.runnables import RunnableConfig, RunnableLambda
+from langchain_core.runnables.config import merge_configs
+from langchain_core.runnables.utils import accepts_config
+from langgraph.checkpoint.base import BaseCheckpointSaver
+
+# Configurable entry holding the simulator or assistant a shared graph runs for.
+# Keys starting with "__" are never copied into checkpoint or trace metadata.
+OWNER_KEY = "__workflow_owner"
+
+
+class WorkflowCache:
+    """Thread-safe cache of compiled graphs keyed by the configuration they depend on.
+
+    Graphs are compiled once per key and shared by every instance; nodes look
+    up the instance they run for in the run configuration, so a new instance
+    only pays for a shallow copy carrying its own checkpointer.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self._graphs: dict[object, Any] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of compiled graphs."""
+        return len(self._graphs)
+
+    def get(self, key: object, build: Callable[[], Any]) -> Any:
+        """Return the compiled graph for ``key``, compiling it with ``build`` on first use.
+
+        ``key`` must be hashable, e.g. the owner's class or a tuple of roles.
+        """
+        with self._lock:
+            graph = self._graphs.get(key)
+            if graph is None:
+                graph = self._graphs[key] = build()
+            return graph
+
+    def clear(self) -> None:
+        """Forget all compiled graphs."""
+        with self._lock:
+            self._graphs.clear()
+
+
+def bind_workflow(graph: Any, owner: Any, checkpointer: BaseCheckpointSaver | None) -> Any:
+    """Return a copy of a shared graph running for ``owner`` with its checkpointer."""
+    config = merge_configs(graph.config, {"configurable": {OWNER_KEY: owner}})
+    return graph.copy({"checkpointer": checkpointer, "config": config})
+
+
+def workflow_owner(config: RunnableConfig) -> Any:
+    """Return the instance a shared graph is running for."""
+    return config["configurable"][OWNER_KEY]
+
+
+def owner_node(name: str, async_name: str | None = None, *args: Any) -> RunnableLambda:
+    """Build a graph node calling the owner's ``name`` method (and ``async_name`` under ainvoke).
+
+    Extra ``args`` are passed before the node input, e.g. the board seat of an
+    opinion node. The run configuration is forwarded to methods accepting one.
+    """
+
+    def node(value: Any, config: RunnableConfig) -> Any:
+        method = getattr(workflow_owner(config), name)
+        return method(*args, value, config) if _accepts_config(method) else method(*args, value)
+
+    async def anode(value: Any, config: RunnableConfig) -> Any:
+        method = getattr(workflow_owner(config), async_name or name)
+        return await method(*args, value, config)
+
+    node.__name__ = anode.__name__ = name
+    return RunnableLambda(node, afunc=anode if async_name else None)
+
+
+def owner_route(name: str) -> Callable[[Any, RunnableConfig], Any]:
+    """Build a conditional edge calling the owner's ``name`` method on the state."""
+
+    def route(state: Any, config: RunnableConfig) -> Any:
+        return getattr(workflow_owner(config), name)(state)
+
+    route.__name__ = name
+    return route
+
+
+@cache
+def _accepts_config_of(function: Callable[..., Any]) -> bool:
+    """Cached signature check of a plain function."""
+    return accepts_config(function)
+
+
+def _accepts_config(method: Any) -> bool:
+    """Return whether a bound method takes a ``config`` argument."""
+    return _accepts_config_of(getattr(method, "__func__", method))
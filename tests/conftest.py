@@ -0,0 +1,77 @@
+"""Shared pytest fixtures."""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.ai_research_assistant import (
+    BoardMeetingRequest,
+    CompanyMetrics,
+    Decision,
+    FakeChatModel,
+    FakeLLMBackend,
+    LLMClientRegistry,
+)
+from src.ai_research_assistant.llm_clients import set_default_registry
+
+
+@pytest.fixture(autouse=True)
+def fresh_llm_registry():
+    """Give every test its own default LLM client registry."""
+    set_default_registry(None)
+    yield
+    set_default_registry(None)
+
+
+@pytest.fixture
+def meeting_request() -> BoardMeetingRequest:
+    """A board meeting on a 150,000 AI support system: 6 months, 25% ROI, medium risk.
+
+    The company's metrics show a cash flow of 200,000 and revenue of 2,500,000.
+    """
+    return BoardMeetingRequest(
+        company_name="Test SaaS Co",
+        industry="SaaS Technology",
+        company_size="startup",
+        decision_topic="AI Customer Support Implementation",
+        decision_details=Decision(
+            title="Implement AI-Powered Customer Support System",
+            description="Deploy an AI chatbot to handle 70% of customer support inquiries.",
+            category="technical",
+            impact_areas=["customer_experience", "operations", "costs"],
+            estimated_cost=150000,
+            expected_roi=0.25,
+            timeline="6 months implementation",
+            risk_level="medium",
+        ),
+        company_metrics=CompanyMetrics(
+            revenue=2500000,
+            expenses=2200000,
+            profit=300000,
+            cash_flow=200000,
+            employee_count=25,
+            customer_satisfaction=8.2,
+            market_share=0.08,
+            tech_debt=6.5,
+            brand_value=7.1,
+        ),
+    )
+
+
+@pytest.fixture
+def fake_registry():
+    """Factory of LLM client registries serving from a ``FakeLLMBackend``."""
+
+    def create(**backend_options) -> LLMClientRegistry:
+        return LLMClientRegistry(backend=FakeLLMBackend(**backend_options))
+
+    return create
+
+
+@pytest.fixture
+def generate_calls():
+    """Spy on the fake chat model's ``_generate``, i.e. on every LLM request."""
+    with patch.object(
+        FakeChatModel, "_generate", autospec=True, side_effect=FakeChatModel._generate
+    ) as generate:
+        yield generate
@@ -0,0 +1,183 @@
+"""Tests for batch board meeting simulation."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, patch
+
+from src.ai_research_assistant import (
+    BoardMeetingRequest,
+    Decision,
+    RateLimit,
+    VirtualCompanySimulator,
+)
+from src.ai_research_assistant.batch import RateLimiter, run_batch
+
+
+def _request(title: str) -> BoardMeetingRequest:
+    return BoardMeetingRequest(
+        company_name="Test Co",
+        industry="Software",
+        company_size="startup",
+        decision_topic=title,
+        decision_details=Decision(
+            title=title,
+            description="A test decision",
+            category="technical",
+            impact_areas=["technology"],
+            estimated_cost=1000,
+            expected_roi=0.1,
+            timeline="1 month",
+            risk_level="low",
+        ),
+    )
+
+
+def _reject(state, config=None):
+    return {
+        "role": "EXEC",
+        "opinion": "No",
+        "reasoning": "Too risky",
+        "vote": "reject",
+        "priority_score": 3,
+    }
+
+
+class TestRunBatch:
+    """Test cases for the generic batch scheduler."""
+
+    def test_respects_max_concurrency_and_reports_failures(self):
+        """Test that in-flight items are bounded and failures do not abort the batch."""
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+
+        def work(item: int) -> int:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.01)
+            with lock:
+                active -= 1
+            if item == 3:
+                raise RuntimeError("boom")
+            return item * 2
+
+        outcomes = list(run_batch(work, range(10), max_concurrency=3))
+
+        assert peak <= 3
+        assert sorted(o.index for o in outcomes) == list(range(10))
+        failed = [o for o in outcomes if o.error]
+        assert len(failed) == 1 and failed[0].item == 3
+        assert {o.value for o in outcomes if not o.error} == {i * 2 for i in range(10) if i != 3}
+
+
+class TestRateLimiter:
+    """Test cases for the token-bucket rate limiter."""
+
+    def test_waits_once_budget_is_exhausted(self):
+        """Test that the limiter reports a wait once the bucket is empty."""
+        now = [0.0]
+        limiter = RateLimiter(RateLimit(requests_per_minute=60), clock=lambda: now[0])
+
+        assert limiter._try_acquire(60, 0) == 0.0
+        assert limiter._try_acquire(1, 0) == 1.0
+
+        now[0] = 1.0
+        assert limiter._try_acquire(1, 0) == 0.0
+
+    def test_token_usage_reconciliation(self):
+        """Test that usage beyond the reservation delays later requests."""
+        now = [0.0]
+        limiter = RateLimiter(RateLimit(tokens_per_minute=6000), clock=lambda: now[0])
+
+        assert limiter._try_acquire(1, 1000) == 0.0
+        limiter.record_usage(5000)
+        assert limiter._try_acquire(1, 1000) == 10.0
+
+    def test_request_usage_reconciliation(self):
+        """Test that requests reserved but not made are credited back."""
+        now = [0.0]
+        limiter = RateLimiter(RateLimit(requests_per_minute=60), clock=lambda: now[0])
+
+        assert limiter._try_acquire(30, 0) == 0.0
+        limiter.record_usage(requests=-20)
+        assert limiter._try_acquire(50, 0) == 0.0
+        assert limiter._try_acquire(1, 0) == 1.0
+
+
+class TestBoardMeetingBatch:
+    """Test cases for VirtualCompanySimulator batch APIs."""
+
+    def test_simulate_board_meetings_batch(self):
+        """Test that every meeting yields a result, including failed ones."""
+        simulator = VirtualCompanySimulator(openai_api_key="test-key")
+        requests = [_request(f"Decision {i}") for i in range(5)]
+        requests[2]["decision_details"] = None
+
+        with (
+            patch.object(simulator.ceo, "get_opinion", side_effect=_reject),
+            patch.object(simulator.cto, "get_opinion", side_effect=_reject),
+            patch.object(simulator.cmo, "get_opinion", side_effect=_reject),
+            patch.object(simulator.cfo, "get_opinion", side_effect=_reject),
+        ):
+            results = list(
+                simulator.simulate_board_meetings_batch(
+                    requests, max_concurrency=2, rate_limit=RateLimit(requests_per_minute=600)
+                )
+            )
+
+        assert sorted(r["index"] for r in results) == list(range(5))
+        failed = [r for r in results if r["error"]]
+        assert [r["index"] for r in failed] == [2]
+        for result in results:
+            if not result["error"]:
+                assert result["state"]["final_decision"] == "REJECTED"
+
+    def test_asimulate_board_meetings_batch(self):
+        """Test the async batch API yields every meeting."""
+        simulator = VirtualCompanySimulator(openai_api_key="test-key")
+        for role in ["ceo", "cto", "cmo", "cfo"]:
+            patch.object(
+                getattr(simulator, role), "aget_opinion", new=AsyncMock(side_effect=_reject)
+            ).start()
+
+        async def collect():
+            return [
+                result
+                async for result in simulator.asimulate_board_meetings_batch(
+                    [_request(f"Decision {i}") for i in range(6)], max_concurrency=3
+                )
+            ]
+
+        try:
+            results = asyncio.run(collect())
+        finally:
+            patch.stopall()
+
+        assert len(results) == 6
+        assert all(r["state"]["final_decision"] == "REJECTED" for r in results)
+
+    def test_requests_reserved_per_meeting(self, fake_registry):
+        """Test that meetings reserve every possible request and settle what they made."""
+        simulator = VirtualCompanySimulator(
+            llm_registry=fake_registry(approve_probability=1),
+            max_deliberation_rounds=2,
+            opinion_samples=3,
+        )
+        # Three rounds of four opinions, plus the implementation plan
+        assert simulator.llm_calls_per_meeting == 13
+        with patch("src.ai_research_assistant.executives._supports_n", return_value=False):
+            assert simulator.llm_calls_per_meeting == 37
+
+        with patch.object(RateLimiter, "record_usage", autospec=True) as record_usage:
+            results = list(
+                simulator.simulate_board_meetings_batch(
+                    [_request("Decision")], rate_limit=RateLimit(requests_per_minute=600)
+                )
+            )
+
+        assert results[0]["state"]["final_decision"] == "APPROVED"
+        # A unanimous meeting asks each member once and writes the plan
+        assert record_usage.call_args.args[2] == 5 - 13
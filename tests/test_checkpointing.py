@@ -0,0 +1,183 @@
+"""Tests for checkpointed, resumable runs."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from src.ai_research_assistant import Decision, ResearchAssistant, VirtualCompanySimulator
+
+
+def _flaky_responses(fail_at: int):
+    """Return an LLM side effect raising once on the given call number."""
+    calls = {"count": 0}
+
+    def respond(messages, config=None):
+        calls["count"] += 1
+        if calls["count"] == fail_at:
+            raise RuntimeError("transient failure")
+        return AIMessage(content=f"response {calls['count']}")
+
+    return respond, calls
+
+
+class TestResumableResearch:
+    """Test cases for resuming ResearchAssistant runs."""
+
+    @patch("langchain_openai.ChatOpenAI")
+    def test_failed_report_resumes_without_repeating_earlier_nodes(self, mock_chat_openai):
+        """Test that resuming a thread starts from the failed step, not from scratch."""
+        respond, calls = _flaky_responses(fail_at=4)
+        mock_chat_openai.return_value.invoke.side_effect = respond
+        assistant = ResearchAssistant(openai_api_key="test-key", checkpointer="memory")
+
+        failed = assistant.research("question", thread_id="run-1")
+        assert "transient failure" in failed["error_message"]
+        assert calls["count"] == 4
+
+        resumed = assistant.research("question", thread_id="run-1")
+        assert resumed["error_message"] is None
+        assert resumed["final_report"] == "response 5"
+        assert resumed["research_plan"] == "response 1"
+        assert calls["count"] == 5
+
+        # A completed thread is returned from storage without new LLM calls
+        assert assistant.research("question", thread_id="run-1")["final_report"] == "response 5"
+        assert calls["count"] == 5
+
+    @patch("langchain_openai.ChatOpenAI")
+    def test_sqlite_checkpoints_survive_new_instance(self, mock_chat_openai, tmp_path):
+        """Test that a new assistant can resume a run stored in a SQLite file."""
+        pytest.importorskip("langgraph.checkpoint.sqlite")
+        respond, calls = _flaky_responses(fail_at=3)
+        mock_chat_openai.return_value.invoke.side_effect = respond
+        path = tmp_path / "checkpoints.db"
+
+        ResearchAssistant(openai_api_key="test-key", checkpointer=path).research(
+            "question", thread_id="run-2"
+        )
+        resumed = ResearchAssistant(openai_api_key="test-key", checkpointer=path).research(
+            "question", thread_id="run-2"
+        )
+
+        # The failed run stops at the analysis, so only analysis and report follow
+        assert resumed["error_message"] is None
+        assert resumed["analysis"] == "response 4"
+        assert calls["count"] == 5
+
+    @patch("langchain_openai.ChatOpenAI")
+    def test_async_resume_with_sqlite(self, mock_chat_openai, tmp_path):
+        """Test that async runs can use and resume from SQLite checkpoints."""
+        pytest.importorskip("langgraph.checkpoint.sqlite")
+        respond, calls = _flaky_responses(fail_at=2)
+        mock_chat_openai.return_value.ainvoke = AsyncMock(side_effect=respond)
+        assistant = ResearchAssistant(
+            openai_api_key="test-key", checkpointer=tmp_path / "checkpoints.db"
+        )
+
+        async def run_twice():
+            await assistant.aresearch("question", thread_id="run-3")
+            return await assistant.aresearch("question", thread_id="run-3")
+
+        resumed = asyncio.run(run_twice())
+        assert resumed["error_message"] is None
+        assert resumed["research_plan"] == "response 1"
+        assert calls["count"] == 5
+
+
+class TestResumableBoardMeeting:
+    """Test cases for resuming board meetings."""
+
+    def test_failed_plan_resumes_without_new_opinions(self):
+        """Test that executive opinions are not re-collected when the plan fails."""
+        simulator = VirtualCompanySimulator(openai_api_key="test-key", checkpointer="memory")
+        opinion = {
+            "role": "EXEC",
+            "opinion": "Yes",
+            "reasoning": "Good ROI",
+            "vote": "approve",
+            "priority_score": 8,
+        }
+        get_opinion = MagicMock(return_value=opinion)
+        for role in ["ceo", "cto", "cmo", "cfo"]:
+            setattr(getattr(simulator, role), "get_opinion", get_opinion)
+        respond, _ = _flaky_responses(fail_at=1)
+        simulator.facilitator = MagicMock()
+        simulator.facilitator.invoke.side_effect = respond
+        decision = _decision()
+        meeting = dict(
+            company_name="Test Co",
+            industry="Software",
+            company_size="startup",
+            decision_topic="Test",
+            decision_details=decision,
+            thread_id="meeting-1",
+        )
+
+        failed = simulator.simulate_board_meeting(**meeting)
+        assert "transient failure" in failed["error_message"]
+
+        resumed = simulator.simulate_board_meeting(**meeting)
+        assert resumed["error_message"] is None
+        assert resumed["implementation_plan"] == "response 2"
+        assert get_opinion.call_count == 4
+
+    def test_failed_opinion_reruns_its_whole_step(self):
+        """Test that resuming after one failed opinion asks every executive again.
+
+        Nodes record errors in state instead of raising, so the writes of the
+        opinions that succeeded belong to the failed step and are not kept.
+        """
+        simulator = VirtualCompanySimulator(openai_api_key="test-key", checkpointer="memory")
+        calls = {"count": 0, "cfo": 0}
+
+        def make_opinion(role):
+            def get_opinion(state):
+                calls["count"] += 1
+                if role == "CFO":
+                    calls["cfo"] += 1
+                    if calls["cfo"] == 1:
+                        raise RuntimeError("transient failure")
+                return {
+                    "role": role,
+                    "opinion": "No",
+                    "reasoning": "Too costly",
+                    "vote": "reject",
+                    "priority_score": 3,
+                }
+
+            return get_opinion
+
+        for role in ["ceo", "cto", "cmo", "cfo"]:
+            getattr(simulator, role).get_opinion = make_opinion(role.upper())
+        meeting = dict(
+            company_name="Test Co",
+            industry="Software",
+            company_size="startup",
+            decision_topic="Test",
+            decision_details=_decision(),
+            thread_id="meeting-2",
+        )
+
+        failed = simulator.simulate_board_meeting(**meeting)
+        assert "transient failure" in failed["error_message"]
+        assert calls["count"] == 4
+
+        resumed = simulator.simulate_board_meeting(**meeting)
+        assert resumed["error_message"] is None
+        assert resumed["final_decision"] == "REJECTED"
+        assert calls["count"] == 8
+
+
+def _decision() -> Decision:
+    return Decision(
+        title="Test",
+        description="Test decision",
+        category="technical",
+        impact_areas=["technology"],
+        estimated_cost=1000,
+        expected_roi=0.1,
+        timeline="1 month",
+        risk_level="low",
+    )
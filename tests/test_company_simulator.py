@@ -1,18 +1,24 @@
 """Tests for the Virtual Company Simulator."""
 
-from unittest.mock import patch
+import asyncio
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from langchain_core.messages import AIMessage
 
 from src.ai_research_assistant import (
-    VirtualCompanySimulator,
-    CompanyMetrics,
-    Decision,
     CEOExecutive,
-    CTOExecutive,
-    CMOExecutive,
     CFOExecutive,
+    CMOExecutive,
+    CompanyMetrics,
+    CTOExecutive,
+    Decision,
+    MeetingMinute,
+    VirtualCompanySimulator,
+    render_minute,
 )
+from src.ai_research_assistant.company_state import append_minutes
 
 
 class TestVirtualCompanySimulator:
@@ -26,6 +32,8 @@ class TestVirtualCompanySimulator:
         assert isinstance(simulator.cto, CTOExecutive)
         assert isinstance(simulator.cmo, CMOExecutive)
         assert isinstance(simulator.cfo, CFOExecutive)
+        assert list(simulator.executives) == ["CEO", "CTO", "CMO", "CFO"]
+        assert simulator.cfo is simulator.executives["CFO"]
 
     def test_init_without_api_key_raises_error(self):
         """Test that initialization without API key raises ValueError."""
@@ -39,7 +47,7 @@ class TestVirtualCompanySimulator:
         simulator = VirtualCompanySimulator()
         assert simulator.api_key == "env-test-key"
 
-    @patch("src.ai_research_assistant.company_simulator.ChatOpenAI")
+    @patch("langchain_openai.ChatOpenAI")
     def test_workflow_creation(self, mock_chat_openai):
         """Test that workflow is properly created."""
         simulator = VirtualCompanySimulator(openai_api_key="test-key")
@@ -79,11 +87,103 @@ class TestVirtualCompanySimulator:
         assert decision["expected_roi"] == 0.20
         assert "technology" in decision["impact_areas"]
 
+    def test_executive_opinions_run_in_parallel(self):
+        """Test that all executives are consulted concurrently and minutes are merged."""
+        simulator = VirtualCompanySimulator(openai_api_key="test-key")
+        barrier = threading.Barrier(4, timeout=5)
+
+        def make_opinion(role):
+            def get_opinion(state):
+                # Fails with BrokenBarrierError unless all four run at once
+                barrier.wait()
+                return _sample_opinion(role, "reject")
+
+            return get_opinion
+
+        for role in ["ceo", "cto", "cmo", "cfo"]:
+            patch.object(
+                getattr(simulator, role), "get_opinion", side_effect=make_opinion(role.upper())
+            ).start()
+        try:
+            result = simulator.simulate_board_meeting(
+                company_name="Test Co",
+                industry="Software",
+                company_size="startup",
+                decision_topic="Test",
+                decision_details=_sample_decision(),
+            )
+        finally:
+            patch.stopall()
+
+        assert result["error_message"] is None
+        assert result["final_decision"] == "REJECTED"
+        for role in ["ceo", "cto", "cmo", "cfo"]:
+            assert result["opinions"][role.upper()]["role"] == role.upper()
+        # presentation + 4 opinions + discussion + vote + outcome
+        assert [m["kind"] for m in result["meeting_minutes"]] == [
+            "presentation",
+            *["opinion"] * 4,
+            "discussion",
+            "vote",
+            "outcome",
+        ]
+
+    def test_asimulate_board_meeting(self):
+        """Test the async entry point gathering opinions through aget_opinion."""
+        simulator = VirtualCompanySimulator(openai_api_key="test-key")
+        for role in ["ceo", "cto", "cmo", "cfo"]:
+            patch.object(
+                getattr(simulator, role),
+                "aget_opinion",
+                new=AsyncMock(return_value=_sample_opinion(role.upper(), "approve")),
+            ).start()
+        simulator.facilitator = MagicMock()
+        simulator.facilitator.ainvoke = AsyncMock(return_value=AIMessage(content="Plan"))
+        try:
+            result = asyncio.run(
+                simulator.asimulate_board_meeting(
+                    company_name="Test Co",
+                    industry="Software",
+                    company_size="startup",
+                    decision_topic="Test",
+                    decision_details=_sample_decision(),
+                )
+            )
+        finally:
+            patch.stopall()
+
+        assert result["final_decision"] == "APPROVED"
+        assert result["implementation_plan"] == "Plan"
+        assert result["error_message"] is None
+
+
+def _sample_opinion(role: str, vote: str) -> dict:
+    return {
+        "role": role,
+        "opinion": f"{role} opinion",
+        "reasoning": "reasoning",
+        "vote": vote,
+        "priority_score": 5,
+    }
+
+
+def _sample_decision() -> Decision:
+    return Decision(
+        title="Test Decision",
+        description="A test decision for the board",
+        category="technical",
+        impact_areas=["technology", "costs"],
+        estimated_cost=100000,
+        expected_roi=0.20,
+        timeline="3 months",
+        risk_level="medium",
+    )
+
 
 class TestExecutives:
     """Test cases for AI executives."""
 
-    @patch("src.ai_research_assistant.executives.ChatOpenAI")
+    @patch("langchain_openai.ChatOpenAI")
     def test_executives_initialization(self, mock_chat_openai):
         """Test that all executives can be initialized."""
         ceo = CEOExecutive(openai_api_key="test-key")
@@ -95,3 +195,274 @@ class TestExecutives:
         assert cto.llm is not None
         assert cmo.llm is not None
         assert cfo.llm is not None
+
+
+class TestOpinionParsing:
+    """Test cases for parsing executive responses."""
+
+    def test_structured_json_maps_onto_opinion(self):
+        """Test that schema-conforming JSON is used as is."""
+        cto = CTOExecutive(openai_api_key="test-key")
+
+        opinion = cto._parse_opinion(
+            '{"opinion": "Feasible.", "reasoning": "Team has skills.", '
+            '"vote": "approve", "priority_score": 12}'
+        )
+
+        assert opinion["role"] == "CTO"
+        assert opinion["opinion"] == "Feasible."
+        assert opinion["vote"] == "approve"
+        assert opinion["priority_score"] == 10
+        assert opinion["parse_quality"] == "structured"
+
+    def test_labeled_text_fallback(self):
+        """Test single-pass parsing of markdown-style labeled text."""
+        cfo = CFOExecutive(openai_api_key="test-key")
+
+        opinion = cfo._parse_opinion(
+            "**Opinion:** Too expensive right now.\n"
+            "- **Reasoning**: Cash flow is tight.\n"
+            "**Vote:** I cannot approve this proposal.\n"
+            "Priority Score: 3"
+        )
+
+        assert opinion["opinion"] == "Too expensive right now."
+        assert opinion["reasoning"] == "Cash flow is tight."
+        assert opinion["vote"] == "reject"
+        assert opinion["priority_score"] == 3
+        assert opinion["parse_quality"] == "labeled"
+
+    def test_unlabeled_text_does_not_guess_vote(self):
+        """Test that an incidental "approve" in free text is not counted as a vote."""
+        cmo = CMOExecutive(openai_api_key="test-key")
+
+        opinion = cmo._parse_opinion("I cannot approve of the branding direction yet.")
+
+        assert opinion["vote"] == "abstain"
+        assert opinion["priority_score"] == cmo.default_priority
+        assert opinion["parse_quality"] == "unparsed"
+
+    def test_get_opinion_requests_structured_output(self):
+        """Test that the model is asked for JSON matching the opinion schema."""
+        ceo = CEOExecutive(openai_api_key="test-key")
+        ceo.llm = MagicMock()
+        ceo.llm.invoke.return_value = AIMessage(
+            content='{"opinion": "Go.", "reasoning": "Fits strategy.", '
+            '"vote": "approve", "priority_score": 8}'
+        )
+        state = VirtualCompanySimulator(openai_api_key="test-key")._initial_state(
+            "Test Co", "Software", "startup", "Test", _sample_decision(), None
+        )
+
+        opinion = ceo.get_opinion(state)
+
+        response_format = ceo.llm.invoke.call_args.kwargs["response_format"]
+        assert response_format["json_schema"]["schema"]["required"] == [
+            "opinion",
+            "reasoning",
+            "vote",
+            "priority_score",
+        ]
+        assert opinion["priority_score"] == 8
+
+
+class TestMeetingMinutes:
+    """Test cases for structured meeting minutes."""
+
+    def test_append_minutes_accepts_single_entry_or_list(self):
+        """Test that the reducer appends deltas without modifying earlier entries."""
+        first = MeetingMinute(kind="vote", speaker="Board", text="a", data={})
+        second = MeetingMinute(kind="plan", speaker="Board", text="b", data={})
+        current = [first]
+
+        merged = append_minutes(current, second)
+
+        assert merged == [first, second]
+        assert current == [first]
+        assert append_minutes(merged, [first, first])[2:] == [first, first]
+
+    def test_render_minute(self):
+        """Test the text rendering of a minute."""
+        minute = MeetingMinute(
+            kind="opinion",
+            speaker="CFO",
+            text="Too expensive.",
+            data={"vote": "REJECT", "priority_score": "7/10"},
+        )
+
+        assert render_minute(minute) == (
+            "💰 OPINION - CFO\nToo expensive.\n- Vote: REJECT\n- Priority Score: 7/10"
+        )
+
+
+class TestDeliberation:
+    """Test cases for multi-round deliberation."""
+
+    def _run(self, max_rounds: int, votes_by_round: dict[str, list[str]]) -> dict:
+        """Run a meeting where each role votes from its list, one entry per round."""
+        simulator = VirtualCompanySimulator(
+            openai_api_key="test-key", max_deliberation_rounds=max_rounds
+        )
+        simulator.facilitator = MagicMock()
+        simulator.facilitator.invoke.return_value = AIMessage(content="Plan")
+
+        def make_opinion(role):
+            def get_opinion(state):
+                votes = votes_by_round[role]
+                return _sample_opinion(role, votes[min(len(state["vote_rounds"]), len(votes) - 1)])
+
+            return get_opinion
+
+        for role in votes_by_round:
+            patch.object(
+                getattr(simulator, role.lower()), "get_opinion", side_effect=make_opinion(role)
+            ).start()
+        try:
+            return simulator.simulate_board_meeting(
+                company_name="Test Co",
+                industry="Software",
+                company_size="startup",
+                decision_topic="Test",
+                decision_details=_sample_decision(),
+            )
+        finally:
+            patch.stopall()
+
+    def test_single_round_by_default(self):
+        """Test that without deliberation the board votes after one round."""
+        result = self._run(
+            0, {"CEO": ["approve"], "CTO": ["reject"], "CMO": ["approve"], "CFO": ["approve"]}
+        )
+
+        assert len(result["vote_rounds"]) == 1
+        assert result["final_decision"] == "APPROVED"
+
+    def test_stops_on_consensus(self):
+        """Test that deliberation ends as soon as the vote is unanimous."""
+        result = self._run(
+            5,
+            {
+                "CEO": ["approve"],
+                "CTO": ["reject", "approve"],
+                "CMO": ["approve"],
+                "CFO": ["reject", "approve"],
+            },
+        )
+
+        assert len(result["vote_rounds"]) == 2
+        assert set(result["vote_rounds"][-1].values()) == {"approve"}
+        assert result["final_decision"] == "APPROVED"
+
+    def test_stops_when_no_vote_changes(self):
+        """Test that a round without vote changes ends deliberation."""
+        result = self._run(
+            5, {"CEO": ["approve"], "CTO": ["reject"], "CMO": ["reject"], "CFO": ["reject"]}
+        )
+
+        assert len(result["vote_rounds"]) == 2
+        assert result["final_decision"] == "REJECTED"
+
+    def test_stops_at_round_limit(self):
+        """Test that changing votes are cut off at the round limit."""
+        flip = ["approve", "reject", "approve", "reject", "approve"]
+        result = self._run(
+            2, {"CEO": flip, "CTO": ["reject"], "CMO": ["reject"], "CFO": ["approve"]}
+        )
+
+        assert len(result["vote_rounds"]) == 3
+        assert [m["kind"] for m in result["meeting_minutes"]].count("opinion") == 12
+
+    def test_revision_prompt_includes_other_positions(self):
+        """Test that executives see the others' positions in later rounds."""
+        cfo = CFOExecutive(openai_api_key="test-key")
+        state = VirtualCompanySimulator(openai_api_key="test-key")._initial_state(
+            "Test Co", "Software", "startup", "Test", _sample_decision(), None
+        )
+        state["opinions"] = {
+            "CEO": _sample_opinion("CEO", "approve"),
+            "CFO": _sample_opinion("CFO", "reject"),
+        }
+        state["vote_rounds"] = [{"CEO": "approve", "CFO": "reject"}]
+
+        messages = cfo._opinion_messages(state)
+
+        assert "Vote: reject" in messages[-2].content
+        assert "- CEO: approve (priority 5/10): CEO opinion" in messages[-1].content
+        assert "- CFO" not in messages[-1].content
+
+
+class TestOpinionSampling:
+    """Test cases for multi-sample opinion voting."""
+
+    def test_samples_come_from_one_request_per_executive(
+        self, fake_registry, meeting_request, generate_calls
+    ):
+        """Test that models supporting ``n`` return every sample from a single call."""
+        simulator = VirtualCompanySimulator(
+            llm_registry=fake_registry(approve_probability=0.5), opinion_samples=8
+        )
+
+        result = simulator.simulate_board_meeting(**meeting_request)
+
+        assert result["error_message"] is None
+        # One request per executive, plus the implementation plan if approved
+        planned = result["final_decision"] == "APPROVED"
+        assert generate_calls.call_count == len(simulator.roster) + planned
+        for opinion in result["opinions"].values():
+            distribution = opinion["vote_distribution"]
+            assert opinion["samples"] == 8
+            assert sum(distribution.values()) == pytest.approx(1)
+            assert distribution[opinion["vote"]] == max(distribution.values())
+        vote = next(m for m in result["meeting_minutes"] if m["kind"] == "vote")
+        assert sum(vote["data"].values()) == pytest.approx(4)
+
+    def test_batch_fallback_without_n(self):
+        """Test that models without ``n`` are sampled with one batch of requests."""
+        ceo = CEOExecutive(openai_api_key="test-key", samples=3)
+        ceo.llm = MagicMock()
+        ceo.llm.batch.return_value = [
+            AIMessage(
+                content=f'{{"opinion": "{vote}", "reasoning": "r", '
+                f'"vote": "{vote}", "priority_score": {priority}}}'
+            )
+            for vote, priority in [("reject", 3), ("approve", 8), ("approve", 7)]
+        ]
+        state = VirtualCompanySimulator(openai_api_key="test-key")._initial_state(
+            "Test Co", "Software", "startup", "Test", _sample_decision(), None
+        )
+
+        opinion = ceo.get_opinion(state)
+
+        assert len(ceo.llm.batch.call_args.args[0]) == 3
+        assert opinion["vote"] == "approve"
+        assert opinion["opinion"] == "approve"
+        assert opinion["vote_distribution"] == pytest.approx(
+            {"approve": 2 / 3, "reject": 1 / 3, "abstain": 0}
+        )
+        assert opinion["mean_priority"] == 6
+        with pytest.raises(ValueError, match="samples"):
+            CEOExecutive(openai_api_key="test-key", samples=0)
+
+    def test_vote_tallies_distributions(self):
+        """Test that the board weighs each member's vote distribution, not only its majority."""
+        simulator = VirtualCompanySimulator(openai_api_key="test-key")
+        opinions = {
+            "CEO": {
+                **_sample_opinion("CEO", "approve"),
+                "vote_distribution": {"approve": 0.6, "reject": 0.4, "abstain": 0.0},
+            },
+            "CTO": {
+                **_sample_opinion("CTO", "approve"),
+                "vote_distribution": {"approve": 0.6, "reject": 0.4, "abstain": 0.0},
+            },
+            "CFO": {
+                **_sample_opinion("CFO", "reject"),
+                "vote_distribution": {"approve": 0.0, "reject": 1.0, "abstain": 0.0},
+            },
+        }
+
+        update = simulator._vote_and_decide({"opinions": opinions})
+
+        # Two majorities approve, yet the board leans 1.8 to 1.2 towards rejecting
+        assert update["final_decision"] == "REJECTED"
+        assert update["meeting_minutes"]["data"] == {"approve": 1.2, "reject": 1.8, "abstain": 0}
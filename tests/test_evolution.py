@@ -0,0 +1,147 @@
+"""Tests for the multi-quarter company evolution engine."""
+
+import numpy as np
+import pytest
+
+from src.ai_research_assistant import CompanyEvolution, EvolutionModel, VirtualCompanySimulator
+from src.ai_research_assistant.company_simulator import DEFAULT_COMPANY_METRICS
+from src.ai_research_assistant.evolution import format_quarter, parse_quarter, timeline_quarters
+
+# Dynamics without any randomness, so effects can be checked exactly
+STEADY = EvolutionModel(
+    revenue_growth=0,
+    revenue_volatility=0,
+    expense_growth=0,
+    expense_volatility=0,
+    market_growth=0,
+    tech_debt_drift=0,
+    score_volatility=0,
+    payback_quarters=4,
+    risk_volatility={"medium": 0},
+)
+
+
+class TestQuartersAndTimelines:
+    """Test cases for quarter labels and decision timelines."""
+
+    def test_quarter_labels_roll_over_years(self):
+        """Test parsing and advancing quarter labels."""
+        assert parse_quarter("Q3 2025") == (2025, 3)
+        assert format_quarter((2025, 3), 2) == "Q1 2026"
+        with pytest.raises(ValueError):
+            parse_quarter("2025-03")
+
+    def test_timelines_in_quarters(self):
+        """Test that timelines are rounded to whole quarters."""
+        assert timeline_quarters("6 months implementation") == 2
+        assert timeline_quarters("12-18 months") == 5
+        assert timeline_quarters("1 year") == 4
+        assert timeline_quarters("as soon as possible") == 1
+
+
+class TestCompanyEvolution:
+    """Test cases for the vectorized trajectories."""
+
+    def test_trajectories_are_vectorized_and_reproducible(self):
+        """Test that every metric has one row per quarter and one column per path."""
+        first = CompanyEvolution(DEFAULT_COMPANY_METRICS, paths=500, seed=7)
+        second = CompanyEvolution(DEFAULT_COMPANY_METRICS, paths=500, seed=7)
+        first.step(12)
+        second.step(12)
+
+        history = first.history()
+
+        assert history.trajectories["revenue"].shape == (13, 500)
+        assert history.quarters[-1] == "Q1 2027"
+        assert np.array_equal(
+            history.trajectories["profit"], second.history().trajectories["profit"]
+        )
+        low, median, high = history.percentiles("revenue")[:, -1]
+        assert low < median < high
+
+    def test_adopted_decision_costs_then_returns(self, meeting_request):
+        """Test that a decision is paid over its timeline and then returns cost * (1 + ROI)."""
+        decision = meeting_request["decision_details"]  # 6 months, 25% ROI
+        evolution = CompanyEvolution(DEFAULT_COMPANY_METRICS, paths=3, model=STEADY)
+        evolution.adopt(decision)
+        evolution.step(7)
+
+        trajectories = evolution.history().trajectories
+        cost = decision["estimated_cost"]
+        extra_expenses = trajectories["expenses"][:, 0] - DEFAULT_COMPANY_METRICS["expenses"]
+        extra_revenue = trajectories["revenue"][:, 0] - DEFAULT_COMPANY_METRICS["revenue"]
+        assert extra_expenses == pytest.approx([0, cost / 2, cost / 2, 0, 0, 0, 0, 0])
+        assert extra_revenue.sum() == pytest.approx(cost * (1 + decision["expected_roi"]))
+        assert (
+            trajectories["customer_satisfaction"][-1, 0]
+            > DEFAULT_COMPANY_METRICS["customer_satisfaction"]
+        )
+
+    def test_zero_revenue_company_keeps_its_market_share(self):
+        """Test that a company without revenue does not produce NaN metrics."""
+        metrics = {**DEFAULT_COMPANY_METRICS, "revenue": 0}
+        evolution = CompanyEvolution(metrics, paths=5, model=STEADY)
+        evolution.step(4)
+
+        trajectories = evolution.history().trajectories
+
+        assert all(np.isfinite(values).all() for values in trajectories.values())
+        assert trajectories["market_share"][-1] == pytest.approx(
+            [DEFAULT_COMPANY_METRICS["market_share"]] * 5
+        )
+        assert evolution.metrics()["market_share"] == DEFAULT_COMPANY_METRICS["market_share"]
+
+
+class TestCompanyHistory:
+    """Test cases for histories with board meetings at decision points."""
+
+    @pytest.fixture
+    def simulate(self, fake_registry, meeting_request):
+        """Run an eight-quarter history voting on the meeting's decision at given quarters."""
+
+        def simulate(approve_probability: float, agenda_quarters: list[int]):
+            registry = fake_registry(approve_probability=approve_probability)
+            simulator = VirtualCompanySimulator(llm_registry=registry)
+            agenda = [
+                {
+                    "quarter": quarter,
+                    "decision_topic": meeting_request["decision_topic"],
+                    "decision_details": meeting_request["decision_details"],
+                }
+                for quarter in agenda_quarters
+            ]
+            return simulator.simulate_company_history(
+                meeting_request["company_name"],
+                meeting_request["industry"],
+                meeting_request["company_size"],
+                agenda,
+                quarters=8,
+                company_metrics=meeting_request["company_metrics"],
+                start_quarter="Q3 2025",
+                paths=50,
+                model=STEADY,
+            )
+
+        return simulate
+
+    def test_board_meets_at_decision_points(self, simulate):
+        """Test that meetings see the quarter's label and evolved metrics."""
+        history = simulate(1, [5, 0])
+
+        assert len(history.quarters) == 9
+        assert [meeting["current_quarter"] for meeting in history.meetings] == [
+            "Q3 2025",
+            "Q4 2026",
+        ]
+        assert all(meeting["final_decision"] == "APPROVED" for meeting in history.meetings)
+        assert history.meetings[1]["metrics"] == history.metrics(5)
+        with pytest.raises(ValueError, match="outside"):
+            simulate(1, [8])
+
+    def test_rejected_decisions_leave_the_company_unchanged(self, simulate):
+        """Test that only approved decisions are applied to the trajectories."""
+        rejected = simulate(0, [1])
+        untouched = simulate(0, [])
+
+        assert rejected.meetings[0]["final_decision"] == "REJECTED"
+        assert np.array_equal(rejected.trajectories["revenue"], untouched.trajectories["revenue"])
@@ -0,0 +1,125 @@
+"""Tests for the near-duplicate fact index."""
+
+from unittest.mock import patch
+
+from src.ai_research_assistant import (
+    FactIndex,
+    FakeLLMBackend,
+    Instrumentation,
+    LLMClientRegistry,
+    ResearchAssistant,
+)
+
+
+class TestFactIndex:
+    """Test cases for FactIndex."""
+
+    def test_near_duplicates_join_the_first_fact(self):
+        """Test that rewordings differing in case, punctuation or a word are merged."""
+        index = FactIndex()
+
+        first = index.add("- Adoption has grown steadily over the last three years.")
+        second = index.add("adoption has grown steadily over the last three years")
+        third = index.add("Adoption has grown steadily over the past three years.")
+
+        assert first == second == third
+        assert len(index) == 1
+        assert index.facts[0].duplicates == 2
+
+    def test_distinct_facts_are_kept(self):
+        """Test that unrelated statements stay separate."""
+        index = FactIndex()
+
+        result = index.dedupe(
+            [
+                "Regulators are drafting guidance on safety.",
+                "Leading vendors report double-digit revenue growth.",
+                "regulators are drafting guidance on safety",
+            ]
+        )
+
+        assert result == [
+            "Regulators are drafting guidance on safety.",
+            "Leading vendors report double-digit revenue growth.",
+        ]
+
+    def test_facts_for_similar_topics(self):
+        """Test that facts are found again through a similar topic only."""
+        index = FactIndex()
+        index.dedupe(["Costs are falling.", "Pilots show gains."], topic="AI adoption in retail")
+
+        assert index.facts_for("AI adoption in retail!") == [
+            "Costs are falling.",
+            "Pilots show gains.",
+        ]
+        assert index.facts_for("Quantum computing hardware") == []
+
+    def test_areas_are_scored_on_their_own(self):
+        """Test that a long shared question does not make different areas match."""
+        index = FactIndex()
+        question = "How is AI adoption in mid-sized European retail companies evolving?"
+        index.dedupe(["Costs are falling."], question, "Market adoption", source="run-1")
+
+        assert index.facts_for(question, "Market adoption") == ["Costs are falling."]
+        assert index.facts_for(question, "Regulation") == []
+        assert index.facts_for(question, "Market adoption", exclude_source="run-1") == []
+
+    def test_topic_signatures_are_computed_once(self):
+        """Test that facts added under a known topic do not hash the topic again."""
+        index = FactIndex()
+        facts = ["Costs are falling.", "Pilots show gains.", "Vendors consolidate."]
+
+        with patch.object(index, "signature", wraps=index.signature) as signature:
+            index.dedupe(facts, "AI adoption", "Market")
+
+        # One signature per fact, plus the topic and the area once
+        assert signature.call_count == len(facts) + 2
+
+
+class TestResearchReuse:
+    """Test cases for sharing a fact index between research runs."""
+
+    def test_overlapping_question_reuses_collected_facts(self):
+        """Test that a repeated question skips the collection LLM calls."""
+        registry = LLMClientRegistry(backend=FakeLLMBackend())
+        index = FactIndex()
+        assistant = ResearchAssistant(
+            llm_registry=registry, instrumentation=Instrumentation(), fact_index=index
+        )
+
+        first = assistant.research("How is AI adoption evolving?")
+        second = assistant.research("How is AI adoption evolving?")
+
+        def collection_calls(result):
+            return sum(s["llm_calls"] for s in result["trace"] if s["node"] == "collect_info")
+
+        assert collection_calls(first) == 3
+        assert collection_calls(second) == 0
+        assert second["collected_info"] == first["collected_info"]
+        assert len(index) == 5
+
+    def test_each_area_of_a_run_is_collected(self):
+        """Test that areas of one run never reuse each other's facts."""
+        registry = LLMClientRegistry(backend=FakeLLMBackend())
+        assistant = ResearchAssistant(
+            llm_registry=registry,
+            instrumentation=Instrumentation(),
+            fact_index=FactIndex(),
+            max_collection_concurrency=1,
+        )
+
+        result = assistant.research(
+            "How is the adoption of artificial intelligence in mid-sized European retail "
+            "and logistics companies evolving over the next five years, and what drives it?"
+        )
+
+        spans = [span for span in result["trace"] if span["node"] == "collect_info"]
+        assert [span["llm_calls"] for span in spans] == [1, 1, 1]
+
+    def test_structural_lines_are_not_facts(self):
+        """Test that headings, labels and bare markers are dropped from responses."""
+        assistant = ResearchAssistant(llm_registry=LLMClientRegistry(backend=FakeLLMBackend()))
+
+        points = assistant._split_info("## Findings\nKey facts:\n- \n- Costs are falling.\n---")
+
+        assert points == ["- Costs are falling."]
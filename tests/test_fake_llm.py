@@ -0,0 +1,131 @@
+"""Tests for the offline fake LLM backend and the benchmark suite."""
+
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from src.ai_research_assistant import (
+    FakeChatModel,
+    FakeLLMBackend,
+    LLMClientRegistry,
+    ResearchAssistant,
+    VirtualCompanySimulator,
+)
+from src.ai_research_assistant.benchmark import (
+    benchmark_board_meetings,
+    benchmark_research,
+    measure_cold_start,
+    percentile,
+    sample_meeting_request,
+)
+
+
+def _executive_messages(role: str) -> list:
+    return [
+        SystemMessage(content=f"You are the {role} of a company."),
+        HumanMessage(content="Should we adopt the proposal?"),
+    ]
+
+
+class TestFakeChatModel:
+    """Test cases for FakeChatModel."""
+
+    def test_responses_are_deterministic(self):
+        """Test that the same prompt and seed always produce the same response."""
+        first = FakeChatModel().invoke(_executive_messages("CFO"))
+        second = FakeChatModel().invoke(_executive_messages("CFO"))
+        other_seed = [FakeChatModel(seed=s).invoke(_executive_messages("CFO")) for s in range(8)]
+
+        assert first.content == second.content
+        assert len({m.content for m in other_seed}) > 1
+        assert first.usage_metadata["total_tokens"] > 0
+
+    def test_executive_opinion_is_parseable(self):
+        """Test that executive prompts get an opinion with a fixed vote."""
+        model = FakeChatModel(votes={"CTO": "reject"})
+
+        content = str(model.invoke(_executive_messages("CTO")).content)
+
+        assert "Vote: reject" in content
+        assert "Priority:" in content
+
+    def test_stream_matches_invoke(self):
+        """Test that streamed chunks reassemble into the invoked response."""
+        model = FakeChatModel()
+        messages = [HumanMessage(content="You are a report writer.")]
+
+        chunks = [str(chunk.content) for chunk in model.stream(messages)]
+
+        assert len(chunks) > 1
+        assert "".join(chunks) == model.invoke(messages).content
+
+
+class TestOfflineWorkflows:
+    """Test cases for running the workflows with FakeLLMBackend."""
+
+    def test_board_meeting_runs_without_api_key(self, monkeypatch):
+        """Test a full board meeting with the fake backend and no API key."""
+        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+        registry = LLMClientRegistry(backend=FakeLLMBackend(votes={"CEO": "approve"}))
+        simulator = VirtualCompanySimulator(llm_registry=registry)
+
+        result = simulator.simulate_board_meeting(**sample_meeting_request())
+
+        assert result["error_message"] is None
+        assert result["opinions"]["CEO"]["vote"] == "approve"
+        assert result["opinions"]["CEO"]["parse_quality"] == "structured"
+        assert result["final_decision"] in {"APPROVED", "REJECTED"}
+
+    def test_research_runs_without_api_key(self, monkeypatch):
+        """Test a full research run with the fake backend and no API key."""
+        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+        registry = LLMClientRegistry(backend=FakeLLMBackend())
+        assistant = ResearchAssistant(llm_registry=registry)
+
+        result = assistant.research("How is AI adoption evolving?")
+
+        assert result["error_message"] is None
+        assert result["research_plan"].startswith("1. Market adoption")
+        assert len(result["collected_info"]) == 5  # Three areas, duplicate points merged
+        assert "Executive Summary" in result["final_report"]
+
+
+class TestBenchmark:
+    """Test cases for the benchmark suite."""
+
+    def test_percentile(self):
+        """Test nearest-rank percentiles."""
+        values = [float(v) for v in range(1, 101)]
+
+        assert percentile(values, 50) == 50.0
+        assert percentile(values, 99) == 99.0
+        assert percentile([], 50) == 0.0
+
+    def test_board_meeting_benchmark_modes(self):
+        """Test that each mode reports throughput and per-node timings."""
+        for mode in ("sequential", "concurrent", "batched"):
+            report = benchmark_board_meetings(mode, runs=3, concurrency=2)
+
+            assert len(report.latencies) == 3
+            assert report.runs_per_second > 0
+            assert "collect_cfo_opinion" in report.node_means
+            assert "throughput" in report.format()
+
+    def test_research_benchmark(self):
+        """Test the research benchmark collects timings for every node."""
+        report = benchmark_research("concurrent", runs=2, concurrency=2)
+
+        assert set(report.node_means) == {
+            "plan_research",
+            "collect_info",
+            "merge_info",
+            "digest_info",
+            "analyze_info",
+            "generate_report",
+        }
+
+    def test_cold_start_measurement(self):
+        """Test that startup is measured in a fresh interpreter."""
+        report = measure_cold_start("research")
+
+        assert report.import_seconds > 0
+        assert report.first_run_seconds > 0
+        assert "cold start" in report.format()
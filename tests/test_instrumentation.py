@@ -0,0 +1,131 @@
+"""Tests for per-node workflow instrumentation."""
+
+import asyncio
+
+from src.ai_research_assistant import (
+    FakeLLMBackend,
+    Instrumentation,
+    LLMClientRegistry,
+    LLMResponseCache,
+    ResearchAssistant,
+    VirtualCompanySimulator,
+)
+from src.ai_research_assistant.benchmark import sample_meeting_request
+from src.ai_research_assistant.instrumentation import Histogram, to_otel_spans
+
+
+def _simulator(
+    instrumentation: Instrumentation | None, **registry_options
+) -> VirtualCompanySimulator:
+    registry = LLMClientRegistry(backend=FakeLLMBackend(), **registry_options)
+    return VirtualCompanySimulator(llm_registry=registry, instrumentation=instrumentation)
+
+
+class TestRunTrace:
+    """Test cases for the per-run trace on the returned state."""
+
+    def test_board_meeting_trace_covers_every_node(self):
+        """Test that each node gets a span with LLM calls and token counts."""
+        result = _simulator(Instrumentation()).simulate_board_meeting(**sample_meeting_request())
+
+        spans = {span["node"]: span for span in result["trace"]}
+        assert set(spans) == {
+            "present_decision",
+            "collect_ceo_opinion",
+            "collect_cto_opinion",
+            "collect_cmo_opinion",
+            "collect_cfo_opinion",
+            "facilitate_discussion",
+            "vote_and_decide",
+            "create_implementation_plan",
+        }
+        cfo = spans["collect_cfo_opinion"]
+        assert cfo["llm_calls"] == 1
+        assert cfo["prompt_tokens"] > 0 and cfo["completion_tokens"] > 0
+        assert cfo["wall_seconds"] >= cfo["llm_seconds"] > 0
+        assert spans["vote_and_decide"]["llm_calls"] == 0
+        assert all(span["error"] is None for span in spans.values())
+
+    def test_cache_hits_are_counted_instead_of_tokens(self):
+        """Test that cached responses count as hits and add no API tokens."""
+        simulator = _simulator(Instrumentation(), cache=LLMResponseCache())
+        simulator.simulate_board_meeting(**sample_meeting_request())
+
+        result = simulator.simulate_board_meeting(**sample_meeting_request())
+
+        cfo = next(s for s in result["trace"] if s["node"] == "collect_cfo_opinion")
+        assert cfo["cache_hits"] == 1
+        assert cfo["prompt_tokens"] == 0
+
+    def test_async_research_trace(self):
+        """Test that async research runs are traced as well."""
+        registry = LLMClientRegistry(backend=FakeLLMBackend())
+        assistant = ResearchAssistant(llm_registry=registry, instrumentation=Instrumentation())
+
+        result = asyncio.run(assistant.aresearch("question"))
+
+        assert [span["node"] for span in result["trace"]] == [
+            "plan_research",
+            "collect_info",
+            "collect_info",
+            "collect_info",
+            "merge_info",
+            "digest_info",
+            "analyze_info",
+            "generate_report",
+        ]
+
+    def test_disabled_instrumentation_adds_no_trace(self):
+        """Test that runs without instrumentation return no trace."""
+        result = _simulator(None).simulate_board_meeting(**sample_meeting_request())
+
+        assert "trace" not in result
+
+
+class TestExport:
+    """Test cases for aggregated metrics and span export."""
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Test that observations count towards every bucket they fit in."""
+        histogram = Histogram([0.1, 1.0])
+
+        for value in (0.05, 0.5, 5.0):
+            histogram.observe(value)
+
+        assert histogram.bucket_counts == [1, 2]
+        assert histogram.count == 3
+        assert histogram.mean == 5.55 / 3
+
+    def test_prometheus_export(self):
+        """Test the Prometheus text format of aggregated runs."""
+        instrumentation = Instrumentation()
+        simulator = _simulator(instrumentation)
+        for _ in range(2):
+            simulator.simulate_board_meeting(**sample_meeting_request())
+
+        text = instrumentation.to_prometheus()
+
+        assert "# TYPE workflow_node_duration_seconds histogram" in text
+        assert (
+            'workflow_node_duration_seconds_count{workflow="board_meeting",'
+            'node="collect_cfo_opinion"} 2' in text
+        )
+        assert 'workflow_runs_total{workflow="board_meeting"} 2' in text
+        assert (
+            'workflow_node_tokens_total{workflow="board_meeting",node="collect_cfo_opinion",kind="prompt"}'
+            in text
+        )
+        assert set(instrumentation.node_means("board_meeting")) >= {"vote_and_decide"}
+
+    def test_otel_spans(self):
+        """Test that spans share a trace id and hang off a root run span."""
+        result = _simulator(Instrumentation()).simulate_board_meeting(**sample_meeting_request())
+
+        spans = to_otel_spans("board_meeting", result["trace"])
+
+        root, *children = spans
+        assert len(children) == len(result["trace"])
+        assert {span["traceId"] for span in spans} == {root["traceId"]}
+        assert all(child["parentSpanId"] == root["spanId"] for child in children)
+        assert all(child["endTimeUnixNano"] >= child["startTimeUnixNano"] for child in children)
+        assert children[1]["attributes"]["gen_ai.usage.input_tokens"] > 0
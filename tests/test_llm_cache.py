@@ -0,0 +1,91 @@
+"""Tests for the LLM response cache."""
+
+import asyncio
+from unittest.mock import patch
+
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from src.ai_research_assistant import (
+    InMemoryLRUBackend,
+    LLMClientRegistry,
+    LLMResponseCache,
+    SQLiteBackend,
+)
+
+MESSAGES = [SystemMessage(content="You are a CFO."), HumanMessage(content="Approve the budget?")]
+
+
+class TestLLMResponseCache:
+    """Test cases for LLMResponseCache."""
+
+    def test_repeated_prompt_is_served_from_cache(self):
+        """Test that an identical request does not reach the model twice."""
+        cache = LLMResponseCache()
+        llm = FakeListChatModel(responses=["first", "second"], cache=cache)
+
+        assert llm.invoke(MESSAGES).content == "first"
+        assert llm.invoke(MESSAGES).content == "first"
+        assert llm.invoke([HumanMessage(content="Something else")]).content == "second"
+        assert cache.stats() == {"hits": 1, "misses": 2, "hit_rate": 1 / 3, "entries": 2}
+
+    def test_async_lookup(self):
+        """Test that async invocations share the same cache entries."""
+        cache = LLMResponseCache()
+        llm = FakeListChatModel(responses=["first", "second"], cache=cache)
+
+        llm.invoke(MESSAGES)
+        assert asyncio.run(llm.ainvoke(MESSAGES)).content == "first"
+        assert cache.hits == 1
+
+    def test_ttl_expiry(self):
+        """Test that stale entries are treated as misses and evicted."""
+        cache = LLMResponseCache(ttl_seconds=10)
+        llm = FakeListChatModel(responses=["first", "second"], cache=cache)
+
+        with patch("src.ai_research_assistant.llm_cache.time.time", return_value=1000.0):
+            llm.invoke(MESSAGES)
+        with patch("src.ai_research_assistant.llm_cache.time.time", return_value=1011.0):
+            assert llm.invoke(MESSAGES).content == "second"
+        assert cache.hits == 0
+
+    def test_in_memory_lru_eviction(self):
+        """Test that the least recently used entry is evicted first."""
+        backend = InMemoryLRUBackend(max_entries=2)
+        backend.set("a", "1", 0.0)
+        backend.set("b", "2", 0.0)
+        backend.get("a")
+        backend.set("c", "3", 0.0)
+
+        assert backend.get("b") is None
+        assert backend.get("a") == ("1", 0.0)
+        assert len(backend) == 2
+
+    def test_sqlite_backend_persists_across_instances(self, tmp_path):
+        """Test that the SQLite backend survives reopening the database."""
+        path = tmp_path / "cache.db"
+        responses = ["stored", "fresh"]
+        first = LLMResponseCache(SQLiteBackend(path))
+        FakeListChatModel(responses=responses, cache=first).invoke(MESSAGES)
+
+        second = LLMResponseCache(SQLiteBackend(path))
+        llm = FakeListChatModel(responses=responses, cache=second)
+        assert llm.invoke(MESSAGES).content == "stored"
+        assert second.hits == 1
+        assert llm.i == 0  # the model itself was never called
+
+    def test_sqlite_backend_eviction(self, tmp_path):
+        """Test that the SQLite backend keeps at most max_entries."""
+        backend = SQLiteBackend(tmp_path / "cache.db", max_entries=2)
+        for key in ["a", "b", "c"]:
+            backend.set(key, key, 0.0)
+
+        assert len(backend) == 2
+        assert backend.get("a") is None
+
+    def test_registry_attaches_cache(self):
+        """Test that models from the registry use the configured cache."""
+        cache = LLMResponseCache()
+        registry = LLMClientRegistry(cache=cache)
+
+        assert registry.get_chat_model("test-key").cache is cache
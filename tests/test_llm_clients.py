@@ -0,0 +1,117 @@
+"""Tests for the shared LLM client registry."""
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.ai_research_assistant import ResearchAssistant, VirtualCompanySimulator
+from src.ai_research_assistant.benchmark import sample_meeting_request
+from src.ai_research_assistant.llm_clients import LLMClientRegistry, get_default_registry
+
+
+class TestLLMClientRegistry:
+    """Test cases for LLMClientRegistry."""
+
+    def test_models_are_cached_by_configuration(self):
+        """Test that identical configurations share one chat model."""
+        registry = LLMClientRegistry()
+        first = registry.get_chat_model("test-key", temperature=0.7)
+
+        assert registry.get_chat_model("test-key", temperature=0.7) is first
+        assert registry.get_chat_model("test-key", temperature=0.3) is not first
+        assert registry.get_chat_model("other-key", temperature=0.7) is not first
+
+    def test_models_share_pooled_transport(self):
+        """Test that all models use the registry's HTTP clients."""
+        registry = LLMClientRegistry(max_connections=7)
+        fast = registry.get_chat_model("test-key", temperature=0.1)
+        slow = registry.get_chat_model("test-key", model="gpt-4o", temperature=0.1)
+
+        assert fast.http_client is slow.http_client
+        assert fast.http_async_client is slow.http_async_client
+        assert registry.limits.max_connections == 7
+
+    def test_simulators_share_default_registry(self):
+        """Test that executives, facilitator and assistant reuse cached clients."""
+        first = VirtualCompanySimulator(openai_api_key="test-key")
+        second = VirtualCompanySimulator(openai_api_key="test-key")
+        assistant = ResearchAssistant(openai_api_key="test-key")
+
+        assert first.llm_registry is get_default_registry()
+        assert first.ceo.llm is second.ceo.llm
+        assert first.ceo.llm is first.cfo.llm
+        assert first.facilitator is second.facilitator
+        assert assistant.llm.http_client is first.facilitator.http_client
+
+    def test_close_resets_cached_models(self):
+        """Test that closing the registry forgets cached models."""
+        registry = LLMClientRegistry()
+        model = registry.get_chat_model("test-key")
+        registry.close()
+
+        assert registry.get_chat_model("test-key") is not model
+
+
+class _CompletionHandler(BaseHTTPRequestHandler):
+    """OpenAI-compatible chat completions endpoint keeping connections alive."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        content = '{"opinion": "Go.", "reasoning": "Fine.", "vote": "approve", "priority_score": 7}'
+        body = json.dumps(
+            {
+                "id": "chatcmpl-test",
+                "object": "chat.completion",
+                "created": 0,
+                "model": "gpt-4o-mini",
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": content},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+            }
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def completion_server(monkeypatch):
+    """Serve chat completions locally and point the OpenAI client at them."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _CompletionHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setenv("OPENAI_API_BASE", f"http://127.0.0.1:{server.server_port}/v1")
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class TestAsyncTransport:
+    """Test cases for the pooled async transport across event loops."""
+
+    def test_meetings_in_successive_event_loops(self, completion_server):
+        """Test that pooled connections of a closed loop are not reused by the next one."""
+        simulator = VirtualCompanySimulator(
+            openai_api_key="test-key", llm_registry=LLMClientRegistry()
+        )
+
+        for _ in range(2):
+            result = asyncio.run(simulator.asimulate_board_meeting(**sample_meeting_request()))
+
+            assert result["error_message"] is None
+            assert result["final_decision"] == "APPROVED"
@@ -0,0 +1,93 @@
+"""Tests for screening decisions before board meetings."""
+
+import asyncio
+
+import pytest
+
+from src.ai_research_assistant import VirtualCompanySimulator, select_portfolio
+
+
+@pytest.fixture
+def candidates(meeting_request) -> list:
+    """Variations of the meeting's decision; the company's cash flow is 200,000."""
+
+    def candidate(title: str, cost: int, roi: float, risk: str = "low") -> dict:
+        return {
+            **meeting_request,
+            "decision_details": {
+                **meeting_request["decision_details"],
+                "title": title,
+                "estimated_cost": cost,
+                "expected_roi": roi,
+                "risk_level": risk,
+            },
+        }
+
+    return [
+        candidate("Too big", 500_000, 0.9),
+        candidate("Small win", 50_000, 0.3),
+        candidate("Risky bet", 100_000, 0.2, "high"),
+        candidate("Core upgrade", 150_000, 0.4),
+        candidate("Pair A", 100_000, 0.4),
+        candidate("Pair B", 100_000, 0.4),
+    ]
+
+
+class TestSelectPortfolio:
+    """Test cases for the knapsack selection."""
+
+    def test_selection_maximizes_value_within_budget(self, candidates, meeting_request):
+        """Test that the portfolio beats greedy picking by ROI and rules out hopeless decisions."""
+        selection = select_portfolio(
+            [request["decision_details"] for request in candidates],
+            meeting_request["company_metrics"],
+        )
+
+        statuses = {
+            candidate["decision"]["title"]: candidate["status"] for candidate in selection.ranked
+        }
+        # Greedy by ROI would take the core upgrade (60,000) and small win (15,000);
+        # the two 100,000 decisions together are worth 80,000.
+        assert {candidate["index"] for candidate in selection.selected} == {4, 5}
+        assert statuses["Too big"] == "unaffordable"
+        assert statuses["Risky bet"] == "unprofitable"
+        assert statuses["Core upgrade"] == statuses["Small win"] == "marginal"
+        assert selection.total_cost == 200_000
+        assert selection.total_value == 80_000
+        assert [candidate["index"] for candidate in selection.ranked] == [4, 5, 3, 1, 0, 2]
+
+    def test_budget_override(self, candidates, meeting_request):
+        """Test that an explicit budget replaces the cash flow."""
+        selection = select_portfolio(
+            [request["decision_details"] for request in candidates],
+            meeting_request["company_metrics"],
+            budget=700_000,
+        )
+
+        assert selection.ranked[-1]["status"] == "unprofitable"
+        assert {candidate["index"] for candidate in selection.selected} == {0, 4, 5}
+
+
+class TestPortfolioMeetings:
+    """Test cases for putting only the screened decisions to the board."""
+
+    def test_only_selected_decisions_reach_the_board(self, candidates, fake_registry):
+        """Test that meetings run for the portfolio and keep the candidates' indices."""
+        simulator = VirtualCompanySimulator(llm_registry=fake_registry())
+
+        results = list(simulator.simulate_portfolio_meetings(candidates))
+
+        assert sorted(result["index"] for result in results) == [4, 5]
+        for result in results:
+            assert result["request"] is candidates[result["index"]]
+            assert result["state"]["decision_details"]["title"].startswith("Pair")
+
+    def test_marginal_decisions_can_be_included(self, candidates, fake_registry):
+        """Test that marginal candidates are consulted on request."""
+        simulator = VirtualCompanySimulator(llm_registry=fake_registry())
+
+        async def run():
+            meetings = simulator.asimulate_portfolio_meetings(candidates, include_marginal=True)
+            return [result["index"] async for result in meetings]
+
+        assert sorted(asyncio.run(run())) == [1, 3, 4, 5]
@@ -0,0 +1,61 @@
+"""Tests for board meeting prompt building."""
+
+from src.ai_research_assistant import FakeLLMBackend, LLMClientRegistry, VirtualCompanySimulator
+from src.ai_research_assistant.benchmark import sample_meeting_request
+from src.ai_research_assistant.prompts import compact, prompt_tokens
+
+
+def _simulator_and_state():
+    simulator = VirtualCompanySimulator(llm_registry=LLMClientRegistry(backend=FakeLLMBackend()))
+    request = sample_meeting_request()
+    state = simulator._initial_state(
+        request["company_name"],
+        request["industry"],
+        request["company_size"],
+        request["decision_topic"],
+        request["decision_details"],
+        request.get("company_metrics"),
+    )
+    return simulator, state
+
+
+class TestPromptBuilder:
+    """Test cases for the shared-prefix prompt builder."""
+
+    def test_compact_strips_incidental_whitespace(self):
+        """Test that indentation, trailing spaces and extra blank lines are removed."""
+        text = (
+            "\n            Title: A   \n                - nested\n\n\n\n            Done\n        "
+        )
+
+        assert compact(text) == "Title: A\n    - nested\n\nDone"
+
+    def test_prefix_is_byte_identical_across_the_board(self):
+        """Test that every executive and the facilitator share the same first message."""
+        simulator, state = _simulator_and_state()
+        prompts = [
+            simulator._executive(role)._build_messages(state) for role in "ceo cto cmo cfo".split()
+        ]
+        prompts.append(
+            simulator._implementation_plan_messages({**state, "final_decision": "APPROVED"})
+        )
+
+        prefixes = {messages[0].content for messages in prompts}
+
+        assert len(prefixes) == 1
+        prefix = prefixes.pop()
+        assert "Implement AI-Powered Customer Support System" in prefix
+        assert not any(role in prefix for role in ("CEO", "CTO", "CMO", "CFO"))
+        assert all("  \n" not in str(m.content) for messages in prompts for m in messages)
+
+    def test_prompt_token_report(self):
+        """Test that token estimates are reported per executive and for the facilitator."""
+        simulator, state = _simulator_and_state()
+
+        report = simulator.prompt_token_report(state)
+
+        assert set(report) == {"ceo", "cto", "cmo", "cfo", "facilitator"}
+        assert len({counts["prefix_tokens"] for counts in report.values()}) == 1
+        cfo = report["cfo"]
+        assert cfo["total_tokens"] == cfo["prefix_tokens"] + cfo["suffix_tokens"]
+        assert cfo == prompt_tokens(simulator.cfo._build_messages(state))
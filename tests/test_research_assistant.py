@@ -1,10 +1,19 @@
 """Tests for the ResearchAssistant class."""
 
-from unittest.mock import patch
+import asyncio
+from unittest.mock import AsyncMock, patch
 
 import pytest
+from langchain_core.messages import AIMessage
 
-from src.ai_research_assistant import ResearchAssistant, ResearchState
+from src.ai_research_assistant import (
+    FakeLLMBackend,
+    Instrumentation,
+    LLMClientRegistry,
+    ResearchAssistant,
+    ResearchState,
+)
+from src.ai_research_assistant.research_assistant import chunk_points, merge_points, plan_areas
 
 
 class TestResearchAssistant:
@@ -27,12 +36,27 @@ class TestResearchAssistant:
         assistant = ResearchAssistant()
         assert assistant.api_key == "env-test-key"
 
-    @patch("src.ai_research_assistant.research_assistant.ChatOpenAI")
+    @patch("langchain_openai.ChatOpenAI")
     def test_workflow_creation(self, mock_chat_openai):
         """Test that workflow is properly created."""
         assistant = ResearchAssistant(openai_api_key="test-key")
         assert assistant.workflow is not None
 
+    @patch("langchain_openai.ChatOpenAI")
+    def test_aresearch_uses_async_llm_calls(self, mock_chat_openai):
+        """Test that the async entry point drives the workflow through ainvoke."""
+        mock_llm = mock_chat_openai.return_value
+        mock_llm.ainvoke = AsyncMock(return_value=AIMessage(content="point one\npoint two"))
+        assistant = ResearchAssistant(openai_api_key="test-key")
+
+        result = asyncio.run(assistant.aresearch("test question"))
+
+        assert mock_llm.ainvoke.await_count == 4
+        mock_llm.invoke.assert_not_called()
+        assert result["collected_info"] == ["point one", "point two"]
+        assert result["current_step"] == "complete"
+        assert result["error_message"] is None
+
     def test_research_state_structure(self):
         """Test that ResearchState has required fields."""
         state = ResearchState(
@@ -47,3 +71,91 @@ class TestResearchAssistant:
         assert state["question"] == "test question"
         assert state["collected_info"] == []
         assert state["current_step"] == "started"
+
+
+class TestParallelCollection:
+    """Test cases for the map-reduce information collection."""
+
+    PLAN = "1. Market size\n2) Competitors\n- Regulation\nApproach: desk research."
+
+    def test_plan_areas_are_numbered_and_bulleted_lines(self):
+        """Test that list items become areas and free text is ignored."""
+        assert plan_areas(self.PLAN) == ["Market size", "Competitors", "Regulation"]
+        assert plan_areas("Just read some reports.") == []
+
+    def test_merge_points_drops_duplicates(self):
+        """Test that points differing only in markers, case or spacing are merged."""
+        points = ["- Growth is strong.", "growth  is strong.", "1. Costs are falling.", "- New"]
+
+        assert merge_points(points) == ["- Growth is strong.", "1. Costs are falling.", "- New"]
+
+    @patch("langchain_openai.ChatOpenAI")
+    def test_one_bounded_collection_call_per_area(self, mock_chat_openai):
+        """Test that areas are collected in parallel up to the concurrency limit."""
+        in_flight = []
+        peak = 0
+
+        async def respond(messages, config=None):
+            nonlocal peak
+            prompt = str(messages[-1].content)
+            if "Investigation Area" not in prompt:
+                return AIMessage(content=self.PLAN)
+            in_flight.append(prompt)
+            peak = max(peak, len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(prompt)
+            area = prompt.split("Investigation Area: ")[1].splitlines()[0]
+            return AIMessage(content=f"- Shared fact\n- Fact about {area}")
+
+        mock_chat_openai.return_value.ainvoke = AsyncMock(side_effect=respond)
+        assistant = ResearchAssistant(openai_api_key="test-key", max_collection_concurrency=2)
+
+        result = asyncio.run(assistant.aresearch("test question"))
+
+        assert mock_chat_openai.return_value.ainvoke.await_count == 6
+        assert peak == 2
+        assert result["collected_info"][0] == "- Shared fact"
+        assert sorted(result["collected_info"][1:]) == [
+            "- Fact about Competitors",
+            "- Fact about Market size",
+            "- Fact about Regulation",
+        ]
+        assert result["current_step"] == "complete"
+
+
+class TestInfoDigest:
+    """Test cases for the token-budgeted summarization of collected information."""
+
+    def test_chunk_points_respects_budget(self):
+        """Test that chunks stay within budget and oversized points stand alone."""
+        points = ["a" * 40, "b" * 40, "c" * 40, "d" * 200]
+
+        assert chunk_points(points, 20) == [["a" * 40, "b" * 40], ["c" * 40], ["d" * 200]]
+        assert chunk_points([], 20) == []
+
+    def test_small_collection_is_passed_through(self):
+        """Test that information within budget reaches the analysis unchanged."""
+        registry = LLMClientRegistry(backend=FakeLLMBackend())
+        assistant = ResearchAssistant(llm_registry=registry, instrumentation=Instrumentation())
+
+        result = assistant.research("question")
+
+        assert result["info_digest"] == "\n".join(result["collected_info"])
+        digest = next(span for span in result["trace"] if span["node"] == "digest_info")
+        assert digest["llm_calls"] == 0
+
+    def test_large_collection_is_summarized_in_parallel_chunks(self):
+        """Test that collections over budget are replaced by chunk summaries."""
+        registry = LLMClientRegistry(backend=FakeLLMBackend())
+        assistant = ResearchAssistant(
+            llm_registry=registry, instrumentation=Instrumentation(), context_token_budget=50
+        )
+
+        result = asyncio.run(assistant.aresearch("question"))
+
+        assert len(result["collected_info"]) == 5
+        assert "Adoption is growing steadily" in result["info_digest"]
+        assert result["collected_info"][0] not in result["info_digest"]
+        digest = next(span for span in result["trace"] if span["node"] == "digest_info")
+        assert digest["llm_calls"] >= 2
+        assert result["current_step"] == "complete"
@@ -0,0 +1,95 @@
+"""Tests for the persistent research store."""
+
+from unittest.mock import MagicMock
+
+from src.ai_research_assistant import (
+    FakeLLMBackend,
+    Instrumentation,
+    LLMClientRegistry,
+    ResearchAssistant,
+    ResearchStore,
+)
+
+
+def _assistant(store: ResearchStore) -> ResearchAssistant:
+    registry = LLMClientRegistry(backend=FakeLLMBackend())
+    return ResearchAssistant(
+        llm_registry=registry, instrumentation=Instrumentation(), research_store=store
+    )
+
+
+class TestResearchStore:
+    """Test cases for ResearchStore."""
+
+    def test_related_questions_are_found_after_reopening(self, tmp_path):
+        """Test that runs persist on disk and are matched by question similarity."""
+        path = tmp_path / "research.db"
+        _assistant(ResearchStore(path)).research("How is AI adoption evolving?")
+
+        store = ResearchStore(path)
+        memos = store.related("How is AI adoption evolving in Europe?")
+
+        assert len(store) == 1
+        assert memos[0]["question"] == "How is AI adoption evolving?"
+        assert memos[0]["areas"][0].startswith("Market adoption")
+        assert len(memos[0]["collected_info"]) == 5
+        assert memos[0]["final_report"]
+        assert store.related("Which fish live in the deep sea?") == []
+
+    def test_findings_are_read_for_matches_only(self):
+        """Test that lookups scan signatures and load findings of the best matches only."""
+        store = ResearchStore()
+        assistant = _assistant(store)
+        for question in ["Which fish live in the deep sea?", *["How is AI adoption evolving?"] * 4]:
+            assistant.research(question)
+        statements: list[str] = []
+        store._conn.set_trace_callback(statements.append)
+
+        memos = store.related("How is AI adoption evolving in Europe?", limit=2)
+        assert store.related("How do volcanoes form?") == []
+
+        assert [memo["question"] for memo in memos] == ["How is AI adoption evolving?"] * 2
+        assert memos[0]["created_at"] >= memos[1]["created_at"]
+        reads = [statement for statement in statements if "collected_info" in statement]
+        assert len(reads) == 1 and "WHERE id IN" in reads[0]
+
+    def test_failed_runs_are_not_stored(self):
+        """Test that runs ending with an error are not saved."""
+        store = ResearchStore()
+        assistant = _assistant(store)
+        assistant.llm = MagicMock()
+        assistant.llm.invoke.side_effect = RuntimeError("service unavailable")
+
+        result = assistant.research("question")
+
+        assert result["error_message"]
+        assert len(store) == 0
+
+
+class TestIncrementalResearch:
+    """Test cases for seeding research with stored findings."""
+
+    def test_covered_areas_are_not_collected_again(self):
+        """Test that a related question reuses prior facts instead of collecting."""
+        store = ResearchStore()
+        _assistant(store).research("How is AI adoption evolving?")
+
+        result = _assistant(store).research("How is AI adoption evolving in Europe?")
+
+        nodes = [span["node"] for span in result["trace"]]
+        assert "collect_info" not in nodes
+        assert sum(span["llm_calls"] for span in result["trace"]) == 3
+        assert len(result["covered_areas"]) == 3
+        assert len(result["collected_info"]) == 5
+        assert result["current_step"] == "complete"
+        assert len(store) == 2
+
+    def test_unrelated_question_starts_from_scratch(self):
+        """Test that unrelated stored research is not used."""
+        store = ResearchStore()
+        _assistant(store).research("How is AI adoption evolving?")
+
+        result = _assistant(store).research("Which fish live in the deep sea?")
+
+        assert result["prior_findings"] == [] and result["covered_areas"] == []
+        assert [s["node"] for s in result["trace"]].count("collect_info") == 3
@@ -0,0 +1,197 @@
+"""Tests for retries, timeouts, hedging and error short-circuiting."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from src.ai_research_assistant import (
+    FakeLLMBackend,
+    Instrumentation,
+    LLMClientRegistry,
+    ResearchAssistant,
+    RetryPolicy,
+    VirtualCompanySimulator,
+)
+from src.ai_research_assistant.benchmark import sample_meeting_request
+from src.ai_research_assistant.resilience import (
+    acall_with_retry,
+    call_with_retry,
+    is_retryable,
+    retry_after,
+)
+
+FAST = RetryPolicy(initial_backoff=0.0, jitter=False)
+
+
+class RateLimitedError(Exception):
+    """Error shaped like an OpenAI rate-limit response."""
+
+    status_code = 429
+
+    def __init__(self, headers: dict[str, str] | None = None):
+        super().__init__("rate limited")
+        self.response = SimpleNamespace(headers=headers or {})
+
+
+def _failing(*errors: Exception, result: str = "ok"):
+    """Return a callable raising the given errors in turn, then returning ``result``."""
+    pending = list(errors)
+    calls = {"count": 0}
+
+    def call():
+        calls["count"] += 1
+        if pending:
+            raise pending.pop(0)
+        return result
+
+    return call, calls
+
+
+class TestRetryPolicy:
+    """Test cases for backoff and rate-limit headers."""
+
+    def test_retry_after_headers(self):
+        """Test the header forms providers use to ask for a pause."""
+        assert retry_after(RateLimitedError({"retry-after-ms": "250"})) == 0.25
+        assert retry_after(RateLimitedError({"retry-after": "3"})) == 3.0
+        assert retry_after(RateLimitedError({"x-ratelimit-reset-requests": "1m30s"})) == 90.0
+        assert retry_after(RateLimitedError()) is None
+
+    def test_backoff_grows_and_honors_retry_after(self):
+        """Test exponential growth, the cap and the server-requested floor."""
+        policy = RetryPolicy(initial_backoff=1.0, max_backoff=5.0, jitter=False)
+
+        assert [policy.backoff(n) for n in (1, 2, 3, 4)] == [1.0, 2.0, 4.0, 5.0]
+        assert policy.backoff(1, RateLimitedError({"retry-after": "7"})) == 7.0
+        assert 0 <= RetryPolicy(initial_backoff=1.0).backoff(1) <= 1.0
+
+    def test_only_transient_errors_are_retryable(self):
+        """Test the classification of errors."""
+        assert is_retryable(RateLimitedError())
+        assert is_retryable(TimeoutError())
+        assert not is_retryable(ValueError("bad request"))
+
+
+class TestCallWithRetry:
+    """Test cases for retrying, timing out and hedging calls."""
+
+    def test_transient_errors_are_retried(self):
+        """Test that a call succeeds after transient failures."""
+        call, calls = _failing(RateLimitedError(), RateLimitedError())
+
+        assert call_with_retry(call, FAST) == "ok"
+        assert calls["count"] == 3
+
+    def test_gives_up_after_max_attempts_or_permanent_error(self):
+        """Test that retries stop at the limit and skip permanent errors."""
+        call, calls = _failing(*[RateLimitedError()] * 5)
+        with pytest.raises(RateLimitedError):
+            call_with_retry(call, RetryPolicy(max_attempts=2, initial_backoff=0.0))
+        assert calls["count"] == 2
+
+        call, calls = _failing(ValueError("bad request"))
+        with pytest.raises(ValueError):
+            call_with_retry(call, FAST)
+        assert calls["count"] == 1
+
+    def test_timeout_is_retried(self):
+        """Test that a hanging attempt times out and the retry succeeds."""
+        attempts = []
+
+        def call():
+            attempts.append(time.perf_counter())
+            if len(attempts) == 1:
+                time.sleep(0.5)
+            return "ok"
+
+        policy = RetryPolicy(initial_backoff=0.0, timeout_seconds=0.05)
+
+        assert call_with_retry(call, policy) == "ok"
+        assert len(attempts) == 2
+
+    def test_hedged_request_returns_the_faster_duplicate(self):
+        """Test that a slow first request is overtaken by its hedge."""
+        delays = [0.5, 0.0]
+
+        def call():
+            delay = delays.pop(0)
+            time.sleep(delay)
+            return f"slept {delay}"
+
+        start = time.perf_counter()
+        result = call_with_retry(call, RetryPolicy(hedge_after_seconds=0.02))
+
+        assert result == "slept 0.0"
+        assert time.perf_counter() - start < 0.4
+
+    def test_async_hedge_and_timeout(self):
+        """Test hedging and timeouts of async calls."""
+        delays = [0.5, 0.0]
+
+        async def call():
+            delay = delays.pop(0) if delays else 1.0
+            await asyncio.sleep(delay)
+            return f"slept {delay}"
+
+        hedged = asyncio.run(acall_with_retry(call, RetryPolicy(hedge_after_seconds=0.02)))
+        assert hedged == "slept 0.0"
+
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(acall_with_retry(call, RetryPolicy(max_attempts=1, timeout_seconds=0.01)))
+
+
+class TestWorkflowResilience:
+    """Test cases for resilience inside the research workflow."""
+
+    @patch("langchain_openai.ChatOpenAI")
+    def test_retries_are_traced_per_node(self, mock_chat_openai):
+        """Test that a rate-limited call is retried and counted on its node."""
+        call, _ = _failing(RateLimitedError(), result=AIMessage(content="fact one"))
+        mock_chat_openai.return_value.invoke.side_effect = lambda messages: call()
+        assistant = ResearchAssistant(
+            openai_api_key="test-key", instrumentation=Instrumentation(), retry_policy=FAST
+        )
+
+        result = assistant.research("question")
+
+        assert result["error_message"] is None
+        plan = next(span for span in result["trace"] if span["node"] == "plan_research")
+        assert plan["retries"] == 1
+
+    @patch("langchain_openai.ChatOpenAI")
+    def test_error_ends_the_run(self, mock_chat_openai):
+        """Test that a failed step skips the remaining nodes and their LLM calls."""
+        mock_chat_openai.return_value.invoke.side_effect = ValueError("invalid request")
+        assistant = ResearchAssistant(openai_api_key="test-key", instrumentation=Instrumentation())
+
+        result = assistant.research("question")
+
+        assert "invalid request" in result["error_message"]
+        assert result["current_step"] == "error"
+        assert [span["node"] for span in result["trace"]] == ["plan_research"]
+        assert mock_chat_openai.return_value.invoke.call_count == 1
+
+    def test_failed_opinion_ends_the_meeting(self):
+        """Test that executives retry transient errors and a failure skips the plan."""
+        registry = LLMClientRegistry(backend=FakeLLMBackend(votes={"CFO": "approve"}))
+        simulator = VirtualCompanySimulator(llm_registry=registry, retry_policy=FAST)
+        cfo_call, cfo_calls = _failing(
+            RateLimitedError(), result=AIMessage(content="Vote: approve")
+        )
+        simulator.cfo.llm = MagicMock()
+        simulator.cfo.llm.invoke.side_effect = lambda *args, **kwargs: cfo_call()
+        simulator.cto.llm = MagicMock()
+        simulator.cto.llm.invoke.side_effect = ValueError("invalid request")
+        simulator.facilitator = MagicMock()
+
+        result = simulator.simulate_board_meeting(**sample_meeting_request())
+
+        assert cfo_calls["count"] == 2
+        assert result["opinions"]["CFO"]["vote"] == "approve"
+        assert "CTO" in result["error_message"]
+        assert result["final_decision"] is None
+        simulator.facilitator.invoke.assert_not_called()
@@ -0,0 +1,128 @@
+"""Tests for data-driven board rosters."""
+
+import threading
+
+import pytest
+
+from src.ai_research_assistant import (
+    BoardSeat,
+    FakeLLMBackend,
+    LLMClientRegistry,
+    VirtualCompanySimulator,
+    register_seat,
+    render_minute,
+)
+from src.ai_research_assistant import roster as roster_module
+from src.ai_research_assistant.benchmark import sample_meeting_request
+from src.ai_research_assistant.roster import DEFAULT_ROSTER, get_seat, resolve_roster
+
+
+def _advisor(index: int) -> BoardSeat:
+    return BoardSeat(
+        role=f"ADVISOR_{index}",
+        persona="a domain advisor to the board",
+        focus=("Risks in your domain", "Opportunities in your domain"),
+        metric_fields=("revenue", "market_share"),
+        icon="🧭",
+    )
+
+
+@pytest.fixture
+def registered_advisor():
+    """Register an advisor seat, restoring the global seat registry afterwards."""
+    saved = dict(roster_module._seats)
+    seat = _advisor(99)
+    register_seat(seat)
+    yield seat
+    roster_module._seats.clear()
+    roster_module._seats.update(saved)
+
+
+class TestBoardSeat:
+    """Test cases for seats declared as data."""
+
+    def test_invalid_seats_are_rejected(self):
+        """Test that roles must be identifiers and metric fields must exist."""
+        with pytest.raises(ValueError, match="upper-case identifier"):
+            BoardSeat(role="Head of APAC", persona="p", focus=())
+        with pytest.raises(ValueError, match="Unknown metric fields"):
+            BoardSeat(role="APAC_HEAD", persona="p", focus=(), metric_fields=("morale",))
+
+    def test_brief_shows_only_the_seats_metrics(self):
+        """Test that a brief lists the seat's metrics and focus points."""
+        metrics = sample_meeting_request()["company_metrics"]
+
+        brief = _advisor(1).brief(metrics)
+
+        assert brief.startswith("You are the ADVISOR_1, a domain advisor to the board.")
+        assert "- Revenue: $2,500,000" in brief
+        assert "- Market Share: 8.0%" in brief
+        assert "Tech Debt" not in brief
+        assert "2. Opportunities in your domain" in brief
+
+    def test_roster_resolves_registered_roles(self, registered_advisor):
+        """Test that rosters mix registered role names and seats."""
+        assert get_seat("advisor_99") is registered_advisor
+
+        roster = resolve_roster(["cfo", "ADVISOR_99", _advisor(1)])
+
+        assert [seat.role for seat in roster] == ["CFO", "ADVISOR_99", "ADVISOR_1"]
+        assert resolve_roster(None) == DEFAULT_ROSTER
+        with pytest.raises(ValueError, match="Unknown board role"):
+            resolve_roster(["CHIEF_OF_FUN"])
+        with pytest.raises(ValueError, match="unique roles"):
+            resolve_roster(["CFO", "CFO"])
+
+
+class TestLargeBoard:
+    """Test cases for meetings of larger boards."""
+
+    def test_every_member_is_consulted_concurrently(self):
+        """Test that a 16-member board answers in one concurrent round and one tally."""
+        roster = [*DEFAULT_ROSTER, *(_advisor(i) for i in range(12))]
+        votes = {seat.role: "reject" for seat in roster[:6]}
+        registry = LLMClientRegistry(backend=FakeLLMBackend(votes=votes, approve_probability=1))
+        simulator = VirtualCompanySimulator(llm_registry=registry, roster=roster)
+        barrier = threading.Barrier(len(roster), timeout=5)
+        for executive in simulator.executives.values():
+            get_opinion = executive.get_opinion
+
+            def wait_for_everyone(state, get_opinion=get_opinion):
+                # Fails with BrokenBarrierError unless all members run at once
+                barrier.wait()
+                return get_opinion(state)
+
+            executive.get_opinion = wait_for_everyone
+
+        result = simulator.simulate_board_meeting(**sample_meeting_request())
+
+        assert result["error_message"] is None
+        assert len(result["opinions"]) == 16
+        assert result["vote_rounds"][0]["ADVISOR_11"] == "approve"
+        vote = next(m for m in result["meeting_minutes"] if m["kind"] == "vote")
+        assert vote["data"] == {"approve": 10, "reject": 6, "abstain": 0}
+        assert result["final_decision"] == "APPROVED"
+        assert simulator.advisor_3.role == "ADVISOR_3"
+        assert simulator.llm_calls_per_meeting == 17
+
+    def test_graphs_are_cached_per_roster(self):
+        """Test that boards with the same members share one compiled graph."""
+        registry = LLMClientRegistry(backend=FakeLLMBackend())
+        first = VirtualCompanySimulator(llm_registry=registry, roster=["CEO", _advisor(1)])
+        second = VirtualCompanySimulator(llm_registry=registry, roster=["CEO", _advisor(1)])
+        default = VirtualCompanySimulator(llm_registry=registry)
+
+        node = first.workflow.nodes["collect_advisor_1_opinion"]
+        assert node is second.workflow.nodes["collect_advisor_1_opinion"]
+        assert "collect_advisor_1_opinion" not in default.workflow.nodes
+        request = sample_meeting_request()
+        state = first._initial_state(
+            "Co", "Software", "startup", "Topic", request["decision_details"], None
+        )
+        assert set(first.prompt_token_report(state)) == {"ceo", "advisor_1", "facilitator"}
+
+    def test_minutes_use_the_seat_icon(self):
+        """Test that opinion minutes of registered seats render with their icon."""
+        minute = {"kind": "opinion", "speaker": "CFO", "text": "Fine", "data": {"vote": "APPROVE"}}
+
+        assert render_minute(minute).startswith("💰 OPINION - CFO")
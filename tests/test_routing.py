@@ -0,0 +1,98 @@
+"""Tests for per-node model routing and fast-tier escalation."""
+
+from src.ai_research_assistant import (
+    FakeChatModel,
+    FakeLLMBackend,
+    LLMClientRegistry,
+    ModelRoute,
+    ModelRouter,
+    ResearchAssistant,
+    VirtualCompanySimulator,
+)
+from src.ai_research_assistant.benchmark import sample_meeting_request
+
+ALL_APPROVE = {"CEO": "approve", "CTO": "approve", "CMO": "approve", "CFO": "approve"}
+
+
+def _easy_request(**decision_changes):
+    request = sample_meeting_request()
+    request["decision_details"] = {
+        **request["decision_details"],
+        "risk_level": "low",
+        "estimated_cost": 20000,
+        **decision_changes,
+    }
+    return request
+
+
+def _simulator(router: ModelRouter) -> VirtualCompanySimulator:
+    registry = LLMClientRegistry(backend=FakeLLMBackend(votes=ALL_APPROVE))
+    return VirtualCompanySimulator(llm_registry=registry, model_router=router)
+
+
+class TestModelRouter:
+    """Test cases for ModelRouter."""
+
+    def test_tier_depends_on_risk_and_cost(self):
+        """Test that only cheap, low-risk decisions start in the fast tier."""
+        router = ModelRouter(fast_routes={"default": ModelRoute("fast-model")})
+        decision = _easy_request()["decision_details"]
+
+        assert router.tier(decision) == "fast"
+        assert router.tier({**decision, "risk_level": "high"}) == "standard"
+        assert router.tier({**decision, "estimated_cost": 500000}) == "standard"
+        assert ModelRouter().tier(decision) == "standard"
+
+    def test_research_nodes_use_their_routes(self):
+        """Test that routed nodes get their own model settings."""
+        registry = LLMClientRegistry(backend=FakeLLMBackend())
+        router = ModelRouter(routes={"collect_info": ModelRoute("small-model", max_tokens=10)})
+        assistant = ResearchAssistant(llm_registry=registry, model_router=router)
+
+        result = assistant.research("question")
+
+        collector = assistant.node_llms["collect_info"]
+        assert (collector.model_name, collector.max_tokens, collector.temperature) == (
+            "small-model",
+            10,
+            0.1,
+        )
+        assert result["collected_info"] == ["- Adoption has grown steadily over the l"]
+        assert "Executive Summary" in result["final_report"]
+
+
+class TestTieredBoardMeeting:
+    """Test cases for routing easy decisions to the fast tier."""
+
+    def test_agreeing_fast_tier_is_not_escalated(self):
+        """Test that a unanimous fast-tier board decides without the regular models."""
+        simulator = _simulator(ModelRouter(fast_routes={"default": ModelRoute("fast-model")}))
+        assert simulator.cfo.fast_llm.model_name == "fast-model"
+
+        result = simulator.simulate_board_meeting(**_easy_request())
+
+        assert result["model_tier"] == "fast"
+        assert result["final_decision"] == "APPROVED"
+        assert len(result["vote_rounds"]) == 1
+
+    def test_disagreement_escalates_to_regular_models(self):
+        """Test that fast-tier disagreement re-asks every executive on its regular model."""
+        simulator = _simulator(ModelRouter(fast_routes={"default": ModelRoute("fast-model")}))
+        simulator.cfo.fast_llm = FakeChatModel(model_name="fast-model", votes={"CFO": "reject"})
+
+        result = simulator.simulate_board_meeting(**_easy_request())
+
+        assert result["model_tier"] == "escalated"
+        assert result["vote_rounds"] == [ALL_APPROVE]
+        assert "fast-tier opinions disagree" in result["meeting_minutes"][5]["text"]
+        assert result["final_decision"] == "APPROVED"
+
+    def test_hard_decision_skips_the_fast_tier(self):
+        """Test that risky or expensive decisions go straight to the regular models."""
+        simulator = _simulator(ModelRouter(fast_routes={"default": ModelRoute("fast-model")}))
+        simulator.cfo.fast_llm = FakeChatModel(votes={"CFO": "reject"})
+
+        result = simulator.simulate_board_meeting(**_easy_request(risk_level="high"))
+
+        assert result["model_tier"] == "standard"
+        assert result["opinions"]["CFO"]["vote"] == "approve"
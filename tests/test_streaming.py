@@ -0,0 +1,120 @@
+"""Tests for streaming research and board meetings."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+
+from src.ai_research_assistant import Decision, ResearchAssistant, VirtualCompanySimulator
+
+
+def _fake_llm(*responses: str) -> GenericFakeChatModel:
+    return GenericFakeChatModel(messages=iter([AIMessage(content=r) for r in responses]))
+
+
+class TestStreamResearch:
+    """Test cases for ResearchAssistant streaming."""
+
+    def test_stream_research_emits_tokens_nodes_and_final_state(self):
+        """Test that report tokens arrive before the report node completes."""
+        assistant = ResearchAssistant(openai_api_key="test-key")
+        assistant.llm = _fake_llm("plan", "fact one", "analysis", "final report text")
+
+        events = list(assistant.stream_research("question"))
+
+        nodes = [e["node"] for e in events if e["type"] == "node"]
+        assert nodes == [
+            "plan_research",
+            "collect_info",
+            "merge_info",
+            "digest_info",
+            "analyze_info",
+            "generate_report",
+        ]
+        report_tokens = [
+            e["data"] for e in events if e["type"] == "token" and e["node"] == "generate_report"
+        ]
+        assert len(report_tokens) > 1
+        assert "".join(report_tokens) == "final report text"
+        first_token = events.index(next(e for e in events if e["data"] == report_tokens[0]))
+        report_done = events.index(
+            next(e for e in events if e["type"] == "node" and e["node"] == "generate_report")
+        )
+        assert first_token < report_done
+        assert events[-1]["type"] == "final"
+        assert events[-1]["data"]["final_report"] == "final report text"
+
+    def test_astream_research(self):
+        """Test that the async iterator yields the same kinds of events."""
+        assistant = ResearchAssistant(openai_api_key="test-key")
+        assistant.llm = _fake_llm("plan", "fact one", "analysis", "final report text")
+
+        async def collect():
+            return [event async for event in assistant.astream_research("question")]
+
+        events = asyncio.run(collect())
+
+        assert {e["type"] for e in events} == {"token", "node", "final"}
+        assert events[-1]["data"]["final_report"] == "final report text"
+
+
+class TestStreamBoardMeeting:
+    """Test cases for board meeting streaming."""
+
+    def test_stream_board_meeting_streams_plan_tokens(self):
+        """Test that implementation plan tokens are streamed."""
+        simulator = VirtualCompanySimulator(openai_api_key="test-key")
+        opinion = {
+            "role": "EXEC",
+            "opinion": "Yes",
+            "reasoning": "Good ROI",
+            "vote": "approve",
+            "priority_score": 8,
+        }
+        for role in ["ceo", "cto", "cmo", "cfo"]:
+            getattr(simulator, role).get_opinion = MagicMock(return_value=opinion)
+        simulator.facilitator = _fake_llm("step one then step two")
+        decision = Decision(
+            title="Test",
+            description="Test decision",
+            category="technical",
+            impact_areas=["technology"],
+            estimated_cost=1000,
+            expected_roi=0.1,
+            timeline="1 month",
+            risk_level="low",
+        )
+
+        events = list(
+            simulator.stream_board_meeting(
+                company_name="Test Co",
+                industry="Software",
+                company_size="startup",
+                decision_topic="Test",
+                decision_details=decision,
+            )
+        )
+
+        plan_tokens = [
+            e["data"]
+            for e in events
+            if e["type"] == "token" and e["node"] == "create_implementation_plan"
+        ]
+        assert "".join(plan_tokens) == "step one then step two"
+        assert events[-1]["data"]["implementation_plan"] == "step one then step two"
+
+    def test_sampled_opinions_survive_streaming(self, fake_registry, meeting_request):
+        """Test that streaming a meeting does not merge an executive's samples."""
+        simulator = VirtualCompanySimulator(llm_registry=fake_registry(), opinion_samples=3)
+
+        async def collect():
+            meeting = simulator.astream_board_meeting(**meeting_request)
+            return [event async for event in meeting]
+
+        for events in (
+            list(simulator.stream_board_meeting(**meeting_request)),
+            asyncio.run(collect()),
+        ):
+            opinions = events[-1]["data"]["opinions"]
+            assert [opinion["samples"] for opinion in opinions.values()] == [3, 3, 3, 3]
@@ -0,0 +1,85 @@
+"""Tests for what-if sweeps reusing unaffected opinions."""
+
+import asyncio
+
+import pytest
+
+from src.ai_research_assistant import VirtualCompanySimulator
+from src.ai_research_assistant.sweep import SweepMemo, sweep_grid
+
+
+@pytest.fixture
+def simulator(fake_registry) -> VirtualCompanySimulator:
+    """Simulator whose executives always approve."""
+    return VirtualCompanySimulator(llm_registry=fake_registry(approve_probability=1))
+
+
+class TestSweepGrid:
+    """Test cases for building sweep points."""
+
+    def test_grid_combines_every_value(self):
+        """Test that a grid has one point per combination of metric and decision values."""
+        points = sweep_grid(metrics={"revenue": [1, 2, 3]}, decision={"estimated_cost": [10, 20]})
+
+        assert len(points) == 6
+        assert points[1] == {"metrics": {"revenue": 1}, "decision": {"estimated_cost": 20}}
+        with pytest.raises(ValueError, match="Unknown metric fields"):
+            sweep_grid(metrics={"morale": [1]})
+
+
+class TestSweepBoardMeetings:
+    """Test cases for reusing opinions across sweep points."""
+
+    def test_revenue_sweep_asks_unaffected_executives_once(
+        self, simulator, meeting_request, generate_calls
+    ):
+        """Test that only executives seeing revenue are asked again at every point."""
+        memo = SweepMemo()
+        points = sweep_grid(metrics={"revenue": [1_000_000 + 10_000 * i for i in range(20)]})
+
+        results = list(simulator.sweep_board_meetings(meeting_request, points, memo=memo))
+
+        assert all(result["error"] is None for result in results)
+        assert memo.computed == {
+            "collect_ceo_opinion": 20,
+            "collect_cfo_opinion": 20,
+            "collect_cto_opinion": 1,
+            "collect_cmo_opinion": 1,
+            "create_implementation_plan": 1,
+        }
+        assert memo.reused["collect_cto_opinion"] == 19
+        assert generate_calls.call_count == 20 + 20 + 1 + 1 + 1
+        result = min(results, key=lambda result: result["index"])
+        assert result["state"]["metrics"]["revenue"] == 1_000_000
+        assert result["state"]["opinions"]["CTO"]["role"] == "CTO"
+
+    def test_decision_changes_invalidate_every_opinion(self, simulator, meeting_request):
+        """Test that every member depends on the decision under discussion."""
+        memo = SweepMemo()
+        points = sweep_grid(decision={"estimated_cost": [100_000, 100_000, 200_000]})
+
+        asyncio.run(_drain(simulator.asweep_board_meetings(meeting_request, points, memo=memo)))
+
+        assert memo.computed["collect_cto_opinion"] == 2
+        assert memo.reused["collect_cto_opinion"] == 1
+
+    def test_deliberation_depends_on_the_board(self, simulator, meeting_request):
+        """Test that revised opinions also depend on the previous round's positions."""
+        state = simulator._initial_state(
+            "Test Co",
+            "Software",
+            "startup",
+            "Test",
+            meeting_request["decision_details"],
+            None,
+        )
+        first = simulator.cto.dependencies(state)
+        state["vote_rounds"] = [{"CTO": "approve"}]
+        state["opinions"] = {"CTO": {"vote": "approve"}}
+
+        assert "revenue" not in first["metrics"]
+        assert simulator.cto.dependencies(state)["vote_rounds"] == [{"CTO": "approve"}]
+
+
+async def _drain(results):
+    return [result async for result in results]
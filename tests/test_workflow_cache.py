@@ -0,0 +1,121 @@
+"""Tests for shared compiled workflows, lazy clients and lazy package imports."""
+
+import ast
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from src.ai_research_assistant import (
+    FakeLLMBackend,
+    LLMClientRegistry,
+    ResearchAssistant,
+    VirtualCompanySimulator,
+)
+from src.ai_research_assistant.benchmark import sample_meeting_request
+
+ROLES = ("CEO", "CTO", "CMO", "CFO")
+
+
+def _counting_registry(**backend_options) -> tuple[LLMClientRegistry, MagicMock]:
+    backend = MagicMock(wraps=FakeLLMBackend(**backend_options))
+    backend.requires_api_key = False
+    return LLMClientRegistry(backend=backend), backend
+
+
+class TestWorkflowCache:
+    """Test cases for compiled workflows shared between instances."""
+
+    def test_instances_share_one_compiled_graph(self):
+        """Test that new instances reuse the compiled graph with their own checkpointer."""
+        registry = LLMClientRegistry(backend=FakeLLMBackend())
+        first = VirtualCompanySimulator(llm_registry=registry)
+        second = VirtualCompanySimulator(llm_registry=registry, checkpointer="memory")
+
+        assert first.workflow is not second.workflow
+        assert first.workflow.nodes["present_decision"] is second.workflow.nodes["present_decision"]
+        assert first.workflow.checkpointer is None
+        assert second.workflow.checkpointer is second.checkpointer
+
+        first_assistant = ResearchAssistant(llm_registry=registry)
+        second_assistant = ResearchAssistant(llm_registry=registry)
+        collect_info = first_assistant.workflow.nodes["collect_info"]
+        assert collect_info is second_assistant.workflow.nodes["collect_info"]
+
+    def test_shared_graph_runs_each_instance(self):
+        """Test that nodes of a shared graph call the instance that runs it."""
+        simulators = {
+            vote: VirtualCompanySimulator(
+                llm_registry=LLMClientRegistry(
+                    backend=FakeLLMBackend(votes=dict.fromkeys(ROLES, vote))
+                )
+            )
+            for vote in ("approve", "reject")
+        }
+
+        approved = simulators["approve"].simulate_board_meeting(**sample_meeting_request())
+        rejected = simulators["reject"].simulate_board_meeting(**sample_meeting_request())
+
+        assert approved["final_decision"] == "APPROVED"
+        assert rejected["final_decision"] == "REJECTED"
+
+
+class TestLazyConstruction:
+    """Test cases for creating LLM clients on first use."""
+
+    def test_clients_are_created_on_first_use(self):
+        """Test that construction creates no chat models until a meeting needs them."""
+        registry, backend = _counting_registry(votes=dict.fromkeys(ROLES, "approve"))
+        simulator = VirtualCompanySimulator(llm_registry=registry)
+        assert backend.create_chat_model.call_count == 0
+
+        result = simulator.simulate_board_meeting(**sample_meeting_request())
+
+        assert result["error_message"] is None
+        assert backend.create_chat_model.call_count == 2  # Executives and facilitator
+
+    def test_warm_up_creates_clients_up_front(self):
+        """Test that warm_up creates every client and the bound workflow."""
+        registry, backend = _counting_registry()
+        assistant = ResearchAssistant(llm_registry=registry)
+
+        assistant.warm_up()
+
+        assert backend.create_chat_model.call_count == 1
+        assert "workflow" in vars(assistant)
+        assistant.research("question")
+        assert backend.create_chat_model.call_count == 1
+
+
+class TestLazyImports:
+    """Test cases for the package's lazy imports."""
+
+    def test_research_assistant_import_skips_simulator_and_openai(self):
+        """Test that importing ResearchAssistant loads neither the simulator nor OpenAI."""
+        script = (
+            "import sys\n"
+            "from src.ai_research_assistant import ResearchAssistant\n"
+            "print(sorted(m for m in ('src.ai_research_assistant.company_simulator',"
+            " 'langchain_openai', 'openai') if m in sys.modules))\n"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, check=True
+        ).stdout
+
+        assert output.strip() == "[]"
+
+    def test_type_checking_imports_match_the_exports(self):
+        """Test that the static imports list exactly the lazily exported names."""
+        import src.ai_research_assistant as package
+
+        tree = ast.parse(Path(package.__file__).read_text(encoding="utf-8"))
+        block = next(node for node in tree.body if isinstance(node, ast.If))
+        static = {
+            alias.name: f".{node.module}"
+            for node in block.body
+            if isinstance(node, ast.ImportFrom)
+            for alias in node.names
+        }
+
+        assert static == package._EXPORTS
+        assert package.__all__ == list(package._EXPORTS)